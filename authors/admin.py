@@ -2,4 +2,7 @@ from django.contrib import admin
 
 from authors.models import Author
 
-admin.site.register(Author)
+
+@admin.register(Author)
+class AuthorAdmin(admin.ModelAdmin):
+    search_fields = ['name']
@@ -0,0 +1,25 @@
+# Generated by Django 4.1.13 on 2026-10-19 16:51
+
+from django.db import migrations, models
+
+import utils.uuids
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authors', '0003_alter_author_id'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='author',
+            name='id',
+            field=models.UUIDField(
+                default=utils.uuids.generate_uuid,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+    ]
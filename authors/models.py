@@ -1,10 +1,12 @@
-from uuid import uuid4
-
 from django.db import models
 
+from utils.uuids import generate_uuid
+
 
 class Author(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
+    id = models.UUIDField(
+        primary_key=True, default=generate_uuid, editable=False
+    )
     name = models.CharField(max_length=100)
 
     def __str__(self):
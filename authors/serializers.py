@@ -1,9 +1,12 @@
 from rest_framework import serializers
 
 from authors.models import Author
+from utils.serializers import ModelSerializerMixin
 
 
-class AuthorSerializer(serializers.HyperlinkedModelSerializer):
+class AuthorSerializer(
+    ModelSerializerMixin, serializers.HyperlinkedModelSerializer
+):
     class Meta:
         model = Author
         fields = ['url', 'id', 'name']
@@ -5,9 +5,13 @@ from rest_framework import permissions, viewsets
 from authors.models import Author
 from authors.serializers import AuthorSerializer
 from utils.api_permissions import APIPermission
+from utils.compiled_serializers import CompiledReadMixin
+from utils.views import AtomicWritesMixin
 
 
-class AuthorViewSet(viewsets.ModelViewSet):
+class AuthorViewSet(
+    AtomicWritesMixin, CompiledReadMixin, viewsets.ModelViewSet
+):
     queryset = Author.objects.all()
     serializer_class = AuthorSerializer
     permission_classes = [APIPermission]
@@ -0,0 +1,79 @@
+"""
+Per-row cost of the `url` field on a 1000-row page.
+
+    python benchmarks/hyperlinks.py
+
+Compares DRF's `HyperlinkedIdentityField`, which reverses and builds an
+absolute URI for every object, with `utils.hyperlinks`, which reverses each
+route once per request.
+"""
+import os
+import sys
+import timeit
+from pathlib import Path
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'setup.settings.dev')
+
+import django
+
+django.setup()
+
+from rest_framework.relations import HyperlinkedIdentityField
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from books.models import Book, BookCopy
+from utils import hyperlinks
+
+ROWS = 1000
+REPEAT = 5
+
+
+def make_request():
+    return Request(APIRequestFactory().get('/api/', HTTP_HOST='localhost'))
+
+
+def page_of_urls(field_class, view_name, objects):
+    field = field_class(view_name=view_name)
+
+    def run():
+        request = make_request()
+        for obj in objects:
+            field.get_url(obj, view_name, request, None)
+
+    return run
+
+
+def main():
+    cases = [
+        ('book-detail', [Book(id=uuid4()) for _ in range(ROWS)]),
+        ('bookcopy-detail', [BookCopy(id=uuid4()) for _ in range(ROWS)]),
+    ]
+    fields = [
+        ('reverse() per row', HyperlinkedIdentityField),
+        ('cached template', hyperlinks.HyperlinkedIdentityField),
+    ]
+
+    for view_name, objects in cases:
+        print(f'{view_name}, {ROWS} rows')
+        baseline = None
+        for label, field_class in fields:
+            best = min(
+                timeit.repeat(
+                    page_of_urls(field_class, view_name, objects),
+                    number=1,
+                    repeat=REPEAT,
+                )
+            )
+            per_row = best / ROWS * 1e6
+            baseline = baseline or per_row
+            print(
+                f'  {label:<20} {per_row:8.2f} us/row'
+                f'  ({baseline / per_row:.1f}x)'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+"""
+Per-request overhead of the middleware stack for anonymous API reads.
+
+    python benchmarks/request_overhead.py [requests]
+
+Compares Django's session, CSRF, authentication and messages middleware with
+the sessionless fast path from `utils.middleware`, first through the
+middleware alone (around a view that only reads `request.user`, as DRF's
+SessionAuthentication does), then for full GET /api/categories/ requests
+served from a temporary test database.
+"""
+import os
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'setup.settings.dev')
+
+import django
+
+django.setup()
+
+from django.conf import settings
+from django.db import connection
+from django.http import HttpResponse
+from django.test import Client, RequestFactory, override_settings
+from django.test.utils import setup_test_environment, teardown_test_environment
+from django.utils.module_loading import import_string
+
+from books.models import Category
+
+REQUESTS = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+REPEAT = 5
+URL = '/api/categories/'
+
+DJANGO_MIDDLEWARE = {
+    'utils.middleware.SessionMiddleware': (
+        'django.contrib.sessions.middleware.SessionMiddleware'
+    ),
+    'utils.middleware.CsrfViewMiddleware': (
+        'django.middleware.csrf.CsrfViewMiddleware'
+    ),
+    'utils.middleware.AuthenticationMiddleware': (
+        'django.contrib.auth.middleware.AuthenticationMiddleware'
+    ),
+    'utils.middleware.MessageMiddleware': (
+        'django.contrib.messages.middleware.MessageMiddleware'
+    ),
+}
+
+
+def view(request):
+    user = getattr(request, 'user', None)
+    user is not None and user.is_active
+    return HttpResponse(b'{}', content_type='application/json')
+
+
+def middleware_only(middleware):
+    instances = [import_string(path)(view) for path in middleware]
+    handler = view
+    for instance in reversed(instances):
+        instance.get_response = handler
+        handler = instance
+    process_view = [
+        instance.process_view
+        for instance in instances
+        if hasattr(instance, 'process_view')
+    ]
+    factory = RequestFactory()
+
+    def run():
+        for _ in range(REQUESTS):
+            request = factory.get(URL)
+            for hook in process_view:
+                hook(request, view, (), {})
+            handler(request)
+
+    run()
+    return min(timeit.repeat(run, number=1, repeat=REPEAT)) / REQUESTS
+
+
+def full_request(middleware):
+    # Unthrottled, or the bucket of the test client runs dry.
+    rest_framework = {
+        **settings.REST_FRAMEWORK,
+        'DEFAULT_THROTTLE_RATES': {'anon': None, 'user': None},
+    }
+    with override_settings(
+        MIDDLEWARE=middleware, REST_FRAMEWORK=rest_framework
+    ):
+        client = Client(HTTP_ACCEPT='application/json')
+
+        def run():
+            for _ in range(REQUESTS):
+                client.get(URL)
+
+        run()
+        return min(timeit.repeat(run, number=1, repeat=REPEAT)) / REQUESTS
+
+
+def report(title, measure, cases):
+    print(title)
+    baseline = None
+    for label, middleware in cases:
+        seconds = measure(middleware)
+        baseline = baseline or seconds
+        print(
+            f'  {label:<22} {seconds * 1e6:8.1f} us/request'
+            f'  ({baseline / seconds:.2f}x)'
+        )
+
+
+def main():
+    cases = [
+        (
+            'django middleware',
+            [
+                DJANGO_MIDDLEWARE.get(path, path)
+                for path in settings.MIDDLEWARE
+            ],
+        ),
+        ('sessionless fast path', settings.MIDDLEWARE),
+    ]
+    setup_test_environment()
+    report(f'Middleware only, {REQUESTS} requests', middleware_only, cases)
+
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        Category.objects.bulk_create(
+            Category(name=f'Category {n}') for n in range(10)
+        )
+        report(f'GET {URL}, {REQUESTS} requests', full_request, cases)
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+if __name__ == '__main__':
+    main()
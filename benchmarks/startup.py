@@ -0,0 +1,112 @@
+"""
+Cold-start time of a worker: importing `setup.wsgi` with the production
+settings and loading the URLconf, as the first request would.
+
+    python benchmarks/startup.py [--runs N] [--top N] [--budget-ms MS]
+                                 [--forbid MODULE ...]
+
+Each run is a fresh `python -X importtime` process. Reports the median wall
+time and the modules with the largest cumulative import time in the median
+run. Exits with status 1 when the median exceeds `--budget-ms` or a module
+given with `--forbid` (or one of its submodules) is imported, so CI catches
+regressions.
+
+SECRET_KEY defaults to a dummy value; other settings come from the
+environment as usual.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+STARTUP = (
+    'import setup.wsgi\n'
+    'from django.urls import get_resolver\n'
+    'get_resolver().url_patterns\n'
+)
+
+
+def parse_importtime(stderr):
+    """
+    Return {module: cumulative microseconds} from `-X importtime` output.
+    """
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line[len('import time:') :].split('|')
+        try:
+            modules[name.strip()] = int(cumulative)
+        except ValueError:
+            # The header line.
+            continue
+    return modules
+
+
+def run_once():
+    env = {
+        **os.environ,
+        'DJANGO_SETTINGS_MODULE': 'setup.settings.prod',
+    }
+    env.setdefault('SECRET_KEY', 'startup-benchmark')
+
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', STARTUP],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    elapsed = time.perf_counter() - start
+
+    if result.returncode:
+        sys.exit(result.stderr)
+    return elapsed, parse_importtime(result.stderr)
+
+
+def is_forbidden(module, forbidden):
+    return any(
+        module == name or module.startswith(f'{name}.') for name in forbidden
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--runs', type=int, default=7)
+    parser.add_argument('--top', type=int, default=15)
+    parser.add_argument('--budget-ms', type=float)
+    parser.add_argument('--forbid', action='append', default=[])
+    args = parser.parse_args()
+
+    # The first run warms the bytecode cache.
+    run_once()
+    runs = sorted((run_once() for _ in range(args.runs)), key=lambda r: r[0])
+    median_ms = statistics.median(run[0] for run in runs) * 1000
+    modules = runs[len(runs) // 2][1]
+
+    print(f'startup: {median_ms:.1f} ms (median of {args.runs} runs)')
+    print(f'{len(modules)} modules imported, slowest (cumulative):')
+    slowest = sorted(modules.items(), key=lambda item: -item[1])
+    for name, cumulative in slowest[: args.top]:
+        print(f'{cumulative / 1000:>10.1f} ms  {name}')
+
+    failed = False
+    forbidden = sorted(m for m in modules if is_forbidden(m, args.forbid))
+    if forbidden:
+        print('imported at startup but forbidden:', ', '.join(forbidden))
+        failed = True
+    if args.budget_ms is not None and median_ms > args.budget_ms:
+        print(f'over the budget of {args.budget_ms:.0f} ms')
+        failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""
+Insert throughput and primary key index size with random (v4) and
+time-ordered (v7) UUID keys.
+
+    python benchmarks/uuid_inserts.py [rows]
+
+Always runs against a temporary SQLite database. Set BENCHMARK_POSTGRES_DSN
+(e.g. "dbname=postgres user=user password=password host=localhost
+port=5436") to also run against PostgreSQL.
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.uuids import uuid7
+
+ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+BATCH = 1000
+GENERATORS = [('uuid4', uuid4), ('uuid7', uuid7)]
+
+
+def batches(generator):
+    for start in range(0, ROWS, BATCH):
+        yield [
+            (generator().hex, f'copy {start + offset}')
+            for offset in range(BATCH)
+        ]
+
+
+def bench_sqlite(generator):
+    with tempfile.TemporaryDirectory() as directory:
+        connection = sqlite3.connect(Path(directory) / 'bench.sqlite3')
+        # Same layout Django uses for a UUIDField primary key on SQLite.
+        connection.execute(
+            'CREATE TABLE copy (id char(32) NOT NULL PRIMARY KEY, '
+            'payload varchar(100) NOT NULL)'
+        )
+        started = time.perf_counter()
+        for rows in batches(generator):
+            connection.executemany('INSERT INTO copy VALUES (?, ?)', rows)
+            connection.commit()
+        elapsed = time.perf_counter() - started
+
+        try:
+            (index_size,) = connection.execute(
+                'SELECT SUM(pgsize) FROM dbstat '
+                "WHERE name = 'sqlite_autoindex_copy_1'"
+            ).fetchone()
+        except sqlite3.OperationalError:  # built without dbstat
+            index_size = None
+        connection.close()
+
+    return elapsed, index_size
+
+
+def bench_postgres(generator, dsn):
+    import psycopg2
+    from psycopg2.extras import execute_values
+
+    connection = psycopg2.connect(dsn)
+    with connection, connection.cursor() as cursor:
+        cursor.execute('DROP TABLE IF EXISTS uuid_bench_copy')
+        cursor.execute(
+            'CREATE TABLE uuid_bench_copy (id uuid PRIMARY KEY, '
+            'payload varchar(100) NOT NULL)'
+        )
+
+    started = time.perf_counter()
+    for rows in batches(generator):
+        with connection, connection.cursor() as cursor:
+            execute_values(
+                cursor, 'INSERT INTO uuid_bench_copy VALUES %s', rows
+            )
+    elapsed = time.perf_counter() - started
+
+    with connection, connection.cursor() as cursor:
+        cursor.execute("SELECT pg_relation_size('uuid_bench_copy_pkey')")
+        (index_size,) = cursor.fetchone()
+        cursor.execute('DROP TABLE uuid_bench_copy')
+    connection.close()
+
+    return elapsed, index_size
+
+
+def report(backend, run):
+    print(f'{backend}, {ROWS} rows in batches of {BATCH}')
+    for label, generator in GENERATORS:
+        elapsed, index_size = run(generator)
+        size = f'{index_size / 2**20:8.1f} MiB' if index_size else '       n/a'
+        print(f'  {label}  {ROWS / elapsed:10.0f} rows/s' f'  pk index {size}')
+
+
+def main():
+    report('sqlite', bench_sqlite)
+
+    dsn = os.environ.get('BENCHMARK_POSTGRES_DSN')
+    if dsn:
+        report('postgres', lambda generator: bench_postgres(generator, dsn))
+
+
+if __name__ == '__main__':
+    main()
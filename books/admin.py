@@ -1,8 +1,60 @@
+from uuid import UUID
+
 from django.contrib import admin
+from django.db.models import Q
 
 from books.models import Book, BookCopy, Category, Publisher
+from utils.pagination import EstimatedCountPaginator
+
+
+def parse_uuid(value):
+    try:
+        return UUID(value.strip())
+    except ValueError:
+        return None
+
+
+@admin.register(Category)
+class CategoryAdmin(admin.ModelAdmin):
+    search_fields = ['name']
+
+
+@admin.register(Publisher)
+class PublisherAdmin(admin.ModelAdmin):
+    search_fields = ['name']
+
+
+@admin.register(Book)
+class BookAdmin(admin.ModelAdmin):
+    list_display = ['title', 'category', 'id']
+    list_select_related = ['category']
+    autocomplete_fields = ['authors', 'category']
+    search_fields = ['title__startswith']
+    search_help_text = 'Title prefix (case-sensitive) or id.'
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_search_results(self, request, queryset, search_term):
+        pk = parse_uuid(search_term)
+        if pk is not None:
+            return queryset.filter(pk=pk), False
+        return super().get_search_results(request, queryset, search_term)
+
+
+@admin.register(BookCopy)
+class BookCopyAdmin(admin.ModelAdmin):
+    list_display = ['id', 'book', 'publisher', 'date_published']
+    list_select_related = ['book', 'publisher']
+    autocomplete_fields = ['book', 'publisher']
+    search_fields = ['book__title__startswith']
+    search_help_text = (
+        'Book title prefix (case-sensitive), copy id or book id.'
+    )
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
-admin.site.register(Book)
-admin.site.register(Category)
-admin.site.register(Publisher)
-admin.site.register(BookCopy)
+    def get_search_results(self, request, queryset, search_term):
+        pk = parse_uuid(search_term)
+        if pk is not None:
+            return queryset.filter(Q(pk=pk) | Q(book_id=pk)), False
+        return super().get_search_results(request, queryset, search_term)
@@ -0,0 +1,37 @@
+from django import forms
+from django_filters import rest_framework as filters
+
+from books.models import BookCopy
+
+
+class UUIDInFilter(filters.BaseInFilter, filters.UUIDFilter):
+    pass
+
+
+class IntegerInFilter(filters.BaseInFilter, filters.NumberFilter):
+    field_class = forms.IntegerField
+
+
+class BookCopyFilter(filters.FilterSet):
+    """
+    Filters book copies by book, publisher, the book's category and a range
+    of publication dates.
+
+    `book__in` and `publisher__in` take comma separated ids, which are
+    compared with the foreign key columns as they are rather than loaded to
+    be validated. No filter crosses a many-to-many relation, so none of
+    them duplicates rows or needs DISTINCT.
+    """
+
+    book__in = UUIDInFilter(field_name='book', lookup_expr='in')
+    publisher__in = IntegerInFilter(field_name='publisher', lookup_expr='in')
+
+    class Meta:
+        model = BookCopy
+        fields = {
+            'id': ['exact'],
+            'book': ['exact'],
+            'book__category': ['exact'],
+            'date_published': ['exact', 'gte', 'lte'],
+            'publisher': ['exact'],
+        }
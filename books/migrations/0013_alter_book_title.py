@@ -0,0 +1,18 @@
+# Generated by Django 4.1.13 on 2026-10-19 16:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('books', '0012_remove_book_cover_bookcopy_cover'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='book',
+            name='title',
+            field=models.CharField(db_index=True, max_length=100),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.1.13 on 2026-10-19 16:51
+
+from django.db import migrations, models
+
+import utils.uuids
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('books', '0013_alter_book_title'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='book',
+            name='id',
+            field=models.UUIDField(
+                default=utils.uuids.generate_uuid,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name='bookcopy',
+            name='id',
+            field=models.UUIDField(
+                default=utils.uuids.generate_uuid,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+    ]
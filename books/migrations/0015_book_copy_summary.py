@@ -0,0 +1,88 @@
+# Generated by Django 4.1.13 on 2026-10-19 16:53
+
+from django.db import migrations, models
+from django.db.models import Count, Max, Min
+
+
+def fill_copy_summaries(apps, schema_editor):
+    Book = apps.get_model('books', 'Book')
+    BookCopy = apps.get_model('books', 'BookCopy')
+
+    books = []
+    for row in (
+        BookCopy.objects.values('book_id')
+        .annotate(
+            count=Count('pk'),
+            earliest=Min('date_published'),
+            latest=Max('date_published'),
+        )
+        .order_by()
+    ):
+        books.append(
+            Book(
+                pk=row['book_id'],
+                copy_count=row['count'],
+                earliest_published=row['earliest'],
+                latest_published=row['latest'],
+            )
+        )
+    Book.objects.bulk_update(
+        books,
+        ['copy_count', 'earliest_published', 'latest_published'],
+        batch_size=500,
+    )
+
+    through = Book.publishers.through
+    through.objects.bulk_create(
+        (
+            through(book_id=book_id, publisher_id=publisher_id)
+            for book_id, publisher_id in BookCopy.objects.values_list(
+                'book_id', 'publisher_id'
+            )
+            .order_by()
+            .distinct()
+        ),
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('books', '0014_alter_book_id_alter_bookcopy_id'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='book',
+            name='copy_count',
+            field=models.PositiveIntegerField(
+                db_index=True, default=0, editable=False
+            ),
+        ),
+        migrations.AddField(
+            model_name='book',
+            name='earliest_published',
+            field=models.DateField(
+                blank=True, db_index=True, editable=False, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name='book',
+            name='latest_published',
+            field=models.DateField(
+                blank=True, db_index=True, editable=False, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name='book',
+            name='publishers',
+            field=models.ManyToManyField(
+                blank=True,
+                editable=False,
+                related_name='books',
+                to='books.publisher',
+            ),
+        ),
+        migrations.RunPython(fill_copy_summaries, migrations.RunPython.noop),
+    ]
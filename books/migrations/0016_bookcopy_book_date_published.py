@@ -0,0 +1,20 @@
+# Generated by Django 4.1.13 on 2026-10-19 16:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('books', '0015_book_copy_summary'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='bookcopy',
+            index=models.Index(
+                fields=['book', 'date_published', 'id'],
+                name='books_bookc_book_id_b1930c_idx',
+            ),
+        ),
+    ]
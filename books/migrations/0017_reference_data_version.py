@@ -0,0 +1,25 @@
+# Generated by Django 4.1.13 on 2026-10-19 17:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('books', '0016_bookcopy_book_date_published'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReferenceDataVersion',
+            fields=[
+                (
+                    'label',
+                    models.CharField(
+                        max_length=100, primary_key=True, serialize=False
+                    ),
+                ),
+                ('version', models.PositiveBigIntegerField(default=0)),
+            ],
+        ),
+    ]
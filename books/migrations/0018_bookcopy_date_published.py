@@ -0,0 +1,20 @@
+# Generated by Django 4.1.13 on 2026-10-19 18:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('books', '0017_reference_data_version'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='bookcopy',
+            index=models.Index(
+                fields=['date_published', 'id'],
+                name='books_bookc_date_pu_d49551_idx',
+            ),
+        ),
+    ]
@@ -1,8 +1,7 @@
-from uuid import uuid4
-
-from django.db import models
+from django.db import models, transaction
 
 from authors.models import Author
+from utils.uuids import generate_uuid
 
 
 class Category(models.Model):
@@ -22,20 +21,51 @@ class Publisher(models.Model):
         return f'{self.name}'
 
 
+class ReferenceDataVersion(models.Model):
+    """
+    Counts the writes to a reference table (categories, publishers), so
+    every process can tell when its `books.reference` cache is stale.
+    """
+
+    label = models.CharField(max_length=100, primary_key=True)
+    version = models.PositiveBigIntegerField(default=0)
+
+    def __str__(self):
+        return f'{self.label} v{self.version}'
+
+
 class Book(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
-    title = models.CharField(max_length=100)
+    id = models.UUIDField(
+        primary_key=True, default=generate_uuid, editable=False
+    )
+    title = models.CharField(max_length=100, db_index=True)
     authors = models.ManyToManyField(Author)
     category = models.ForeignKey(
         Category, on_delete=models.CASCADE, blank=True, null=True
     )
 
+    # Summary of the book's copies, kept up to date by books.signals.
+    copy_count = models.PositiveIntegerField(
+        default=0, editable=False, db_index=True
+    )
+    earliest_published = models.DateField(
+        null=True, blank=True, editable=False, db_index=True
+    )
+    latest_published = models.DateField(
+        null=True, blank=True, editable=False, db_index=True
+    )
+    publishers = models.ManyToManyField(
+        Publisher, blank=True, editable=False, related_name='books'
+    )
+
     def __str__(self):
         return f'{self.title}'
 
 
 class BookCopy(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
+    id = models.UUIDField(
+        primary_key=True, default=generate_uuid, editable=False
+    )
     date_published = models.DateField()
     book = models.ForeignKey(Book, on_delete=models.PROTECT)
     publisher = models.ForeignKey(Publisher, on_delete=models.PROTECT)
@@ -43,6 +73,23 @@ class BookCopy(models.Model):
 
     class Meta:
         verbose_name_plural = 'Book copies'
+        indexes = [
+            models.Index(fields=['book', 'date_published', 'id']),
+            models.Index(fields=['date_published', 'id']),
+        ]
 
     def __str__(self):
         return f'{self.book.title} | {self.publisher.name} ({self.date_published})'
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Lets books.signals refresh the previous book when a copy moves.
+        instance._loaded_book_id = instance.__dict__.get('book_id')
+        return instance
+
+    def save(self, *args, **kwargs):
+        # The book summaries are refreshed by a post_save handler, which runs
+        # inside this transaction.
+        with transaction.atomic(using=kwargs.get('using')):
+            super().save(*args, **kwargs)
@@ -0,0 +1,148 @@
+import threading
+import time
+
+from django.conf import settings
+from django.db import IntegrityError, router, transaction
+from django.db.models import F
+
+from books.models import Category, Publisher, ReferenceDataVersion
+
+
+def current_version(label):
+    return (
+        ReferenceDataVersion.objects.filter(label=label)
+        .values_list('version', flat=True)
+        .first()
+        or 0
+    )
+
+
+def bump_version(label):
+    for _ in range(2):
+        if ReferenceDataVersion.objects.filter(label=label).update(
+            version=F('version') + 1
+        ):
+            return
+        try:
+            with transaction.atomic():
+                ReferenceDataVersion.objects.create(label=label, version=1)
+            return
+        except IntegrityError:
+            # Created by a concurrent write, increment it.
+            continue
+
+
+class ReferenceCache:
+    """
+    Process-local maps between the ids and names of a small, rarely changing
+    table.
+
+    Writes through the ORM bump the table's `ReferenceDataVersion` and
+    invalidate the cache of the writing process. Other processes compare
+    the version at most every `settings.REFERENCE_CACHE_CHECK_SECONDS` and
+    reload the table when it moved.
+    """
+
+    # Stands for a name shared by several rows, which can't be looked up.
+    AMBIGUOUS = object()
+
+    def __init__(self, model, field='name'):
+        self.model = model
+        self.field = field
+        self.label = model._meta.label_lower
+        self._lock = threading.Lock()
+        self._names = {}
+        self._pks = {}
+        self._version = None
+        self._checked_at = None
+
+    def __deepcopy__(self, memo):
+        # Serializer fields are deep-copied per serializer, keep sharing it.
+        return self
+
+    def _reload(self):
+        version = current_version(self.label)
+        rows = list(self.model._default_manager.values_list('pk', self.field))
+        pks = {}
+        for pk, name in rows:
+            pks[name] = self.AMBIGUOUS if name in pks else pk
+        self._names, self._pks = dict(rows), pks
+        self._version = version
+
+    def _refresh(self, force=False):
+        now = time.monotonic()
+        if not force and (
+            self._checked_at is not None
+            and now - self._checked_at < settings.REFERENCE_CACHE_CHECK_SECONDS
+        ):
+            return
+        with self._lock:
+            if force or self._version != current_version(self.label):
+                self._reload()
+            self._checked_at = now
+
+    def name(self, pk):
+        """
+        Return the name of the row `pk`, or `None` when there is none.
+        """
+        self._refresh()
+        try:
+            return self._names[pk]
+        except KeyError:
+            # Possibly created by another process since the last check.
+            self._refresh(force=True)
+            return self._names.get(pk)
+
+    def pk(self, name):
+        """
+        Return the id of the row named `name`, `AMBIGUOUS` when several
+        rows have it or `None` when none has.
+        """
+        self._refresh()
+        try:
+            return self._pks[name]
+        except KeyError:
+            pass
+
+        # Unknown names are looked up rather than reloading the table, so
+        # requests with made-up names cost no more than before.
+        pks = list(
+            self.model._default_manager.filter(
+                **{self.field: name}
+            ).values_list('pk', flat=True)[:2]
+        )
+        if not pks:
+            return None
+        self.invalidate()
+        return pks[0] if len(pks) == 1 else self.AMBIGUOUS
+
+    def instance(self, pk):
+        """
+        Build the row `pk` from the cache, like a `.only()` query would.
+        """
+        return self.model.from_db(
+            router.db_for_read(self.model),
+            [self.model._meta.pk.attname, self.field],
+            [pk, self.name(pk)],
+        )
+
+    def invalidate(self):
+        with self._lock:
+            self._version = None
+            self._checked_at = None
+
+
+category_names = ReferenceCache(Category)
+publisher_names = ReferenceCache(Publisher)
+
+CACHES = {cache.model: cache for cache in (category_names, publisher_names)}
+
+
+def warm_all():
+    for cache in CACHES.values():
+        cache._refresh(force=True)
+
+
+def invalidate_all():
+    for cache in CACHES.values():
+        cache.invalidate()
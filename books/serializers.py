@@ -1,38 +1,57 @@
-from drf_extra_fields.fields import HybridImageField
 from rest_flex_fields import FlexFieldsModelSerializer
 from rest_framework import serializers
 
 from authors.models import Author
 from authors.serializers import AuthorSerializer
 from books.models import Book, BookCopy, Category, Publisher
+from books.reference import category_names, publisher_names
+from utils.fields import CachedSlugRelatedField, HybridImageField
+from utils.serializers import ModelSerializerMixin
 
 
-class CategorySerializer(serializers.HyperlinkedModelSerializer):
+class CategorySerializer(
+    ModelSerializerMixin, serializers.HyperlinkedModelSerializer
+):
     class Meta:
         model = Category
         fields = ['url', 'id', 'name']
 
 
-class PublisherSerializer(serializers.HyperlinkedModelSerializer):
+class PublisherSerializer(
+    ModelSerializerMixin, serializers.HyperlinkedModelSerializer
+):
     class Meta:
         model = Publisher
         fields = ['url', 'id', 'name']
 
 
-class BookSerializer(FlexFieldsModelSerializer):
-    category = serializers.SlugRelatedField(
-        queryset=Category.objects.all(), slug_field='name'
+class BookSerializer(ModelSerializerMixin, FlexFieldsModelSerializer):
+    category = CachedSlugRelatedField(
+        category_names, queryset=Category.objects.all()
+    )
+    publishers = CachedSlugRelatedField(
+        publisher_names, many=True, read_only=True
     )
 
     class Meta:
         model = Book
-        fields = ['url', 'id', 'title', 'authors', 'category']
+        fields = [
+            'url',
+            'id',
+            'title',
+            'authors',
+            'category',
+            'copy_count',
+            'earliest_published',
+            'latest_published',
+            'publishers',
+        ]
         expandable_fields = {'authors': (AuthorSerializer, {'many': True})}
 
 
-class BookCopySerializer(FlexFieldsModelSerializer):
-    publisher = serializers.SlugRelatedField(
-        queryset=Publisher.objects.all(), slug_field='name'
+class BookCopySerializer(ModelSerializerMixin, FlexFieldsModelSerializer):
+    publisher = CachedSlugRelatedField(
+        publisher_names, queryset=Publisher.objects.all()
     )
     cover = HybridImageField()
 
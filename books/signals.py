@@ -0,0 +1,104 @@
+from django.db import transaction
+from django.db.models import Count, Max, Min
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import Signal, receiver
+
+from books.models import Book, BookCopy, Category, Publisher
+from books.reference import CACHES, bump_version
+
+# Sent with `book_ids` after the copy summaries of those books were updated.
+copy_summaries_refreshed = Signal()
+
+# Sent with `copy` and `previous_book_id` when a copy was saved under another
+# book, so rows copying its book can follow it.
+copy_moved = Signal()
+
+
+def refresh_copy_summaries(book_ids):
+    """
+    Recompute `copy_count`, `earliest_published`, `latest_published` and
+    `publishers` of the given books from their copies.
+
+    The book rows are locked first, so concurrent copy writes for the same
+    book apply one after the other.
+    """
+    book_ids = {pk for pk in book_ids if pk is not None}
+    if not book_ids:
+        return
+
+    with transaction.atomic():
+        locked_ids = list(
+            Book.objects.select_for_update()
+            .filter(pk__in=book_ids)
+            .order_by('pk')
+            .values_list('pk', flat=True)
+        )
+        copies = BookCopy.objects.filter(book_id__in=locked_ids)
+
+        summaries = {
+            row['book_id']: row
+            for row in copies.values('book_id').annotate(
+                count=Count('pk'),
+                earliest=Min('date_published'),
+                latest=Max('date_published'),
+            )
+        }
+        for pk in locked_ids:
+            summary = summaries.get(pk, {})
+            Book.objects.filter(pk=pk).update(
+                copy_count=summary.get('count', 0),
+                earliest_published=summary.get('earliest'),
+                latest_published=summary.get('latest'),
+            )
+
+        through = Book.publishers.through
+        current = set(
+            through.objects.filter(book_id__in=locked_ids).values_list(
+                'book_id', 'publisher_id'
+            )
+        )
+        wanted = set(
+            copies.values_list('book_id', 'publisher_id').order_by().distinct()
+        )
+        for book_id, publisher_id in current - wanted:
+            through.objects.filter(
+                book_id=book_id, publisher_id=publisher_id
+            ).delete()
+        through.objects.bulk_create(
+            through(book_id=book_id, publisher_id=publisher_id)
+            for book_id, publisher_id in wanted - current
+        )
+
+        copy_summaries_refreshed.send(sender=Book, book_ids=locked_ids)
+
+
+@receiver(post_save, sender=BookCopy)
+def book_copy_saved(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+
+    previous_book_id = getattr(instance, '_loaded_book_id', None)
+    refresh_copy_summaries([instance.book_id, previous_book_id])
+    instance._loaded_book_id = instance.book_id
+    if previous_book_id not in (None, instance.book_id):
+        copy_moved.send(
+            sender=BookCopy, copy=instance, previous_book_id=previous_book_id
+        )
+
+
+@receiver(post_delete, sender=BookCopy)
+def book_copy_deleted(sender, instance, **kwargs):
+    refresh_copy_summaries([instance.book_id])
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Publisher)
+@receiver(post_delete, sender=Publisher)
+def reference_data_changed(sender, **kwargs):
+    cache = CACHES[sender]
+    bump_version(cache.label)
+    # Dropped now for this transaction and again once the write is visible
+    # to the other connections of the process.
+    cache.invalidate()
+    transaction.on_commit(cache.invalidate)
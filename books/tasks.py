@@ -0,0 +1,21 @@
+from itertools import islice
+
+from books.models import Book
+from books.signals import refresh_copy_summaries
+from jobs.registry import task
+
+BATCH_SIZE = 500
+
+
+@task(name='books.refresh_copy_summaries', priority=-10, timeout=3600)
+def refresh_copy_summaries_task(book_ids=None):
+    """
+    Recompute the copy summaries of the given books, or of every book, in
+    batches (e.g. after copies were bulk loaded without signals).
+    """
+    if book_ids is None:
+        book_ids = Book.objects.values_list('pk', flat=True).iterator()
+
+    book_ids = iter(book_ids)
+    while batch := list(islice(book_ids, BATCH_SIZE)):
+        refresh_copy_summaries(batch)
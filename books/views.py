@@ -1,9 +1,11 @@
 from django_filters.rest_framework import DjangoFilterBackend
+from drf_spectacular.utils import extend_schema
 from rest_framework import filters as restfilters
-from rest_framework import permissions, viewsets
+from rest_framework import viewsets
 from rest_framework.decorators import action
-from rest_framework.response import Response
+from rest_framework.generics import get_object_or_404
 
+from books.filters import BookCopyFilter
 from books.models import Book, BookCopy, Category, Publisher
 from books.serializers import (
     BookCopySerializer,
@@ -11,10 +13,17 @@ from books.serializers import (
     CategorySerializer,
     PublisherSerializer,
 )
+from loans.views import BookAvailabilityMixin, BookCopyCirculationMixin
+from throttling.throttles import TokenBucketThrottle
 from utils.api_permissions import APIPermission
+from utils.compiled_serializers import CompiledReadMixin
+from utils.pagination import LimitOffsetPagination
+from utils.views import AtomicWritesMixin
 
 
-class CategoryViewSet(viewsets.ModelViewSet):
+class CategoryViewSet(
+    AtomicWritesMixin, CompiledReadMixin, viewsets.ModelViewSet
+):
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
     permission_classes = [APIPermission]
@@ -23,7 +32,9 @@ class CategoryViewSet(viewsets.ModelViewSet):
     search_fields = ['name']
 
 
-class PublisherViewSet(viewsets.ModelViewSet):
+class PublisherViewSet(
+    AtomicWritesMixin, CompiledReadMixin, viewsets.ModelViewSet
+):
     queryset = Publisher.objects.all()
     serializer_class = PublisherSerializer
     permission_classes = [APIPermission]
@@ -32,27 +43,88 @@ class PublisherViewSet(viewsets.ModelViewSet):
     search_fields = ['name']
 
 
-class BooksViewSet(viewsets.ModelViewSet):
-    queryset = Book.objects.all()
-    serializer_class = BookSerializer
+class BookCopyViewSet(
+    BookCopyCirculationMixin,
+    AtomicWritesMixin,
+    CompiledReadMixin,
+    viewsets.ModelViewSet,
+):
+    # Ordered so offset pagination is stable whichever index the database
+    # scans.
+    queryset = BookCopy.objects.order_by('pk')
+    serializer_class = BookCopySerializer
     permission_classes = [APIPermission]
+
     filter_backends = [DjangoFilterBackend, restfilters.SearchFilter]
-    filterset_fields = ['id', 'title', 'authors', 'category']
-    search_fields = ['title', 'authors__name']
+    filterset_class = BookCopyFilter
+    search_fields = ['book__title', 'book__authors__name']
+    throttle_classes = [TokenBucketThrottle]
+    # Searches join books and authors, expansions add queries per page.
+    throttle_costs = {'search': 4, 'expand': 3}
 
-    @action(detail=True, methods=['get'], serializer_class=BookCopySerializer)
-    def copies(self, request, pk=None):
-        copies = BookCopy.objects.filter(book_id=pk)
-        serializer = self.get_serializer(copies, many=True)
 
-        return Response(serializer.data)
+class BookCopyPagination(LimitOffsetPagination):
+    default_limit = 50
+    max_limit = 1000
 
 
-class BookCopyViewSet(viewsets.ModelViewSet):
-    queryset = BookCopy.objects.all()
-    serializer_class = BookCopySerializer
+class BooksViewSet(
+    BookAvailabilityMixin,
+    AtomicWritesMixin,
+    CompiledReadMixin,
+    viewsets.ModelViewSet,
+):
+    queryset = Book.objects.all()
+    serializer_class = BookSerializer
     permission_classes = [APIPermission]
+    filter_backends = [
+        DjangoFilterBackend,
+        restfilters.SearchFilter,
+        restfilters.OrderingFilter,
+    ]
+    # Set by the `copies` action.
+    filterset_class = None
+    filterset_fields = {
+        'id': ['exact'],
+        'title': ['exact'],
+        'authors': ['exact'],
+        'category': ['exact'],
+        'publishers': ['exact'],
+        'copy_count': ['exact', 'gte', 'lte'],
+        'earliest_published': ['exact', 'gte', 'lte'],
+        'latest_published': ['exact', 'gte', 'lte'],
+    }
+    search_fields = ['title', 'authors__name']
+    throttle_classes = [TokenBucketThrottle]
+    throttle_costs = BookCopyViewSet.throttle_costs
+    ordering_fields = [
+        'title',
+        'copy_count',
+        'earliest_published',
+        'latest_published',
+    ]
 
-    filter_backends = [DjangoFilterBackend, restfilters.SearchFilter]
-    filterset_fields = ['id', 'book', 'date_published', 'publisher']
-    search_fields = ['book__title', 'book__authors__name']
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'copies':
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            if lookup_url_kwarg in self.kwargs:
+                queryset = queryset.filter(
+                    book_id=self.kwargs[lookup_url_kwarg]
+                )
+        return queryset
+
+    @extend_schema(responses=BookCopySerializer(many=True), filters=True)
+    @action(
+        detail=True,
+        methods=['get'],
+        queryset=BookCopy.objects.order_by('date_published', 'id'),
+        serializer_class=BookCopySerializer,
+        pagination_class=BookCopyPagination,
+        filter_backends=BookCopyViewSet.filter_backends,
+        filterset_class=BookCopyViewSet.filterset_class,
+        search_fields=BookCopyViewSet.search_fields,
+    )
+    def copies(self, request, pk=None):
+        get_object_or_404(Book.objects.only('pk'), pk=pk)
+        return self.list(request)
@@ -0,0 +1,178 @@
+from datetime import timedelta
+from itertools import islice
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models import F, Max, Min
+from django.utils import timezone
+
+from authors.serializers import AuthorSerializer
+from books.serializers import (
+    BookCopySerializer,
+    BookSerializer,
+    CategorySerializer,
+    PublisherSerializer,
+)
+from changes.models import Change, ChangeSequence
+from utils.compiled_serializers import SerializationContext, compile_serializer
+
+# Serializer the current state of each tracked model is sent with.
+SERIALIZERS = {
+    'authors.author': AuthorSerializer,
+    'books.book': BookSerializer,
+    'books.bookcopy': BookCopySerializer,
+    'books.category': CategorySerializer,
+    'books.publisher': PublisherSerializer,
+}
+
+# Objects whose representation includes the name of another one, as
+# (model, lookup) pairs, so renaming a category or publisher re-sends them.
+DEPENDENTS = {
+    'books.category': [('books.book', 'category')],
+    'books.publisher': [
+        ('books.bookcopy', 'publisher'),
+        ('books.book', 'publishers'),
+    ],
+}
+
+RECORD_BATCH_SIZE = 1000
+
+
+def tracked_models():
+    return [apps.get_model(label) for label in SERIALIZERS]
+
+
+def record(model, object_ids, action):
+    if Change.objects.bulk_create(
+        Change(
+            model=model._meta.label_lower,
+            object_id=str(object_id),
+            action=action,
+        )
+        for object_id in object_ids
+    ):
+        transaction.on_commit(stamp_changes)
+
+
+def stamp_changes():
+    """
+    Number the committed changes that have no sequence yet after all those
+    numbered before, and return how many were numbered.
+
+    Runs once the transaction that recorded them commits, and before each
+    webhook delivery round in case that process died in between. Only
+    committed rows are visible here, and the `ChangeSequence` row is held
+    until this transaction commits, so sequences follow commit order.
+    """
+    with transaction.atomic():
+        # Taking the row's lock first; on SQLite, the write lock.
+        if not ChangeSequence.objects.filter(pk=1).update(last=F('last')):
+            ChangeSequence.objects.create(pk=1)
+        last = ChangeSequence.objects.get(pk=1).last
+
+        unsequenced = Change.objects.filter(sequence__isnull=True)
+        bounds = unsequenced.aggregate(first=Min('pk'), last=Max('pk'))
+        if bounds['first'] is None:
+            return 0
+
+        # Ids are unique, so shifting them past the last sequence numbers
+        # the batch in one UPDATE; the gaps don't matter.
+        offset = last + 1 - bounds['first']
+        numbered = unsequenced.filter(
+            pk__gte=bounds['first'], pk__lte=bounds['last']
+        ).update(sequence=F('pk') + offset)
+        ChangeSequence.objects.filter(pk=1).update(
+            last=bounds['last'] + offset
+        )
+
+    return numbered
+
+
+def record_queryset(queryset, action):
+    ids = queryset.values_list('pk', flat=True).iterator(
+        chunk_size=RECORD_BATCH_SIZE
+    )
+    while batch := list(islice(ids, RECORD_BATCH_SIZE)):
+        record(queryset.model, batch, action)
+
+
+def record_dependents(instance):
+    for label, lookup in DEPENDENTS.get(instance._meta.label_lower, []):
+        model = apps.get_model(label)
+        record_queryset(
+            model._default_manager.filter(**{lookup: instance.pk}).distinct(),
+            Change.UPSERT,
+        )
+
+
+def changes_after(since, limit, models=None):
+    """
+    Up to `limit` numbered changes after the `since` cursor, oldest first.
+    """
+    changes = Change.objects.filter(sequence__gt=since)
+    if models:
+        changes = changes.filter(model__in=models)
+    return list(changes.order_by('sequence')[:limit])
+
+
+def prune_changes(days, keep_after=None):
+    """
+    Delete numbered changes older than `days` days, except those after the
+    `keep_after` cursor. Returns the number of changes deleted.
+    """
+    changes = Change.objects.filter(
+        sequence__isnull=False,
+        created_at__lt=timezone.now() - timedelta(days=days),
+    )
+    if keep_after is not None:
+        changes = changes.filter(sequence__lte=keep_after)
+    return changes.delete()[0]
+
+
+def _represent(model, object_ids, request):
+    """
+    Return {object id: representation} for the objects that still exist,
+    with one query per model (plus one per relation).
+    """
+    serializer_class = SERIALIZERS[model._meta.label_lower]
+    context = {'request': request}
+    queryset = model._default_manager.filter(pk__in=object_ids)
+
+    compiled = compile_serializer(serializer_class(context=context))
+    if compiled is not None:
+        rows = list(compiled.values(queryset))
+        data = compiled.serialize(rows, SerializationContext(request))
+        return {str(row['pk']): item for row, item in zip(rows, data)}
+
+    objects = list(queryset)
+    data = serializer_class(objects, many=True, context=context).data
+    return {str(obj.pk): item for obj, item in zip(objects, data)}
+
+
+def serialize_changes(changes, request):
+    """
+    Feed entries for `changes`. Upserts carry the object's current
+    representation, or `None` if it has been deleted since.
+    """
+    upserts = {}
+    for change in changes:
+        if change.action == Change.UPSERT:
+            upserts.setdefault(change.model, set()).add(change.object_id)
+
+    current = {}
+    for label, object_ids in upserts.items():
+        for object_id, item in _represent(
+            apps.get_model(label), object_ids, request
+        ).items():
+            current[label, object_id] = item
+
+    return [
+        {
+            'cursor': change.sequence,
+            'model': change.model,
+            'id': change.object_id,
+            'action': change.action,
+            'data': current.get((change.model, change.object_id)),
+        }
+        for change in changes
+    ]
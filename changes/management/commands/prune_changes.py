@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from changes.tasks import prune_old_changes
+
+
+class Command(BaseCommand):
+    help = (
+        'Delete changes older than CHANGE_FEED_RETENTION_DAYS that every '
+        'active webhook subscription has received. Meant to run '
+        'periodically; feed consumers further behind miss them.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            help='Retention in days, instead of CHANGE_FEED_RETENTION_DAYS.',
+        )
+
+    def handle(self, *args, **options):
+        deleted = prune_old_changes(days=options['days'])
+        self.stdout.write(self.style.SUCCESS(f'{deleted} changes deleted'))
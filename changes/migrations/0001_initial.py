@@ -0,0 +1,33 @@
+# Generated by Django 4.1.13 on 2026-10-19 17:13
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name='Change',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('model', models.CharField(max_length=100)),
+                ('object_id', models.CharField(max_length=36)),
+                (
+                    'action',
+                    models.CharField(
+                        choices=[('upsert', 'Upsert'), ('delete', 'Delete')],
+                        max_length=6,
+                    ),
+                ),
+                (
+                    'created_at',
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+            ],
+        ),
+    ]
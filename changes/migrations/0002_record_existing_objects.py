@@ -0,0 +1,49 @@
+from itertools import islice
+
+from django.db import migrations
+
+TRACKED_MODELS = [
+    ('authors', 'Author'),
+    ('books', 'Category'),
+    ('books', 'Publisher'),
+    ('books', 'Book'),
+    ('books', 'BookCopy'),
+]
+BATCH_SIZE = 1000
+
+
+def record_existing_objects(apps, schema_editor):
+    """
+    Start the feed with an upsert of every existing object, so consumers can
+    sync from cursor 0.
+    """
+    Change = apps.get_model('changes', 'Change')
+
+    for app_label, model_name in TRACKED_MODELS:
+        model = apps.get_model(app_label, model_name)
+        label = model._meta.label_lower
+        ids = (
+            model.objects.order_by()
+            .values_list('pk', flat=True)
+            .iterator(chunk_size=BATCH_SIZE)
+        )
+        while batch := list(islice(ids, BATCH_SIZE)):
+            Change.objects.bulk_create(
+                Change(model=label, object_id=str(pk), action='upsert')
+                for pk in batch
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('changes', '0001_initial'),
+        ('authors', '0004_alter_author_id'),
+        ('books', '0016_bookcopy_book_date_published'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            record_existing_objects, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 4.1.13 on 2026-10-19 18:55
+
+from django.db import migrations, models
+from django.db.models import F, Max
+
+
+def number_existing_changes(apps, schema_editor):
+    """
+    Number the existing changes by id, which was the cursor until now, so
+    consumers carry on from the cursor they have.
+    """
+    Change = apps.get_model('changes', 'Change')
+    ChangeSequence = apps.get_model('changes', 'ChangeSequence')
+
+    Change.objects.update(sequence=F('id'))
+    last = Change.objects.aggregate(last=Max('id'))['last'] or 0
+    ChangeSequence.objects.create(pk=1, last=last)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('changes', '0002_record_existing_objects'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChangeSequence',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                ('last', models.PositiveBigIntegerField(default=0)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='change',
+            name='sequence',
+            field=models.PositiveBigIntegerField(
+                blank=True, null=True, unique=True
+            ),
+        ),
+        migrations.RunPython(
+            number_existing_changes, migrations.RunPython.noop
+        ),
+        migrations.AddIndex(
+            model_name='change',
+            index=models.Index(
+                condition=models.Q(('sequence__isnull', True)),
+                fields=['id'],
+                name='changes_unsequenced',
+            ),
+        ),
+    ]
@@ -0,0 +1,52 @@
+from django.db import models
+from django.db.models import Q
+from django.utils import timezone
+
+
+class Change(models.Model):
+    """
+    One write to a catalog object.
+
+    Rows are numbered once the transaction that wrote them has committed
+    (see changes.feed.stamp_changes). `sequence` is the cursor consumers of
+    /api/changes/ resume from: it grows in commit order, so a slow
+    transaction can't commit a change behind a cursor a consumer already
+    moved past.
+    """
+
+    UPSERT = 'upsert'
+    DELETE = 'delete'
+    ACTION_CHOICES = [(UPSERT, 'Upsert'), (DELETE, 'Delete')]
+
+    id = models.BigAutoField(primary_key=True)
+    model = models.CharField(max_length=100)
+    object_id = models.CharField(max_length=36)
+    action = models.CharField(max_length=6, choices=ACTION_CHOICES)
+    created_at = models.DateTimeField(default=timezone.now)
+    sequence = models.PositiveBigIntegerField(
+        null=True, blank=True, unique=True
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['id'],
+                condition=Q(sequence__isnull=True),
+                name='changes_unsequenced',
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.action} {self.model} {self.object_id}'
+
+
+class ChangeSequence(models.Model):
+    """
+    The last sequence number given to a change, in a single row that is
+    locked while changes are numbered.
+    """
+
+    last = models.PositiveBigIntegerField(default=0)
+
+    def __str__(self):
+        return str(self.last)
@@ -0,0 +1,24 @@
+from rest_framework import serializers
+
+
+class ChangeSerializer(serializers.Serializer):
+    cursor = serializers.IntegerField()
+    model = serializers.CharField()
+    id = serializers.CharField()
+    action = serializers.ChoiceField(choices=['upsert', 'delete'])
+    data = serializers.JSONField(allow_null=True)
+
+
+class ChangeFeedSerializer(serializers.Serializer):
+    cursor = serializers.IntegerField()
+    next = serializers.URLField(allow_null=True)
+    results = ChangeSerializer(many=True)
+
+
+class ChangeFeedQuerySerializer(serializers.Serializer):
+    since = serializers.IntegerField(
+        min_value=0,
+        default=0,
+        help_text='Cursor of the last change already applied.',
+    )
+    limit = serializers.IntegerField(min_value=1, max_value=1000, default=100)
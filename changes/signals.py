@@ -0,0 +1,75 @@
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+)
+
+from authors.models import Author
+from books.models import Book
+from books.signals import copy_summaries_refreshed
+from changes.feed import (
+    record,
+    record_dependents,
+    record_queryset,
+    tracked_models,
+)
+from changes.models import Change
+
+
+def object_saved(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+
+    record(sender, [instance.pk], Change.UPSERT)
+    if not created:
+        record_dependents(instance)
+
+
+def object_deleted(sender, instance, **kwargs):
+    record(sender, [instance.pk], Change.DELETE)
+
+
+def author_deleting(sender, instance, **kwargs):
+    # Deleting the author removes its book_authors rows without sending
+    # m2m_changed, so note its books while they can still be found.
+    record_queryset(Book.objects.filter(authors=instance.pk), Change.UPSERT)
+
+
+def book_authors_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if reverse and action == 'pre_clear':
+        # The cleared books are gone by post_clear, so note them now.
+        instance._cleared_book_ids = list(
+            sender.objects.filter(author_id=instance.pk).values_list(
+                'book_id', flat=True
+            )
+        )
+        return
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    if not reverse:
+        book_ids = [instance.pk]
+    elif action == 'post_clear':
+        book_ids = instance.__dict__.pop('_cleared_book_ids', [])
+    else:
+        book_ids = pk_set
+
+    record(Book, book_ids, Change.UPSERT)
+
+
+def copy_summaries_changed(sender, book_ids, **kwargs):
+    record(Book, book_ids, Change.UPSERT)
+
+
+for model in tracked_models():
+    post_save.connect(
+        object_saved, sender=model, dispatch_uid=f'changes_{model}_saved'
+    )
+    post_delete.connect(
+        object_deleted, sender=model, dispatch_uid=f'changes_{model}_deleted'
+    )
+
+pre_delete.connect(author_deleting, sender=Author)
+m2m_changed.connect(book_authors_changed, sender=Book.authors.through)
+copy_summaries_refreshed.connect(copy_summaries_changed, sender=Book)
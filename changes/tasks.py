@@ -0,0 +1,21 @@
+from django.conf import settings
+from django.db.models import Min
+
+from changes.feed import prune_changes
+from jobs.registry import task
+from webhooks.models import Subscription
+
+
+@task(name='changes.prune_changes', priority=-10)
+def prune_old_changes(days=None):
+    """
+    Delete changes older than `settings.CHANGE_FEED_RETENTION_DAYS` that
+    every active webhook subscription has received.
+    """
+    keep_after = Subscription.objects.filter(active=True).aggregate(
+        cursor=Min('cursor')
+    )['cursor']
+    return prune_changes(
+        settings.CHANGE_FEED_RETENTION_DAYS if days is None else days,
+        keep_after,
+    )
@@ -0,0 +1,45 @@
+from drf_spectacular.utils import extend_schema
+from rest_framework import viewsets
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from changes.feed import changes_after, serialize_changes
+from changes.models import Change
+from changes.serializers import ChangeFeedQuerySerializer, ChangeFeedSerializer
+from utils.api_permissions import APIPermission
+
+
+class ChangeViewSet(viewsets.GenericViewSet):
+    """
+    Catalog changes after the `since` cursor, oldest first.
+    """
+
+    queryset = Change.objects.all()
+    serializer_class = ChangeFeedSerializer
+    permission_classes = [APIPermission]
+    pagination_class = None
+    filter_backends = []
+
+    @extend_schema(parameters=[ChangeFeedQuerySerializer])
+    def list(self, request, *args, **kwargs):
+        query = ChangeFeedQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        since = query.validated_data['since']
+        limit = query.validated_data['limit']
+
+        changes = changes_after(since, limit)
+
+        cursor = changes[-1].sequence if changes else since
+        next_url = None
+        if len(changes) == limit:
+            next_url = replace_query_param(
+                request.build_absolute_uri(), 'since', cursor
+            )
+
+        return Response(
+            {
+                'cursor': cursor,
+                'next': next_url,
+                'results': serialize_changes(changes, request),
+            }
+        )
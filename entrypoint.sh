@@ -1,5 +1,7 @@
 #!/bin/sh
 
+set -e
+
 if [ "$DATABASE" = "postgres" ]
 then
     echo "Waiting for postgres..."
@@ -11,7 +13,16 @@ then
     echo "PostgreSQL started"
 fi
 
-python manage.py collectstatic --no-input
+# manage.py defaults to the development settings while the WSGI and ASGI
+# applications default to the production ones. When serving with gunicorn,
+# set SERVE_SETTINGS (e.g. to setup.settings.prod) so the static files
+# (their manifest and compressed copies) are collected and the settings
+# checked with the settings the workers will run with.
+SETTINGS_OPTION="${SERVE_SETTINGS:+--settings=$SERVE_SETTINGS}"
+
+python manage.py collectstatic --no-input $SETTINGS_OPTION
 python manage.py migrate
+python manage.py build_schema
+python manage.py check_performance $SETTINGS_OPTION
 
 exec "$@"
\ No newline at end of file
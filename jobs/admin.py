@@ -0,0 +1,25 @@
+from django.contrib import admin
+from django.utils import timezone
+
+from jobs.models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = [
+        'id',
+        'name',
+        'status',
+        'priority',
+        'attempts',
+        'run_at',
+        'duration',
+    ]
+    list_filter = ['status', 'name']
+    actions = ['retry']
+
+    @admin.action(description='Queue selected jobs again')
+    def retry(self, request, queryset):
+        queryset.exclude(status=Job.RUNNING).update(
+            status=Job.QUEUED, attempts=0, run_at=timezone.now()
+        )
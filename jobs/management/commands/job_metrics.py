@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from jobs.metrics import queue_metrics
+
+
+class Command(BaseCommand):
+    help = 'Show job counts, run times and queue delay per task.'
+
+    def handle(self, *args, **options):
+        for name, metrics in sorted(queue_metrics().items()):
+            avg = metrics['avg_duration']
+            oldest = metrics['oldest_due_seconds']
+            self.stdout.write(
+                f'{name}: '
+                f'queued={metrics["queued"]} '
+                f'running={metrics["running"]} '
+                f'succeeded={metrics["succeeded"]} '
+                f'failed={metrics["failed"]} '
+                f'avg={"-" if avg is None else f"{avg * 1000:.1f}ms"} '
+                f'oldest_due={"-" if oldest is None else f"{oldest:.0f}s"}'
+            )
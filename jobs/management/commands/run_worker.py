@@ -0,0 +1,58 @@
+from django.core.management.base import BaseCommand
+
+from jobs.worker import Worker
+
+
+class Command(BaseCommand):
+    help = (
+        'Run queued background jobs, and queue the tasks in JOB_SCHEDULE '
+        'when they are due.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=4,
+            help='Jobs run at the same time.',
+        )
+        parser.add_argument(
+            '--pool',
+            choices=['thread', 'process', 'inline'],
+            default='thread',
+            help=(
+                'Run jobs in threads, in processes (for CPU-bound work such '
+                'as image processing) or one at a time in this process.'
+            ),
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=1,
+            help='Seconds to wait for new jobs when the queue is empty.',
+        )
+        parser.add_argument(
+            '--metrics-interval',
+            type=float,
+            default=60,
+            help='Seconds between metrics log lines.',
+        )
+        parser.add_argument(
+            '--burst',
+            action='store_true',
+            help='Exit once the queue is empty.',
+        )
+
+    def handle(self, *args, **options):
+        worker = Worker(
+            concurrency=options['concurrency'],
+            pool=options['pool'],
+            poll_interval=options['poll_interval'],
+            metrics_interval=options['metrics_interval'],
+            log=self.stdout.write,
+        )
+        self.stdout.write(f'Worker {worker.id} started')
+        try:
+            worker.run(burst=options['burst'])
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,79 @@
+from collections import defaultdict
+
+from django.db.models import Avg, Count, Min
+from django.utils import timezone
+
+from jobs.models import Job
+
+
+class WorkerMetrics:
+    """
+    In-process counters of the jobs a worker ran.
+    """
+
+    def __init__(self):
+        self.outcomes = defaultdict(int)
+        self.runs = defaultdict(int)
+        self.seconds = defaultdict(float)
+
+    def record(self, name, outcome, duration):
+        self.outcomes[outcome] += 1
+        self.runs[name] += 1
+        self.seconds[name] += duration
+
+    def record_crash(self):
+        # Not a run: the job's outcome and duration are unknown.
+        self.outcomes['crashed'] += 1
+
+    def summary(self):
+        outcomes = ', '.join(
+            f'{outcome}={count}'
+            for outcome, count in sorted(self.outcomes.items())
+        )
+        tasks = ', '.join(
+            f'{name}: {self.runs[name]} runs, '
+            f'{self.seconds[name] / self.runs[name] * 1000:.1f} ms avg'
+            for name in sorted(self.runs)
+        )
+        return f'{outcomes or "no jobs"}' + (f' ({tasks})' if tasks else '')
+
+
+def queue_metrics():
+    """
+    Per task: job counts by status, average run time, and the age of the
+    oldest due job.
+    """
+    now = timezone.now()
+    metrics = defaultdict(
+        lambda: {
+            'queued': 0,
+            'running': 0,
+            'succeeded': 0,
+            'failed': 0,
+            'avg_duration': None,
+            'oldest_due_seconds': None,
+        }
+    )
+
+    for row in Job.objects.values('name', 'status').annotate(
+        count=Count('pk')
+    ):
+        metrics[row['name']][row['status']] = row['count']
+
+    for row in (
+        Job.objects.filter(status=Job.SUCCEEDED)
+        .values('name')
+        .annotate(avg_duration=Avg('duration'))
+    ):
+        metrics[row['name']]['avg_duration'] = row['avg_duration']
+
+    for row in (
+        Job.objects.filter(status=Job.QUEUED, run_at__lte=now)
+        .values('name')
+        .annotate(oldest=Min('run_at'))
+    ):
+        metrics[row['name']]['oldest_due_seconds'] = (
+            now - row['oldest']
+        ).total_seconds()
+
+    return dict(metrics)
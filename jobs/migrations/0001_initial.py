@@ -0,0 +1,78 @@
+# Generated by Django 4.1.13 on 2026-10-19 17:18
+
+import django.core.serializers.json
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name='Job',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=200)),
+                (
+                    'kwargs',
+                    models.JSONField(
+                        default=dict,
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                    ),
+                ),
+                ('priority', models.SmallIntegerField(default=0)),
+                (
+                    'status',
+                    models.CharField(
+                        choices=[
+                            ('queued', 'Queued'),
+                            ('running', 'Running'),
+                            ('succeeded', 'Succeeded'),
+                            ('failed', 'Failed'),
+                        ],
+                        default='queued',
+                        max_length=10,
+                    ),
+                ),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('max_attempts', models.PositiveSmallIntegerField(default=3)),
+                ('timeout', models.PositiveIntegerField(default=300)),
+                (
+                    'run_at',
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                (
+                    'created_at',
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('duration', models.FloatField(blank=True, null=True)),
+                ('locked_by', models.CharField(blank=True, max_length=100)),
+                ('locked_until', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(
+                models.OrderBy(models.F('priority'), descending=True),
+                models.F('run_at'),
+                models.F('id'),
+                condition=models.Q(('status', 'queued')),
+                name='jobs_queued',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(
+                condition=models.Q(('status', 'running')),
+                fields=['locked_until'],
+                name='jobs_running_by_lease',
+            ),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.1.13 on 2026-10-19 19:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(
+                fields=['name', 'created_at'], name='jobs_by_name'
+            ),
+        ),
+    ]
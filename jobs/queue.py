@@ -0,0 +1,142 @@
+import time
+import traceback
+from datetime import timedelta
+
+from django.db import connections, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from jobs.models import Job
+from jobs.registry import REGISTRY
+
+RETRY_BACKOFF_BASE = 10
+RETRY_BACKOFF_MAX = 60 * 60
+
+
+def retry_delay(attempts):
+    return min(RETRY_BACKOFF_BASE * 2 ** (attempts - 1), RETRY_BACKOFF_MAX)
+
+
+def _start(job, worker_id, now):
+    started = Job.objects.filter(pk=job.pk, status=Job.QUEUED).update(
+        status=Job.RUNNING,
+        attempts=F('attempts') + 1,
+        started_at=now,
+        locked_by=worker_id,
+        locked_until=now + timedelta(seconds=job.timeout),
+    )
+    if started:
+        job.status = Job.RUNNING
+        job.attempts += 1
+        job.locked_by = worker_id
+    return started
+
+
+def claim(worker_id, limit):
+    """
+    Mark up to `limit` due jobs as running for `worker_id`, highest priority
+    first, and return them.
+
+    On databases with SKIP LOCKED (PostgreSQL) concurrent workers take
+    disjoint rows without waiting on each other. Elsewhere (SQLite) each job
+    is taken with a conditional update, which only one worker can win.
+    """
+    now = timezone.now()
+    due = Job.objects.filter(status=Job.QUEUED, run_at__lte=now).order_by(
+        '-priority', 'run_at', 'pk'
+    )
+
+    if connections[due.db].features.has_select_for_update_skip_locked:
+        with transaction.atomic():
+            jobs = list(due.select_for_update(skip_locked=True)[:limit])
+            for job in jobs:
+                _start(job, worker_id, now)
+        return jobs
+
+    return [job for job in due[:limit] if _start(job, worker_id, now)]
+
+
+def requeue_stale():
+    """
+    Give jobs whose worker's lease ran out (e.g. it was killed) back to the
+    queue, or fail them when they have no attempts left.
+    """
+    stale = Job.objects.filter(
+        status=Job.RUNNING, locked_until__lt=timezone.now()
+    )
+    failed = stale.filter(attempts__gte=F('max_attempts')).update(
+        status=Job.FAILED,
+        finished_at=timezone.now(),
+        last_error='Lease expired',
+    )
+    requeued = stale.update(
+        status=Job.QUEUED, locked_by='', last_error='Lease expired'
+    )
+    return requeued + failed
+
+
+def enqueue_scheduled(schedule):
+    """
+    Queue a run of each task in `schedule`, which maps task names to seconds
+    between runs, unless one was queued more recently than that or is still
+    waiting or running. Returns the jobs queued.
+    """
+    now = timezone.now()
+    queued = []
+    for name, interval in schedule.items():
+        # Workers checking at the same time may both queue a run, so
+        # scheduled tasks must not mind running twice.
+        pending = Job.objects.filter(name=name).filter(
+            Q(status__in=[Job.QUEUED, Job.RUNNING])
+            | Q(created_at__gt=now - timedelta(seconds=interval))
+        )
+        if not pending.exists():
+            queued.append(REGISTRY[name].enqueue())
+    return queued
+
+
+def run_job(job_id, worker_id):
+    """
+    Run a claimed job and record the outcome. Returns (task name, outcome,
+    seconds), where outcome is 'succeeded', 'retried' or 'failed'.
+    """
+    job = Job.objects.get(pk=job_id)
+    task = REGISTRY.get(job.name)
+
+    started = time.monotonic()
+    try:
+        if task is None:
+            raise LookupError(f'Unknown task {job.name!r}')
+        task(**job.kwargs)
+    except Exception:
+        error = traceback.format_exc()
+        outcome = 'retried' if job.attempts < job.max_attempts else 'failed'
+    else:
+        error = ''
+        outcome = 'succeeded'
+    duration = time.monotonic() - started
+
+    now = timezone.now()
+    fields = {
+        'duration': duration,
+        'last_error': error,
+        'locked_by': '',
+        'locked_until': None,
+    }
+    if outcome == 'retried':
+        fields.update(
+            status=Job.QUEUED,
+            run_at=now + timedelta(seconds=retry_delay(job.attempts)),
+        )
+    else:
+        fields.update(
+            status=Job.SUCCEEDED if outcome == 'succeeded' else Job.FAILED,
+            finished_at=now,
+        )
+
+    # A worker whose lease expired no longer owns the job.
+    Job.objects.filter(
+        pk=job.pk, status=Job.RUNNING, locked_by=worker_id
+    ).update(**fields)
+
+    return job.name, outcome, duration
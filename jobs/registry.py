@@ -0,0 +1,57 @@
+from django.utils import timezone
+
+from jobs.models import Job
+
+REGISTRY = {}
+
+
+class Task:
+    def __init__(self, func, name, priority, max_attempts, timeout):
+        self.func = func
+        self.name = name
+        self.priority = priority
+        self.max_attempts = max_attempts
+        self.timeout = timeout
+
+    def __call__(self, **kwargs):
+        return self.func(**kwargs)
+
+    def enqueue(self, priority=None, run_at=None, **kwargs):
+        """
+        Queue a run of the task with `kwargs`, which must be JSON
+        serializable. Inside a transaction the job only becomes visible to
+        workers once it commits.
+        """
+        return Job.objects.create(
+            name=self.name,
+            kwargs=kwargs,
+            priority=self.priority if priority is None else priority,
+            max_attempts=self.max_attempts,
+            timeout=self.timeout,
+            run_at=run_at or timezone.now(),
+        )
+
+
+def task(name=None, priority=0, max_attempts=3, timeout=300):
+    """
+    Register a function as a task workers can run, e.g.
+
+        @task(priority=10)
+        def reindex(book_ids):
+            ...
+
+        reindex.enqueue(book_ids=[...])
+    """
+
+    def decorator(func):
+        registered = Task(
+            func,
+            name or f'{func.__module__}.{func.__name__}',
+            priority,
+            max_attempts,
+            timeout,
+        )
+        REGISTRY[registered.name] = registered
+        return registered
+
+    return decorator
@@ -0,0 +1,135 @@
+import os
+import socket
+import time
+import uuid
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+
+import django
+from django.conf import settings
+from django.db import close_old_connections, connections
+
+from jobs.metrics import WorkerMetrics
+from jobs.queue import claim, enqueue_scheduled, requeue_stale, run_job
+
+# Seconds between checks for jobs whose worker disappeared and for
+# scheduled tasks that are due.
+STALE_CHECK_INTERVAL = 60
+
+
+def _init_process():
+    # Connections inherited from the parent must not be shared.
+    django.setup()
+    connections.close_all()
+
+
+def _run(job_id, worker_id):
+    try:
+        return run_job(job_id, worker_id)
+    finally:
+        close_old_connections()
+
+
+class InlineExecutor:
+    """
+    Runs jobs in the calling thread, for debugging and tests.
+    """
+
+    def submit(self, fn, *args):
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+    def shutdown(self, wait=True):
+        pass
+
+
+class Worker:
+    def __init__(
+        self,
+        concurrency=4,
+        pool='thread',
+        poll_interval=1,
+        metrics_interval=60,
+        log=print,
+    ):
+        self.id = (
+            f'{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}'
+        )
+        self.concurrency = concurrency
+        self.pool = pool
+        self.poll_interval = poll_interval
+        self.metrics_interval = metrics_interval
+        self.log = log
+        self.metrics = WorkerMetrics()
+
+    def _executor(self):
+        if self.pool == 'inline':
+            return InlineExecutor()
+        if self.pool == 'process':
+            connections.close_all()
+            return ProcessPoolExecutor(
+                max_workers=self.concurrency, initializer=_init_process
+            )
+        return ThreadPoolExecutor(max_workers=self.concurrency)
+
+    def run(self, burst=False):
+        """
+        Process jobs until interrupted, or until the queue is empty when
+        `burst` is set.
+        """
+        executor = self._executor()
+        in_flight = {}
+        last_metrics = time.monotonic()
+        # Checked right away, so a restarted worker doesn't wait for them.
+        last_stale_check = last_metrics - STALE_CHECK_INTERVAL
+
+        try:
+            while True:
+                now = time.monotonic()
+                if now - last_stale_check >= STALE_CHECK_INTERVAL:
+                    requeue_stale()
+                    enqueue_scheduled(settings.JOB_SCHEDULE)
+                    last_stale_check = now
+                if now - last_metrics >= self.metrics_interval:
+                    self.log(self.metrics.summary())
+                    last_metrics = now
+
+                free = self.concurrency - len(in_flight)
+                if free > 0:
+                    for job in claim(self.id, free):
+                        future = executor.submit(_run, job.pk, self.id)
+                        in_flight[future] = job
+
+                if not in_flight:
+                    if burst:
+                        break
+                    time.sleep(self.poll_interval)
+                    continue
+
+                done, _ = wait(
+                    in_flight,
+                    timeout=self.poll_interval,
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    job = in_flight.pop(future)
+                    try:
+                        self.metrics.record(*future.result())
+                    except Exception as exc:
+                        # The outcome couldn't be recorded, e.g. the job was
+                        # deleted or the database went away; a job left
+                        # running is requeued once its lock expires.
+                        self.log(f'Job {job.pk} ({job.name}) crashed: {exc!r}')
+                        self.metrics.record_crash()
+        finally:
+            executor.shutdown(wait=True)
+            self.log(self.metrics.summary())
@@ -0,0 +1,19 @@
+from django.contrib import admin
+
+from loans.models import Hold, Loan
+
+
+@admin.register(Loan)
+class LoanAdmin(admin.ModelAdmin):
+    list_display = ['id', 'copy', 'patron', 'checked_out_at', 'returned_at']
+    list_select_related = ['copy__book', 'copy__publisher', 'patron']
+    list_filter = [('returned_at', admin.EmptyFieldListFilter)]
+    raw_id_fields = ['copy', 'book', 'patron']
+
+
+@admin.register(Hold)
+class HoldAdmin(admin.ModelAdmin):
+    list_display = ['id', 'book', 'patron', 'placed_at', 'status']
+    list_select_related = ['book', 'patron']
+    list_filter = ['status']
+    raw_id_fields = ['book', 'patron']
@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class LoansConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'loans'
+
+    def ready(self):
+        from loans import signals  # noqa: F401
@@ -0,0 +1,149 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from books.models import Book, BookCopy
+from loans import holds
+from loans.models import Hold, Loan
+
+
+class CopyUnavailable(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = 'This copy is already on loan.'
+    default_code = 'copy_unavailable'
+
+
+class CopyNotOnLoan(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = 'This copy is not on loan.'
+    default_code = 'copy_not_on_loan'
+
+
+class CopyOnHold(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = 'This copy is held for another patron.'
+    default_code = 'copy_on_hold'
+
+
+def checkout(copy, patron, due_at=None):
+    """
+    Lend `copy` to `patron`, fulfilling their hold on the book.
+
+    A copy kept on the hold shelf can only be checked out by the patron it
+    is kept for, and while patrons are waiting for the book a free copy only
+    by the one at the front of the queue.
+
+    The book's queue and the copy rows are locked for the duration of the
+    transaction, and the partial unique constraint on active loans stops a
+    concurrent checkout on databases without row locks.
+    """
+    now = timezone.now()
+    if due_at is None:
+        due_at = now + timedelta(days=settings.LOAN_PERIOD_DAYS)
+
+    with transaction.atomic():
+        queue = holds.lock_queue(copy.book_id)
+        copy = BookCopy.objects.select_for_update().get(pk=copy.pk)
+        if Loan.objects.filter(copy=copy, returned_at__isnull=True).exists():
+            raise CopyUnavailable
+        ready = Hold.objects.filter(copy=copy, status=Hold.READY)
+        if ready.exclude(patron=patron).exists():
+            raise CopyOnHold
+        if (
+            not queue.is_empty
+            and not ready.exists()
+            and not holds.is_front_of_queue(queue, patron)
+        ):
+            raise CopyOnHold
+
+        try:
+            with transaction.atomic():
+                loan = Loan.objects.create(
+                    copy=copy,
+                    book_id=copy.book_id,
+                    patron=patron,
+                    checked_out_at=now,
+                    due_at=due_at,
+                )
+        except IntegrityError:
+            raise CopyUnavailable
+
+        holds.fulfil_hold(copy, patron)
+
+    return loan
+
+
+def return_copy(copy):
+    """
+    Close the active loan of `copy` and hand the copy to the next patron
+    waiting for the book.
+    """
+    with transaction.atomic():
+        loan = (
+            Loan.objects.select_for_update()
+            .filter(copy=copy, returned_at__isnull=True)
+            .first()
+        )
+        if loan is None:
+            raise CopyNotOnLoan
+
+        loan.returned_at = timezone.now()
+        loan.save(update_fields=['returned_at'])
+        holds.allocate_copy(loan.copy, loan.returned_at)
+
+    return loan
+
+
+def book_availability(book_id):
+    """
+    Return the copy, active loan, hold shelf, available and waiting counts
+    of a book, or `None` for an unknown book.
+
+    This is a single query: active loans and ready holds are counted through
+    partial indexes, so returned loans and past holds are never read, and
+    the queue length comes from the book's `HoldQueue` counters.
+    """
+    on_loan = (
+        Loan.objects.filter(book=OuterRef('pk'), returned_at__isnull=True)
+        .order_by()
+        .values('book')
+        .annotate(count=Count('pk'))
+        .values('count')
+    )
+    on_hold = (
+        Hold.objects.filter(book=OuterRef('pk'), status=Hold.READY)
+        .order_by()
+        .values('book')
+        .annotate(count=Count('pk'))
+        .values('count')
+    )
+    row = (
+        Book.objects.filter(pk=book_id)
+        .annotate(
+            on_loan=Coalesce(Subquery(on_loan), Value(0)),
+            on_hold=Coalesce(Subquery(on_hold), Value(0)),
+            waiting=Coalesce(
+                F('hold_queue__issued') - F('hold_queue__served'), Value(0)
+            ),
+        )
+        .values('copy_count', 'on_loan', 'on_hold', 'waiting')
+        .first()
+    )
+    if row is None:
+        return None
+
+    return {
+        'copies': row['copy_count'],
+        'on_loan': row['on_loan'],
+        'on_hold': row['on_hold'],
+        'available': max(
+            row['copy_count'] - row['on_loan'] - row['on_hold'], 0
+        ),
+        'waiting': row['waiting'],
+    }
@@ -0,0 +1,269 @@
+"""
+Hold queues.
+
+Waiting holds of a book carry dense tickets: `HoldQueue.served` is the ticket
+of the last hold taken off the front of the queue and `HoldQueue.issued` the
+ticket of the last one placed, so the waiting holds are numbered
+`served + 1 .. issued` and a hold's position is `ticket - served`, without
+counting rows.
+
+Taking the front hold only moves `served`, and leaving from the middle of the
+queue shifts the tickets behind it down by one in a single UPDATE. Every
+change happens with the book's queue row locked.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Exists, F, OuterRef
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from books.models import BookCopy
+from loans.models import Hold, HoldQueue, Loan
+
+
+class HoldAlreadyPlaced(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = 'You already have a hold on this book.'
+    default_code = 'hold_already_placed'
+
+
+class HoldNotActive(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = 'This hold is no longer active.'
+    default_code = 'hold_not_active'
+
+
+def lock_queue(book_id):
+    HoldQueue.objects.get_or_create(book_id=book_id)
+    return HoldQueue.objects.select_for_update().get(book_id=book_id)
+
+
+def is_free(copy):
+    """
+    Whether `copy` is neither on loan nor waiting on the hold shelf.
+    """
+    return not (
+        Loan.objects.filter(copy=copy, returned_at__isnull=True).exists()
+        or Hold.objects.filter(copy=copy, status=Hold.READY).exists()
+    )
+
+
+def _pickup_deadline(now):
+    return now + timedelta(days=settings.HOLD_PICKUP_DAYS)
+
+
+def _free_copy(book_id):
+    """
+    Return a copy of the book that is neither on loan nor waiting on the
+    hold shelf.
+    """
+    return (
+        BookCopy.objects.filter(book_id=book_id)
+        .exclude(
+            Exists(
+                Loan.objects.filter(
+                    copy=OuterRef('pk'), returned_at__isnull=True
+                )
+            )
+        )
+        .exclude(
+            Exists(Hold.objects.filter(copy=OuterRef('pk'), status=Hold.READY))
+        )
+        .order_by('pk')
+        .first()
+    )
+
+
+def _leave_queue(queue, hold, status):
+    """
+    Take a waiting hold out of its (locked) queue.
+    """
+    if hold.ticket == queue.served + 1:
+        queue.served = hold.ticket
+    else:
+        Hold.objects.filter(
+            book_id=queue.book_id, status=Hold.WAITING, ticket__gt=hold.ticket
+        ).update(ticket=F('ticket') - 1)
+        queue.issued -= 1
+    queue.save(update_fields=['issued', 'served'])
+
+    hold.status = status
+    hold.save(update_fields=['status'])
+
+
+def place_hold(book_id, patron):
+    """
+    Put `patron` at the back of the book's queue. When nobody is waiting and
+    a copy is free, the hold is ready for pickup straight away.
+    """
+    now = timezone.now()
+    try:
+        with transaction.atomic():
+            queue = lock_queue(book_id)
+            copy = _free_copy(book_id) if queue.is_empty else None
+            queue.issued += 1
+            hold = Hold(
+                book_id=book_id,
+                patron=patron,
+                placed_at=now,
+                ticket=queue.issued,
+            )
+            if copy is not None:
+                queue.served = queue.issued
+                hold.status = Hold.READY
+                hold.copy = copy
+                hold.ready_at = now
+                hold.expires_at = _pickup_deadline(now)
+
+            hold.save(force_insert=True)
+            queue.save(update_fields=['issued', 'served'])
+    except IntegrityError:
+        raise HoldAlreadyPlaced
+
+    return hold
+
+
+def allocate_copy(copy, now=None):
+    """
+    Hand a copy that just became free to the first eligible waiting patron
+    of its book, and return their hold (or `None` if nobody is waiting).
+
+    The front of the queue is found through the partial (book, ticket) index
+    on waiting holds; holds of deactivated patrons are dropped on the way.
+    """
+    now = now or timezone.now()
+    with transaction.atomic():
+        queue = lock_queue(copy.book_id)
+        while not queue.is_empty:
+            hold = (
+                Hold.objects.select_related('patron')
+                .filter(book_id=copy.book_id, status=Hold.WAITING)
+                .order_by('ticket')
+                .first()
+            )
+            if hold is None:
+                break
+
+            if not hold.patron.is_active:
+                _leave_queue(queue, hold, Hold.CANCELLED)
+                continue
+
+            queue.served = hold.ticket
+            queue.save(update_fields=['served'])
+
+            hold.status = Hold.READY
+            hold.copy = copy
+            hold.ready_at = now
+            hold.expires_at = _pickup_deadline(now)
+            hold.save(
+                update_fields=['status', 'copy', 'ready_at', 'expires_at']
+            )
+            return hold
+
+    return None
+
+
+def allocate_added_copy(copy):
+    """
+    Hand a copy that was just added to its book, created or moved there, to
+    the book's queue when it is free.
+    """
+    with transaction.atomic():
+        lock_queue(copy.book_id)
+        if not is_free(copy):
+            return None
+        return allocate_copy(copy)
+
+
+def is_front_of_queue(queue, patron):
+    return Hold.objects.filter(
+        book_id=queue.book_id,
+        patron=patron,
+        status=Hold.WAITING,
+        ticket=queue.served + 1,
+    ).exists()
+
+
+def cancel_hold(hold):
+    with transaction.atomic():
+        queue = lock_queue(hold.book_id)
+        hold = Hold.objects.select_for_update().get(pk=hold.pk)
+
+        if hold.status == Hold.WAITING:
+            _leave_queue(queue, hold, Hold.CANCELLED)
+        elif hold.status == Hold.READY:
+            hold.status = Hold.CANCELLED
+            hold.save(update_fields=['status'])
+            allocate_copy(hold.copy)
+        else:
+            raise HoldNotActive
+
+    return hold
+
+
+def fulfil_hold(copy, patron):
+    """
+    Called when `patron` checks out `copy`: completes the hold the copy was
+    kept for, or else the patron's place in the book's queue.
+    """
+    queue = lock_queue(copy.book_id)
+    hold = (
+        Hold.objects.select_for_update()
+        .filter(
+            book_id=copy.book_id,
+            patron=patron,
+            status__in=[Hold.WAITING, Hold.READY],
+        )
+        .first()
+    )
+    if hold is None:
+        return None
+
+    if hold.status == Hold.WAITING:
+        _leave_queue(queue, hold, Hold.FULFILLED)
+    else:
+        hold.status = Hold.FULFILLED
+        hold.save(update_fields=['status'])
+        if hold.copy_id != copy.pk:
+            # They took another copy, so pass the one kept for them on.
+            allocate_copy(hold.copy)
+
+    return hold
+
+
+def expire_ready_holds(batch_size=500, now=None):
+    """
+    Expire up to `batch_size` ready holds whose pickup deadline has passed
+    and pass their copies on. Returns the number of holds expired.
+
+    Like every other change to a queue, the books' queue rows are locked
+    before their holds, in book order. Books whose queue is locked by a
+    concurrent sweeper or request are skipped until the next run.
+    """
+    now = now or timezone.now()
+    expired = Hold.objects.filter(status=Hold.READY, expires_at__lte=now)
+    with transaction.atomic():
+        oldest = expired.order_by('expires_at')[:batch_size]
+        book_ids = set(oldest.values_list('book_id', flat=True))
+        locked = list(
+            HoldQueue.objects.select_for_update(skip_locked=True)
+            .filter(book_id__in=book_ids)
+            .order_by('book_id')
+            .values_list('book_id', flat=True)
+        )
+        holds = list(
+            expired.select_for_update(of=('self',))
+            .select_related('copy')
+            .filter(book_id__in=locked)
+            .order_by('expires_at')[:batch_size]
+        )
+        Hold.objects.filter(pk__in=[hold.pk for hold in holds]).update(
+            status=Hold.EXPIRED
+        )
+        for hold in sorted(holds, key=lambda hold: hold.book_id):
+            allocate_copy(hold.copy, now)
+
+    return len(holds)
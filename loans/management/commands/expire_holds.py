@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from loans.holds import expire_ready_holds
+
+
+class Command(BaseCommand):
+    help = (
+        'Expire holds whose pickup deadline has passed and pass their copies '
+        'on to the next patron in line. Meant to run periodically, e.g. '
+        'every few minutes from cron.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Holds expired per transaction.',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        total = 0
+        while True:
+            expired = expire_ready_holds(batch_size)
+            total += expired
+            if expired < batch_size:
+                break
+
+        self.stdout.write(self.style.SUCCESS(f'{total} holds expired'))
@@ -0,0 +1,135 @@
+# Generated by Django 4.1.13 on 2026-10-19 17:05
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+import utils.uuids
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('books', '0016_bookcopy_book_date_published'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Loan',
+            fields=[
+                (
+                    'id',
+                    models.UUIDField(
+                        default=utils.uuids.generate_uuid,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ('checked_out_at', models.DateTimeField()),
+                ('due_at', models.DateTimeField()),
+                ('returned_at', models.DateTimeField(blank=True, null=True)),
+                (
+                    'book',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name='loans',
+                        to='books.book',
+                    ),
+                ),
+                (
+                    'copy',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name='loans',
+                        to='books.bookcopy',
+                    ),
+                ),
+                (
+                    'patron',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name='loans',
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Hold',
+            fields=[
+                (
+                    'id',
+                    models.UUIDField(
+                        default=utils.uuids.generate_uuid,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ('placed_at', models.DateTimeField()),
+                (
+                    'status',
+                    models.CharField(
+                        choices=[
+                            ('waiting', 'Waiting'),
+                            ('fulfilled', 'Fulfilled'),
+                            ('cancelled', 'Cancelled'),
+                        ],
+                        default='waiting',
+                        max_length=10,
+                    ),
+                ),
+                (
+                    'book',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name='holds',
+                        to='books.book',
+                    ),
+                ),
+                (
+                    'patron',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name='holds',
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='loan',
+            index=models.Index(
+                condition=models.Q(('returned_at__isnull', True)),
+                fields=['book'],
+                name='loans_active_by_book',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='loan',
+            index=models.Index(
+                fields=['patron', '-checked_out_at'],
+                name='loans_loan_patron__658a50_idx',
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name='loan',
+            constraint=models.UniqueConstraint(
+                condition=models.Q(('returned_at__isnull', True)),
+                fields=('copy',),
+                name='loans_one_active_loan_per_copy',
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name='hold',
+            constraint=models.UniqueConstraint(
+                condition=models.Q(('status', 'waiting')),
+                fields=('book', 'patron'),
+                name='loans_one_waiting_hold_per_patron',
+            ),
+        ),
+    ]
@@ -0,0 +1,136 @@
+# Generated by Django 4.1.13 on 2026-10-19 17:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def number_waiting_holds(apps, schema_editor):
+    Hold = apps.get_model('loans', 'Hold')
+    HoldQueue = apps.get_model('loans', 'HoldQueue')
+
+    queues = {}
+    holds = Hold.objects.filter(status='waiting').order_by(
+        'book_id', 'placed_at', 'id'
+    )
+    for hold in holds.iterator():
+        queues[hold.book_id] = hold.ticket = queues.get(hold.book_id, 0) + 1
+        hold.save(update_fields=['ticket'])
+
+    HoldQueue.objects.bulk_create(
+        HoldQueue(book_id=book_id, issued=issued)
+        for book_id, issued in queues.items()
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('books', '0016_bookcopy_book_date_published'),
+        ('loans', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HoldQueue',
+            fields=[
+                (
+                    'book',
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name='hold_queue',
+                        serialize=False,
+                        to='books.book',
+                    ),
+                ),
+                ('issued', models.PositiveBigIntegerField(default=0)),
+                ('served', models.PositiveBigIntegerField(default=0)),
+            ],
+        ),
+        migrations.RemoveConstraint(
+            model_name='hold',
+            name='loans_one_waiting_hold_per_patron',
+        ),
+        migrations.AddField(
+            model_name='hold',
+            name='copy',
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name='holds',
+                to='books.bookcopy',
+            ),
+        ),
+        migrations.AddField(
+            model_name='hold',
+            name='expires_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='hold',
+            name='ready_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='hold',
+            name='ticket',
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.RunPython(number_waiting_holds, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='hold',
+            name='status',
+            field=models.CharField(
+                choices=[
+                    ('waiting', 'Waiting'),
+                    ('ready', 'Ready for pickup'),
+                    ('fulfilled', 'Fulfilled'),
+                    ('cancelled', 'Cancelled'),
+                    ('expired', 'Expired'),
+                ],
+                default='waiting',
+                max_length=10,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='hold',
+            index=models.Index(
+                condition=models.Q(('status', 'waiting')),
+                fields=['book', 'ticket'],
+                name='loans_waiting_holds',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='hold',
+            index=models.Index(
+                condition=models.Q(('status', 'ready')),
+                fields=['book'],
+                name='loans_ready_holds_by_book',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='hold',
+            index=models.Index(
+                condition=models.Q(('status', 'ready')),
+                fields=['expires_at'],
+                name='loans_ready_holds_by_expiry',
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name='hold',
+            constraint=models.UniqueConstraint(
+                condition=models.Q(('status__in', ['waiting', 'ready'])),
+                fields=('book', 'patron'),
+                name='loans_one_active_hold_per_patron',
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name='hold',
+            constraint=models.UniqueConstraint(
+                condition=models.Q(('status', 'ready')),
+                fields=('copy',),
+                name='loans_one_ready_hold_per_copy',
+            ),
+        ),
+    ]
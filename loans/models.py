@@ -0,0 +1,175 @@
+from django.conf import settings
+from django.db import models
+from django.db.models import Q
+
+from books.models import Book, BookCopy
+from utils.uuids import generate_uuid
+
+
+class Loan(models.Model):
+    id = models.UUIDField(
+        primary_key=True, default=generate_uuid, editable=False
+    )
+    copy = models.ForeignKey(
+        BookCopy, on_delete=models.PROTECT, related_name='loans'
+    )
+    # Copied from `copy` so availability is answered from this table alone.
+    book = models.ForeignKey(
+        Book, on_delete=models.PROTECT, related_name='loans'
+    )
+    patron = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.PROTECT,
+        related_name='loans',
+    )
+    checked_out_at = models.DateTimeField()
+    due_at = models.DateTimeField()
+    returned_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['copy'],
+                condition=Q(returned_at__isnull=True),
+                name='loans_one_active_loan_per_copy',
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=['book'],
+                condition=Q(returned_at__isnull=True),
+                name='loans_active_by_book',
+            ),
+            models.Index(fields=['patron', '-checked_out_at']),
+        ]
+
+    def __str__(self):
+        return f'{self.copy_id} -> {self.patron_id}'
+
+    @property
+    def is_active(self):
+        return self.returned_at is None
+
+
+class HoldQueue(models.Model):
+    """
+    Ticket counters of a book's hold queue (see loans.holds).
+    """
+
+    book = models.OneToOneField(
+        Book,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='hold_queue',
+    )
+    issued = models.PositiveBigIntegerField(default=0)
+    served = models.PositiveBigIntegerField(default=0)
+
+    def __str__(self):
+        return f'{self.book_id} ({self.length} waiting)'
+
+    @property
+    def length(self):
+        return self.issued - self.served
+
+    @property
+    def is_empty(self):
+        return self.issued == self.served
+
+
+class Hold(models.Model):
+    WAITING = 'waiting'
+    READY = 'ready'
+    FULFILLED = 'fulfilled'
+    CANCELLED = 'cancelled'
+    EXPIRED = 'expired'
+    STATUS_CHOICES = [
+        (WAITING, 'Waiting'),
+        (READY, 'Ready for pickup'),
+        (FULFILLED, 'Fulfilled'),
+        (CANCELLED, 'Cancelled'),
+        (EXPIRED, 'Expired'),
+    ]
+
+    id = models.UUIDField(
+        primary_key=True, default=generate_uuid, editable=False
+    )
+    book = models.ForeignKey(
+        Book, on_delete=models.PROTECT, related_name='holds'
+    )
+    patron = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.PROTECT,
+        related_name='holds',
+    )
+    placed_at = models.DateTimeField()
+    status = models.CharField(
+        max_length=10, choices=STATUS_CHOICES, default=WAITING
+    )
+    ticket = models.PositiveBigIntegerField(default=0)
+    # The copy kept for the patron once the hold is ready.
+    copy = models.ForeignKey(
+        BookCopy,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name='holds',
+    )
+    ready_at = models.DateTimeField(null=True, blank=True)
+    expires_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['book', 'patron'],
+                condition=Q(status__in=['waiting', 'ready']),
+                name='loans_one_active_hold_per_patron',
+            ),
+            models.UniqueConstraint(
+                fields=['copy'],
+                condition=Q(status='ready'),
+                name='loans_one_ready_hold_per_copy',
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=['book', 'ticket'],
+                condition=Q(status='waiting'),
+                name='loans_waiting_holds',
+            ),
+            models.Index(
+                fields=['book'],
+                condition=Q(status='ready'),
+                name='loans_ready_holds_by_book',
+            ),
+            models.Index(
+                fields=['expires_at'],
+                condition=Q(status='ready'),
+                name='loans_ready_holds_by_expiry',
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.book_id} <- {self.patron_id}'
+
+    @property
+    def position(self):
+        """
+        1 for the front of the queue, 0 once the hold is ready for pickup
+        and `None` when it is no longer active.
+
+        Querysets can annotate `queue_served` to avoid reading the queue.
+        """
+        if self.status == self.READY:
+            return 0
+        if self.status != self.WAITING:
+            return None
+
+        served = getattr(self, 'queue_served', None)
+        if served is None:
+            served = (
+                HoldQueue.objects.filter(book_id=self.book_id)
+                .values_list('served', flat=True)
+                .first()
+            ) or 0
+        return self.ticket - served
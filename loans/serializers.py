@@ -0,0 +1,61 @@
+from django.contrib.auth import get_user_model
+from rest_flex_fields import FlexFieldsModelSerializer
+from rest_framework import serializers
+
+from books.serializers import BookCopySerializer
+from loans.models import Hold, Loan
+from utils.serializers import ModelSerializerMixin
+
+
+class LoanSerializer(ModelSerializerMixin, FlexFieldsModelSerializer):
+    class Meta:
+        model = Loan
+        fields = [
+            'url',
+            'id',
+            'copy',
+            'book',
+            'patron',
+            'checked_out_at',
+            'due_at',
+            'returned_at',
+        ]
+        read_only_fields = fields
+        expandable_fields = {'copy': BookCopySerializer}
+
+
+class HoldSerializer(ModelSerializerMixin, FlexFieldsModelSerializer):
+    position = serializers.IntegerField(read_only=True, allow_null=True)
+
+    class Meta:
+        model = Hold
+        fields = [
+            'url',
+            'id',
+            'book',
+            'patron',
+            'placed_at',
+            'status',
+            'position',
+            'copy',
+            'ready_at',
+            'expires_at',
+        ]
+        read_only_fields = fields
+
+
+class CheckoutSerializer(serializers.Serializer):
+    # Only staff can check a copy out on behalf of a patron.
+    patron = serializers.PrimaryKeyRelatedField(
+        queryset=get_user_model().objects.all(), required=False
+    )
+    # Only staff can set the due date.
+    due_at = serializers.DateTimeField(required=False)
+
+
+class AvailabilitySerializer(serializers.Serializer):
+    copies = serializers.IntegerField()
+    on_loan = serializers.IntegerField()
+    on_hold = serializers.IntegerField()
+    available = serializers.IntegerField()
+    waiting = serializers.IntegerField()
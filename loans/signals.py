@@ -0,0 +1,25 @@
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from books.models import BookCopy
+from books.signals import copy_moved
+from loans import holds
+from loans.models import Loan
+
+
+def allocate_on_commit(copy):
+    # Once the copy is visible to the requests taking the queue's lock.
+    transaction.on_commit(lambda: holds.allocate_added_copy(copy))
+
+
+@receiver(post_save, sender=BookCopy)
+def copy_saved(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        allocate_on_commit(instance)
+
+
+@receiver(copy_moved, sender=BookCopy)
+def copy_moved_to_book(sender, copy, previous_book_id, **kwargs):
+    Loan.objects.filter(copy=copy).update(book_id=copy.book_id)
+    allocate_on_commit(copy)
@@ -0,0 +1,143 @@
+from django.core.exceptions import ValidationError
+from django.db.models import F
+from django.http import Http404
+from django_filters.rest_framework import DjangoFilterBackend
+from drf_spectacular.utils import extend_schema
+from rest_framework import permissions, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.response import Response
+
+from loans import circulation, holds
+from loans.models import Hold, Loan
+from loans.serializers import (
+    AvailabilitySerializer,
+    CheckoutSerializer,
+    HoldSerializer,
+    LoanSerializer,
+)
+from utils.compiled_serializers import CompiledReadMixin
+
+
+class PatronQuerysetMixin:
+    """
+    Limits non-staff users to their own records.
+    """
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if not self.request.user.is_staff:
+            queryset = queryset.filter(patron=self.request.user)
+        return queryset
+
+
+class LoanViewSet(
+    PatronQuerysetMixin, CompiledReadMixin, viewsets.ReadOnlyModelViewSet
+):
+    queryset = Loan.objects.order_by('-checked_out_at', 'id')
+    serializer_class = LoanSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = {
+        'copy': ['exact'],
+        'book': ['exact'],
+        'patron': ['exact'],
+        'returned_at': ['isnull'],
+    }
+
+
+class HoldViewSet(
+    PatronQuerysetMixin, CompiledReadMixin, viewsets.ReadOnlyModelViewSet
+):
+    queryset = Hold.objects.annotate(
+        queue_served=F('book__hold_queue__served')
+    ).order_by('placed_at', 'id')
+    serializer_class = HoldSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = ['book', 'patron', 'status']
+
+    @extend_schema(request=None, responses=HoldSerializer)
+    @action(detail=True, methods=['post'])
+    def cancel(self, request, pk=None):
+        hold = holds.cancel_hold(self.get_object())
+        return Response(self.get_serializer(hold).data)
+
+
+class BookCopyCirculationMixin:
+    """
+    Checkout, return and hold actions for `BookCopyViewSet`.
+    """
+
+    @extend_schema(request=CheckoutSerializer, responses=LoanSerializer)
+    @action(
+        detail=True,
+        methods=['post'],
+        serializer_class=CheckoutSerializer,
+        permission_classes=[permissions.IsAuthenticated],
+    )
+    def checkout(self, request, pk=None):
+        # Checked before validation, so patron ids can't be probed.
+        if not request.user.is_staff and (
+            'patron' in request.data or 'due_at' in request.data
+        ):
+            raise PermissionDenied
+
+        copy = self.get_object()
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        loan = circulation.checkout(
+            copy,
+            serializer.validated_data.get('patron', request.user),
+            serializer.validated_data.get('due_at'),
+        )
+        return Response(
+            LoanSerializer(loan, context=self.get_serializer_context()).data,
+            status=status.HTTP_201_CREATED,
+        )
+
+    @extend_schema(request=None, responses=LoanSerializer)
+    @action(
+        detail=True,
+        methods=['post'],
+        url_path='return',
+        url_name='return',
+        serializer_class=LoanSerializer,
+    )
+    def return_copy(self, request, pk=None):
+        loan = circulation.return_copy(self.get_object())
+        return Response(self.get_serializer(loan).data)
+
+    @extend_schema(request=None, responses=HoldSerializer)
+    @action(
+        detail=True,
+        methods=['post'],
+        serializer_class=HoldSerializer,
+        permission_classes=[permissions.IsAuthenticated],
+    )
+    def hold(self, request, pk=None):
+        copy = self.get_object()
+        hold = holds.place_hold(copy.book_id, request.user)
+        return Response(
+            self.get_serializer(hold).data, status=status.HTTP_201_CREATED
+        )
+
+
+class BookAvailabilityMixin:
+    """
+    Availability action for `BooksViewSet`.
+    """
+
+    @extend_schema(responses=AvailabilitySerializer)
+    @action(
+        detail=True, methods=['get'], serializer_class=AvailabilitySerializer
+    )
+    def availability(self, request, pk=None):
+        try:
+            availability = circulation.book_availability(pk)
+        except (TypeError, ValueError, ValidationError):
+            availability = None
+        if availability is None:
+            raise Http404
+        return Response(availability)
@@ -0,0 +1,341 @@
+"""
+Django settings for setup project shared by the `dev` and `prod` modules.
+
+Generated by 'django-admin startproject' using Django 4.1.5.
+
+For more information on this file, see
+https://docs.djangoproject.com/en/4.1/topics/settings/
+
+For the full list of settings and their values, see
+https://docs.djangoproject.com/en/4.1/ref/settings/
+"""
+
+import os
+from pathlib import Path
+
+# Build paths inside the project like this: BASE_DIR / 'subdir'.
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+
+
+# Application definition
+
+INSTALLED_APPS = [
+    'django.contrib.admin',
+    'django.contrib.auth',
+    'django.contrib.contenttypes',
+    'django.contrib.sessions',
+    'django.contrib.messages',
+    'django.contrib.staticfiles',
+    'django_filters',
+    'rest_framework',
+    'rest_framework.authtoken',
+    'drf_spectacular',
+    'books',
+    'authors',
+    'loans',
+    'changes',
+    'webhooks',
+    'jobs',
+    'tokens',
+    'throttling',
+    'utils',
+]
+
+MIDDLEWARE = [
+    'django.middleware.security.SecurityMiddleware',
+    'utils.middleware.StaticFilesMiddleware',
+    'throttling.middleware.ConcurrencyLimitMiddleware',
+    'utils.middleware.CompressionMiddleware',
+    'utils.middleware.SessionMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'utils.middleware.CsrfViewMiddleware',
+    'utils.middleware.AuthenticationMiddleware',
+    'utils.middleware.MessageMiddleware',
+    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'utils.middleware.CoalescingMiddleware',
+]
+
+ROOT_URLCONF = 'setup.urls'
+
+TEMPLATES = [
+    {
+        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'DIRS': [],
+        'APP_DIRS': True,
+        'OPTIONS': {
+            'context_processors': [
+                'django.template.context_processors.debug',
+                'django.template.context_processors.request',
+                'django.contrib.auth.context_processors.auth',
+                'django.contrib.messages.context_processors.messages',
+            ],
+        },
+    },
+]
+
+WSGI_APPLICATION = 'setup.wsgi.application'
+
+
+# Database
+# https://docs.djangoproject.com/en/4.1/ref/settings/#databases
+
+DATABASES = {
+    'default': {
+        'ENGINE': os.environ.get('SQL_ENGINE', 'django.db.backends.sqlite3'),
+        'NAME': os.environ.get('SQL_DATABASE', BASE_DIR / 'db.sqlite3'),
+        'USER': os.environ.get('SQL_USER', 'user'),
+        'PASSWORD': os.environ.get('SQL_PASSWORD', 'password'),
+        'HOST': os.environ.get('SQL_HOST', 'localhost'),
+        'PORT': os.environ.get('SQL_PORT', '5432'),
+    }
+}
+
+# Django REST Framework
+
+REST_FRAMEWORK = {
+    'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+    'DEFAULT_AUTHENTICATION_CLASSES': [
+        'rest_framework.authentication.SessionAuthentication',
+        'rest_framework.authentication.BasicAuthentication',
+        'rest_framework.authentication.TokenAuthentication',
+        'tokens.authentication.SignedTokenAuthentication',
+    ],
+    # Rates of throttling.throttles.TokenBucketThrottle, which the views
+    # with costly searches and expansions use.
+    'DEFAULT_THROTTLE_RATES': {
+        'anon': '120/min',
+        'user': '600/min',
+    },
+    # Anonymous clients are throttled by the address NUM_PROXIES entries
+    # from the end of X-Forwarded-For, or REMOTE_ADDR with no proxies, so
+    # clients can't pick their own address.
+    'NUM_PROXIES': int(os.environ.get('NUM_PROXIES', 0)),
+    'DEFAULT_FILTER_BACKENDS': [
+        'django_filters.rest_framework.DjangoFilterBackend'
+    ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'utils.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+        'utils.renderers.MessagePackRenderer',
+        'utils.renderers.CBORRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'rest_framework.parsers.JSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+        'utils.parsers.MessagePackParser',
+        'utils.parsers.CBORParser',
+    ],
+    'DEFAULT_PAGINATION_CLASS': 'utils.pagination.LimitOffsetPagination',
+    'PAGE_SIZE': 10,
+}
+
+# Serve list and retrieve responses through utils.compiled_serializers,
+# which builds the same payloads from `.values()` rows.
+
+COMPILED_SERIALIZERS = True
+
+# List pages with a `limit` of at least this many items are streamed to the
+# client as they are encoded instead of being built in memory first.
+
+STREAMING_LIST_THRESHOLD = 1000
+
+# Response compression (utils.middleware.CompressionMiddleware), in order of
+# preference. Bodies smaller than COMPRESSION_MIN_SIZE bytes are sent as is.
+
+COMPRESSION_ENCODINGS = ['zstd', 'br', 'gzip']
+
+COMPRESSION_MIN_SIZE = 200
+
+# Compressed bodies of up to COMPRESSION_CACHE_MAX_SIZE bytes are kept in the
+# COMPRESSION_CACHE_ALIAS cache for COMPRESSION_CACHE_TTL seconds, so the same
+# body is compressed once per coding. Leave COMPRESSION_CACHE_ALIAS empty to
+# compress every response instead.
+
+COMPRESSION_CACHE_ALIAS = os.environ.get('COMPRESSION_CACHE_ALIAS', 'default')
+
+COMPRESSION_CACHE_TTL = 300
+
+COMPRESSION_CACHE_MAX_SIZE = 1024 * 1024
+
+# drf-spectacular
+
+SPECTACULAR_SETTINGS = {
+    'TITLE': 'Library System API',
+    'DESCRIPTION': 'OpenAPI 3.0 schema for Library System API',
+    'VERSION': '1.0.0',
+    # The apps' schema extensions are imported when a schema is generated
+    # rather than at startup.
+    'PREPROCESSING_HOOKS': ['utils.schema.load_schema_extensions'],
+}
+
+# utils.schema_views.SchemaView serves the schema stored here by
+# `manage.py build_schema` for the running CODE_VERSION. Without an explicit
+# version it is derived from a hash of the project's sources.
+
+SCHEMA_CACHE_DIR = BASE_DIR / 'schema_cache'
+
+CODE_VERSION = os.environ.get('CODE_VERSION')
+
+
+# Generate time-ordered UUIDv7 primary keys for new Author, Book and
+# BookCopy rows instead of random UUIDv4 ones (see benchmarks/uuid_inserts.py).
+
+TIME_ORDERED_UUIDS = os.environ.get('TIME_ORDERED_UUIDS', '') == '1'
+
+
+# Default loan period of a checkout, in days.
+
+LOAN_PERIOD_DAYS = 21
+
+# Days a copy returned for a waiting patron is kept on the hold shelf before
+# `manage.py expire_holds` passes it on.
+
+HOLD_PICKUP_DAYS = 3
+
+
+# Changes older than this many days are deleted by `manage.py prune_changes`
+# once every active webhook subscription has received them.
+
+CHANGE_FEED_RETENTION_DAYS = 90
+
+
+# Tasks the job workers queue on a schedule, with the seconds between runs
+# (see jobs.queue.enqueue_scheduled).
+
+JOB_SCHEDULE = {
+    'throttling.purge_full_buckets': 60 * 60,
+    'tokens.purge_revoked_tokens': 60 * 60,
+}
+
+
+# Public base URL of the API, used for links in webhook payloads.
+
+SITE_URL = os.environ.get('SITE_URL', 'http://localhost:8000')
+
+
+# Requests under these paths without a session cookie skip the session, CSRF,
+# authentication and messages middleware (see utils.middleware).
+
+SESSIONLESS_PATHS = ('/api/',)
+
+
+# Lifetime of the signed tokens from /api/auth/signed-token/, in seconds, and
+# how often each process reloads the list of revoked ones.
+
+SIGNED_TOKEN_LIFETIME = 60 * 60
+
+TOKEN_REVOCATION_REFRESH_SECONDS = 30
+
+
+# Extra tokens a throttled request costs for each of these query parameters
+# it uses, unless the view sets its own `throttle_costs`.
+
+THROTTLE_COSTS = {'search': 2, 'expand': 2}
+
+
+# Requests in flight across all workers of a host, counted with lock files
+# in CONCURRENCY_LOCK_DIR. Requests over the limit get a 503 asking clients
+# to retry after CONCURRENCY_RETRY_AFTER seconds; 0 disables the limit.
+
+MAX_CONCURRENT_REQUESTS = int(os.environ.get('MAX_CONCURRENT_REQUESTS', 64))
+
+CONCURRENCY_LOCK_DIR = os.environ.get(
+    'CONCURRENCY_LOCK_DIR', '/tmp/library-system-api/concurrency'
+)
+
+CONCURRENCY_RETRY_AFTER = 1
+
+
+# Identical concurrent anonymous GETs wait up to COALESCE_TIMEOUT seconds
+# for the first one and share its response (see utils.middleware). Set
+# COALESCE_CACHE_ALIAS to a cache shared by the workers to coalesce across
+# them too; their responses are then reused for COALESCE_CACHE_TTL seconds.
+
+COALESCE_REQUESTS = True
+
+COALESCE_TIMEOUT = 10
+
+COALESCE_CACHE_ALIAS = os.environ.get('COALESCE_CACHE_ALIAS')
+
+COALESCE_CACHE_TTL = 1
+
+
+# How often each process checks whether its cached category and publisher
+# names are stale (see books.reference).
+
+REFERENCE_CACHE_CHECK_SECONDS = 5
+
+
+# URLs `manage.py warm_caches` requests, along with the WARMUP_ACCESS_LOG_TOP
+# most requested ones of WARMUP_ACCESS_LOG when set. With WARMUP_ON_STARTUP,
+# every WSGI worker requests them before it takes traffic.
+
+WARMUP_URLS = [
+    '/api/',
+    '/api/books/',
+    '/api/book_copies/?expand=book',
+    '/api/schema/',
+]
+
+WARMUP_ACCESS_LOG = os.environ.get('WARMUP_ACCESS_LOG')
+
+WARMUP_ACCESS_LOG_TOP = 20
+
+WARMUP_ON_STARTUP = os.environ.get('WARMUP_ON_STARTUP') == '1'
+
+
+# Password validation
+# https://docs.djangoproject.com/en/4.1/ref/settings/#auth-password-validators
+
+AUTH_PASSWORD_VALIDATORS = [
+    {
+        'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
+    },
+    {
+        'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator',
+    },
+    {
+        'NAME': 'django.contrib.auth.password_validation.CommonPasswordValidator',
+    },
+    {
+        'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator',
+    },
+]
+
+
+# Internationalization
+# https://docs.djangoproject.com/en/4.1/topics/i18n/
+
+LANGUAGE_CODE = 'en-us'
+
+TIME_ZONE = 'UTC'
+
+USE_I18N = True
+
+USE_TZ = True
+
+
+# Static files (CSS, JavaScript, Images)
+# https://docs.djangoproject.com/en/4.1/howto/static-files/
+
+STATIC_URL = '/static/'
+
+STATIC_ROOT = os.environ.get('STATIC_ROOT', '/static/')
+
+# With SERVE_STATIC, utils.middleware.StaticFilesMiddleware serves the
+# collected static files itself. Clients cache files requested by their
+# unhashed names for STATIC_MAX_AGE seconds.
+
+SERVE_STATIC = os.environ.get('SERVE_STATIC') == '1'
+
+STATIC_MAX_AGE = 60
+
+MEDIA_URL = '/media/'
+
+MEDIA_ROOT = os.environ.get('MEDIA_ROOT', '/media/')
+
+# Default primary key field type
+# https://docs.djangoproject.com/en/4.1/ref/settings/#default-auto-field
+
+DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
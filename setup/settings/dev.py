@@ -0,0 +1,17 @@
+"""
+Development settings: debug on and the developer tools installed.
+"""
+
+from setup.settings.base import *  # noqa: F401,F403
+from setup.settings.base import INSTALLED_APPS
+
+# SECURITY WARNING: keep the secret key used in production secret!
+SECRET_KEY = (
+    'django-insecure-k%-*kyrv5pbb-lzj!4o=(90pf1xmgek&)lh-eiz7o0twul$^5$'
+)
+
+DEBUG = True
+
+ALLOWED_HOSTS = []
+
+INSTALLED_APPS = INSTALLED_APPS + ['django_extensions']
@@ -0,0 +1,75 @@
+"""
+Production settings, read from the environment.
+
+`manage.py check_performance` flags settings here that would slow the
+service down.
+
+See https://docs.djangoproject.com/en/4.1/howto/deployment/checklist/
+"""
+
+import copy
+import os
+
+from setup.settings import base
+from setup.settings.base import *  # noqa: F401,F403
+
+SECRET_KEY = os.environ['SECRET_KEY']
+
+DEBUG = False
+
+ALLOWED_HOSTS = [
+    host.strip()
+    for host in os.environ.get('ALLOWED_HOSTS', '').split(',')
+    if host.strip()
+]
+
+
+# Keep database connections open for CONN_MAX_AGE seconds instead of opening
+# one per request, checking they still work before reusing them.
+
+DATABASES = copy.deepcopy(base.DATABASES)
+
+DATABASES['default']['CONN_MAX_AGE'] = int(os.environ.get('CONN_MAX_AGE', 600))
+
+DATABASES['default']['CONN_HEALTH_CHECKS'] = True
+
+
+# Point CACHE_BACKEND and CACHE_LOCATION at a cache the workers share, e.g.
+# django.core.cache.backends.redis.RedisCache and redis://cache:6379/0, to
+# share the cache between them. Sessions are read through it too.
+
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get(
+            'CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'
+        ),
+        'LOCATION': os.environ.get('CACHE_LOCATION', ''),
+        'TIMEOUT': int(os.environ.get('CACHE_TIMEOUT', 300)),
+    }
+}
+
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+
+
+# Compile each template once per process.
+
+TEMPLATES = copy.deepcopy(base.TEMPLATES)
+TEMPLATES[0]['APP_DIRS'] = False
+TEMPLATES[0]['OPTIONS']['loaders'] = [
+    (
+        'django.template.loaders.cached.Loader',
+        [
+            'django.template.loaders.filesystem.Loader',
+            'django.template.loaders.app_directories.Loader',
+        ],
+    ),
+]
+
+
+# `manage.py collectstatic` stores static files under names with a hash of
+# their content, so clients can cache them for good, along with compressed
+# copies of them, which the workers serve themselves unless SERVE_STATIC=0.
+
+STATICFILES_STORAGE = 'utils.storage.CompressedManifestStaticFilesStorage'
+
+SERVE_STATIC = os.environ.get('SERVE_STATIC', '1') == '1'
@@ -17,8 +17,8 @@ from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import include, path
-from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 from rest_framework import routers
+from rest_framework.authtoken.views import obtain_auth_token
 
 from authors.views import AuthorViewSet
 from books.views import (
@@ -27,6 +27,10 @@ from books.views import (
     CategoryViewSet,
     PublisherViewSet,
 )
+from changes.views import ChangeViewSet
+from loans.views import HoldViewSet, LoanViewSet
+from tokens.views import RevokeSignedTokenView, SignedTokenView
+from utils.views import LazyView
 
 router = routers.DefaultRouter()
 
@@ -38,18 +42,39 @@ router.register(r'authors', AuthorViewSet)
 router.register(r'categories', CategoryViewSet)
 router.register(r'publishers', PublisherViewSet)
 router.register(r'book_copies', BookCopyViewSet)
+router.register(r'loans', LoanViewSet)
+router.register(r'holds', HoldViewSet)
+router.register(r'changes', ChangeViewSet)
 
 urlpatterns = (
     [
         path('admin/', admin.site.urls),
         path('api/', include(router.urls)),
-        path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
+        path('api/auth/token/', obtain_auth_token, name='api-token'),
+        path(
+            'api/auth/signed-token/',
+            SignedTokenView.as_view(),
+            name='api-signed-token',
+        ),
+        path(
+            'api/auth/signed-token/revoke/',
+            RevokeSignedTokenView.as_view(),
+            name='api-signed-token-revoke',
+        ),
+        path(
+            'api/schema/',
+            LazyView('utils.schema_views.SchemaView'),
+            name='schema',
+        ),
         path(
             'api/schema/swagger-ui/',
-            SpectacularSwaggerView.as_view(url_name='schema'),
+            LazyView(
+                'drf_spectacular.views.SpectacularSwaggerView',
+                url_name='schema',
+            ),
             name='swagger-ui',
         ),
     ]
     + static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
-    + static(settings.MEDIA_URL, document_root=settings.MEDIA_URL)
+    + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
 )
@@ -7,10 +7,26 @@ For more information on this file, see
 https://docs.djangoproject.com/en/4.1/howto/deployment/wsgi/
 """
 
+import logging
 import os
 
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
+from django.db import connections
 
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'setup.settings')
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'setup.settings.prod')
 
 application = get_wsgi_application()
+
+if settings.WARMUP_ON_STARTUP:
+    from utils.warmup import warm_caches
+
+    try:
+        warm_caches()
+    except Exception:
+        # A cold worker is better than none.
+        logging.getLogger(__name__).exception('Warming the caches failed')
+    finally:
+        # With gunicorn --preload this runs in the master process, whose
+        # connections would be shared by the workers it forks.
+        connections.close_all()
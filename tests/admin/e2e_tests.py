@@ -0,0 +1,87 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.status import HTTP_200_OK
+
+from books.models import BookCopy
+from utils.pagination import EstimatedCountPaginator
+
+from ..book_copies.factories import BookCopyFactory
+from ..books.factories import BookFactory
+
+
+@pytest.mark.django_db
+class TestBookCopyAdmin:
+    def setup_method(self):
+        self.url = reverse('admin:books_bookcopy_changelist')
+
+    def _count_queries(self, client, url, data=None):
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(url, data)
+        assert response.status_code == HTTP_200_OK
+        return len(context.captured_queries)
+
+    def test_changelist_queries_do_not_grow_with_rows(self, admin_client):
+        BookCopyFactory.create_batch(2)
+        few = self._count_queries(admin_client, self.url)
+        BookCopyFactory.create_batch(8)
+        many = self._count_queries(admin_client, self.url)
+
+        assert few == many
+
+    def test_search_by_book_id(self, admin_client):
+        book_copy = BookCopyFactory()
+        BookCopyFactory()
+        response = admin_client.get(self.url, {'q': str(book_copy.book.pk)})
+
+        assert list(response.context['cl'].result_list) == [book_copy]
+
+    def test_search_by_copy_id(self, admin_client):
+        book_copy = BookCopyFactory()
+        BookCopyFactory()
+        response = admin_client.get(self.url, {'q': str(book_copy.pk)})
+
+        assert list(response.context['cl'].result_list) == [book_copy]
+
+    def test_search_by_title_prefix(self, admin_client):
+        book_copy = BookCopyFactory(book=BookFactory(title='Dune Messiah'))
+        BookCopyFactory(book=BookFactory(title='The Dune Encyclopedia'))
+        response = admin_client.get(self.url, {'q': 'Dune'})
+
+        assert list(response.context['cl'].result_list) == [book_copy]
+
+    def test_book_autocomplete(self, admin_client):
+        book = BookFactory(title='Dune')
+        BookFactory(title='Neuromancer')
+        response = admin_client.get(
+            reverse('admin:autocomplete'),
+            {
+                'app_label': 'books',
+                'model_name': 'bookcopy',
+                'field_name': 'book',
+                'term': 'Du',
+            },
+        )
+
+        assert response.json()['results'] == [
+            {'id': str(book.pk), 'text': 'Dune'}
+        ]
+
+    def test_change_form_does_not_load_all_books(self, admin_client):
+        book_copy = BookCopyFactory()
+        BookFactory.create_batch(5)
+        response = admin_client.get(
+            reverse('admin:books_bookcopy_change', args=[book_copy.pk])
+        )
+
+        assert response.status_code == HTTP_200_OK
+        assert response.content.count(b'<option') <= 2
+
+
+@pytest.mark.django_db
+def test_estimated_count_paginator_counts_exactly_without_postgres():
+    BookCopyFactory.create_batch(3)
+    paginator = EstimatedCountPaginator(BookCopy.objects.order_by('pk'), 2)
+
+    assert paginator.count == 3
@@ -0,0 +1,100 @@
+import pytest
+from django.contrib.auth.models import User
+from django.test import Client
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.status import (
+    HTTP_200_OK,
+    HTTP_201_CREATED,
+    HTTP_403_FORBIDDEN,
+)
+from rest_framework.test import APIClient
+
+
+@pytest.mark.django_db
+class TestSessionlessFastPath:
+    def setup_method(self):
+        self.client = Client()
+        self.staff = User.objects.create_user(
+            username='staff', password='password', is_staff=True
+        )
+
+    def test_anonymous_reads_skip_the_session(self):
+        response = self.client.get(reverse('category-list'))
+
+        assert response.status_code == HTTP_200_OK
+        assert not hasattr(response.wsgi_request, 'session')
+        assert not response.wsgi_request.user.is_authenticated
+        assert not response.cookies
+
+    def test_session_requests_are_authenticated(self):
+        self.client.force_login(self.staff)
+
+        response = self.client.get(reverse('category-list'))
+
+        assert hasattr(response.wsgi_request, 'session')
+        assert response.wsgi_request.user == self.staff
+
+    def test_session_writes_still_need_a_csrf_token(self):
+        client = Client(enforce_csrf_checks=True)
+        client.force_login(self.staff)
+
+        response = client.post(reverse('category-list'), {'name': 'Poetry'})
+
+        assert response.status_code == HTTP_403_FORBIDDEN
+        assert 'CSRF' in response.json()['detail']
+
+    def test_admin_keeps_its_session(self):
+        self.client.force_login(self.staff)
+        self.staff.is_superuser = True
+        self.staff.save()
+
+        response = self.client.get('/admin/')
+
+        assert response.status_code == HTTP_200_OK
+
+
+@pytest.mark.django_db
+class TestTokenAuthentication:
+    def setup_method(self):
+        self.client = APIClient()
+        self.url = reverse('category-list')
+
+    def test_staff_writes_with_a_token(self):
+        staff = User.objects.create_user(username='staff', is_staff=True)
+        token = Token.objects.create(user=staff)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+
+        response = self.client.post(self.url, {'name': 'Poetry'})
+
+        assert response.status_code == HTTP_201_CREATED
+        assert not hasattr(response.wsgi_request, 'session')
+
+    def test_non_staff_token_cannot_write(self):
+        token = Token.objects.create(
+            user=User.objects.create_user(username='patron')
+        )
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+
+        response = self.client.post(self.url, {'name': 'Poetry'})
+
+        assert response.status_code == HTTP_403_FORBIDDEN
+
+    def test_invalid_token(self):
+        self.client.credentials(HTTP_AUTHORIZATION='Token invalid')
+
+        response = self.client.post(self.url, {'name': 'Poetry'})
+
+        assert response.status_code == HTTP_403_FORBIDDEN
+
+    def test_obtain_token(self):
+        staff = User.objects.create_user(
+            username='staff', password='password', is_staff=True
+        )
+
+        response = self.client.post(
+            reverse('api-token'),
+            {'username': 'staff', 'password': 'password'},
+        )
+
+        assert response.json()['token'] == Token.objects.get(user=staff).key
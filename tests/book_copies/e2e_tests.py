@@ -2,22 +2,28 @@ import base64
 import tempfile
 from contextlib import contextmanager
 from datetime import date
+from uuid import uuid4
 
 import pytest
 from django.contrib.auth.models import User
+from django.db import connection
 from django.urls import reverse
 from PIL import Image
 from rest_framework.status import (
     HTTP_200_OK,
     HTTP_201_CREATED,
     HTTP_204_NO_CONTENT,
+    HTTP_400_BAD_REQUEST,
     HTTP_403_FORBIDDEN,
 )
 from rest_framework.test import APIClient
 
+from books.filters import BookCopyFilter
 from books.models import BookCopy
+from books.reference import warm_all
 
 from ..books.factories import BookFactory
+from ..categories.factories import CategoryFactory
 from ..publishers.factories import PublisherFactory
 from .factories import BookCopyFactory
 
@@ -402,3 +408,136 @@ class TestBookCopyEndpoint:
         response = self.client.delete(url)
         assert response.status_code == HTTP_204_NO_CONTENT
         assert not BookCopy.objects.filter(pk=book_copy.pk).exists()
+
+
+@pytest.mark.django_db
+class TestBookCopyFilters:
+    def setup_method(self):
+        self.client = APIClient()
+        self.url = reverse('bookcopy-list')
+        self.copies = [
+            BookCopyFactory(date_published=date(2001, 1, 1)),
+            BookCopyFactory(date_published=date(2005, 6, 1)),
+            BookCopyFactory(date_published=date(2010, 12, 31)),
+        ]
+
+    def _ids(self, params):
+        response = self.client.get(self.url, params)
+        assert response.status_code == HTTP_200_OK
+        return {item['id'] for item in response.json()['results']}
+
+    def _expected(self, *indexes):
+        return {str(self.copies[index].pk) for index in indexes}
+
+    def test_date_published_range(self):
+        ids = self._ids(
+            {
+                'date_published__gte': '2005-01-01',
+                'date_published__lte': '2010-12-31',
+            }
+        )
+
+        assert ids == self._expected(1, 2)
+
+    def test_publisher_in(self):
+        publishers = [copy.publisher_id for copy in self.copies[:2]]
+
+        ids = self._ids({'publisher__in': ','.join(map(str, publishers))})
+
+        assert ids == self._expected(0, 1)
+
+    def test_book_in(self):
+        books = [str(copy.book_id) for copy in self.copies[1:]]
+
+        ids = self._ids({'book__in': ','.join(books)})
+
+        assert ids == self._expected(1, 2)
+
+    def test_book_category(self):
+        category = CategoryFactory()
+        book = BookFactory(category=category)
+        copies = BookCopyFactory.create_batch(2, book=book)
+
+        ids = self._ids({'book__category': category.pk})
+
+        assert ids == {str(copy.pk) for copy in copies}
+
+    def test_invalid_ids(self):
+        response = self.client.get(self.url, {'publisher__in': '1,x'})
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
+        assert 'publisher__in' in response.json()
+
+    def test_in_filters_do_not_query_the_referenced_rows(
+        self, no_throttling, django_assert_num_queries
+    ):
+        publishers = ','.join(str(copy.publisher_id) for copy in self.copies)
+        warm_all()
+
+        # count, page rows
+        with django_assert_num_queries(2):
+            self.client.get(self.url, {'publisher__in': publishers})
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(
+    connection.vendor != 'sqlite', reason='Reads SQLite query plans'
+)
+class TestBookCopyFilterQueryPlans:
+    def _queryset(self, params):
+        filterset = BookCopyFilter(
+            params, queryset=BookCopy.objects.order_by('pk')
+        )
+        assert filterset.is_valid(), filterset.errors
+        return filterset.qs
+
+    def _plan(self, params):
+        return self._queryset(params).explain()
+
+    def test_no_distinct_or_many_to_many_joins(self):
+        copy = BookCopyFactory(date_published=date(2005, 6, 1))
+        queryset = self._queryset(
+            {
+                'book__in': str(copy.book_id),
+                'publisher__in': str(copy.publisher_id),
+                'book__category': copy.book.category_id,
+                'date_published__gte': '2000-01-01',
+            }
+        )
+        sql = str(queryset.query)
+
+        assert 'DISTINCT' not in sql
+        assert 'authors' not in sql
+        assert 'publishers' not in sql
+        assert list(queryset) == [copy]
+
+    def test_date_published_range_uses_an_index(self):
+        plan = self._plan(
+            {
+                'date_published__gte': '2005-01-01',
+                'date_published__lte': '2010-12-31',
+            }
+        )
+
+        assert 'SEARCH books_bookcopy USING INDEX' in plan
+        assert 'date_published>? AND date_published<?' in plan
+
+    def test_publisher_in_uses_an_index(self):
+        plan = self._plan({'publisher__in': '1,2,3'})
+
+        assert 'USING INDEX books_bookcopy_publisher_id' in plan
+
+    def test_book_in_uses_an_index(self):
+        plan = self._plan(
+            {'book__in': ','.join(str(uuid4()) for _ in range(3))}
+        )
+
+        assert 'SEARCH books_bookcopy USING INDEX' in plan
+        assert '(book_id=?)' in plan
+
+    def test_book_category_searches_both_tables(self):
+        plan = self._plan({'book__category': CategoryFactory().pk})
+
+        assert 'SEARCH books_book USING INDEX' in plan
+        assert 'SEARCH books_bookcopy USING INDEX' in plan
+        assert 'SCAN' not in plan
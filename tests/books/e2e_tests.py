@@ -1,3 +1,5 @@
+from uuid import uuid4
+
 import pytest
 from django.contrib.auth.models import User
 from django.urls import reverse
@@ -6,13 +8,17 @@ from rest_framework.status import (
     HTTP_201_CREATED,
     HTTP_204_NO_CONTENT,
     HTTP_403_FORBIDDEN,
+    HTTP_404_NOT_FOUND,
 )
 from rest_framework.test import APIClient
 
 from books.models import Book
+from books.reference import warm_all
 
 from ..authors.factories import AuthorFactory
+from ..book_copies.factories import BookCopyFactory
 from ..categories.factories import CategoryFactory
+from ..publishers.factories import PublisherFactory
 from .factories import BookFactory
 
 
@@ -301,3 +307,156 @@ class TestBookEndpoint:
         response = self.client.delete(url)
         assert response.status_code == HTTP_204_NO_CONTENT
         assert not Book.objects.filter(pk=book.pk).exists()
+
+
+@pytest.mark.django_db
+class TestBookCopySummary:
+    def setup_method(self):
+        self.client = APIClient()
+        self.book = BookFactory()
+
+    def test_summary_follows_copy_writes(self):
+        first = BookCopyFactory(book=self.book, date_published='2001-05-01')
+        second = BookCopyFactory(book=self.book, date_published='1999-02-03')
+        BookCopyFactory(
+            book=self.book,
+            date_published='2010-01-01',
+            publisher=first.publisher,
+        )
+
+        self.book.refresh_from_db()
+        assert self.book.copy_count == 3
+        assert str(self.book.earliest_published) == '1999-02-03'
+        assert str(self.book.latest_published) == '2010-01-01'
+        assert set(self.book.publishers.all()) == {
+            first.publisher,
+            second.publisher,
+        }
+
+        second.delete()
+
+        self.book.refresh_from_db()
+        assert self.book.copy_count == 2
+        assert str(self.book.earliest_published) == '2001-05-01'
+        assert list(self.book.publishers.all()) == [first.publisher]
+
+    def test_moving_a_copy_refreshes_both_books(self):
+        other_book = BookFactory()
+        copy = BookCopyFactory(book=self.book)
+        copy = type(copy).objects.get(pk=copy.pk)
+
+        copy.book = other_book
+        copy.save()
+
+        self.book.refresh_from_db()
+        other_book.refresh_from_db()
+        assert self.book.copy_count == 0
+        assert self.book.earliest_published is None
+        assert not self.book.publishers.exists()
+        assert other_book.copy_count == 1
+        assert list(other_book.publishers.all()) == [copy.publisher]
+
+    def test_summary_is_exposed_read_only(self):
+        copy = BookCopyFactory(book=self.book, date_published='2001-05-01')
+        url = reverse('book-detail', kwargs={'pk': self.book.pk})
+
+        data = self.client.get(url).json()
+
+        assert data['copy_count'] == 1
+        assert data['earliest_published'] == '2001-05-01'
+        assert data['latest_published'] == '2001-05-01'
+        assert data['publishers'] == [copy.publisher.name]
+
+        self.client.force_authenticate(
+            User.objects.create_superuser(username='superuser')
+        )
+        self.client.patch(url, {'copy_count': 10}, format='json')
+        self.book.refresh_from_db()
+        assert self.book.copy_count == 1
+
+    def test_filter_and_order_by_summary(self):
+        publisher = PublisherFactory()
+        popular = BookFactory()
+        BookCopyFactory.create_batch(3, book=popular, publisher=publisher)
+        BookCopyFactory(book=self.book, date_published='1990-01-01')
+
+        response = self.client.get(
+            reverse('book-list'), {'copy_count__gte': 2}
+        )
+        assert [book['id'] for book in response.json()['results']] == [
+            str(popular.pk)
+        ]
+
+        response = self.client.get(
+            reverse('book-list'), {'publishers': publisher.pk}
+        )
+        assert [book['id'] for book in response.json()['results']] == [
+            str(popular.pk)
+        ]
+
+        response = self.client.get(
+            reverse('book-list'), {'ordering': '-copy_count'}
+        )
+        assert [book['id'] for book in response.json()['results']] == [
+            str(popular.pk),
+            str(self.book.pk),
+        ]
+
+
+@pytest.mark.django_db
+class TestBookCopiesAction:
+    def setup_method(self):
+        self.client = APIClient()
+        self.book = BookFactory()
+        self.url = reverse('book-copies', kwargs={'pk': self.book.pk})
+
+    def test_copies_are_paginated(self):
+        copies = BookCopyFactory.create_batch(3, book=self.book)
+        BookCopyFactory()
+
+        response = self.client.get(self.url, {'limit': 2})
+        data = response.json()
+
+        assert response.status_code == HTTP_200_OK
+        assert data['count'] == 3
+        assert data['next'] is not None
+        assert len(data['results']) == 2
+        assert {copy['id'] for copy in data['results']} <= {
+            str(copy.pk) for copy in copies
+        }
+
+    def test_page_size_is_bounded(self, settings):
+        settings.STREAMING_LIST_THRESHOLD = None
+        BookCopyFactory(book=self.book)
+
+        response = self.client.get(self.url, {'limit': 10_000, 'offset': 1})
+
+        assert 'limit=1000' in response.json()['previous']
+
+    def test_copies_are_filterable(self):
+        publisher = PublisherFactory()
+        copy = BookCopyFactory(book=self.book, publisher=publisher)
+        BookCopyFactory(book=self.book)
+
+        response = self.client.get(self.url, {'publisher': publisher.pk})
+
+        assert [item['id'] for item in response.json()['results']] == [
+            str(copy.pk)
+        ]
+
+    def test_copies_do_not_query_per_row(
+        self, no_throttling, django_assert_max_num_queries
+    ):
+        BookCopyFactory.create_batch(5, book=self.book)
+        warm_all()
+
+        # book, count, page rows, books, book authors, book publishers
+        with django_assert_max_num_queries(6):
+            response = self.client.get(self.url, {'expand': 'book'})
+
+        assert len(response.json()['results']) == 5
+
+    def test_unknown_book(self):
+        url = reverse('book-copies', kwargs={'pk': uuid4()})
+
+        assert self.client.get(url).status_code == HTTP_404_NOT_FOUND
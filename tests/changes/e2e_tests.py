@@ -0,0 +1,206 @@
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.status import HTTP_200_OK, HTTP_400_BAD_REQUEST
+from rest_framework.test import APIClient
+
+from books.reference import warm_all
+from changes.feed import stamp_changes
+from changes.models import Change
+from webhooks.models import Subscription
+
+from ..authors.factories import AuthorFactory
+from ..book_copies.factories import BookCopyFactory
+from ..books.factories import BookFactory
+from ..categories.factories import CategoryFactory
+
+
+@pytest.mark.django_db
+class TestChangeFeed:
+    def setup_method(self):
+        self.client = APIClient()
+        self.url = reverse('change-list')
+
+    def _changes(self, since=0, **params):
+        # Stands in for the on_commit step, which never runs inside the
+        # transaction of a test.
+        stamp_changes()
+        response = self.client.get(self.url, {'since': since, **params})
+        assert response.status_code == HTTP_200_OK
+        return response.json()
+
+    def _cursor(self):
+        return self._changes(limit=1000)['cursor']
+
+    def test_writes_are_recorded(self):
+        category = CategoryFactory()
+        cursor = self._cursor()
+
+        category.name = 'Renamed'
+        category.save()
+        category_id = category.pk
+        category.delete()
+
+        results = self._changes(cursor)['results']
+        assert [(c['model'], c['action']) for c in results] == [
+            ('books.category', 'upsert'),
+            ('books.category', 'delete'),
+        ]
+        assert all(c['id'] == str(category_id) for c in results)
+        # The category no longer exists, so the upsert has no data.
+        assert results[0]['data'] is None
+
+    def test_upserts_carry_the_current_representation(self):
+        book = BookFactory()
+        cursor = self._cursor()
+
+        book.title = 'New title'
+        book.save()
+
+        [change] = self._changes(cursor)['results']
+        assert change['data']['id'] == str(book.pk)
+        assert change['data']['title'] == 'New title'
+
+    def test_author_changes_are_recorded(self):
+        book = BookFactory()
+        author = AuthorFactory()
+        cursor = self._cursor()
+
+        book.authors.add(author)
+        author.book_set.clear()
+
+        results = self._changes(cursor)['results']
+        assert [(c['model'], c['id']) for c in results] == [
+            ('books.book', str(book.pk)),
+            ('books.book', str(book.pk)),
+        ]
+
+    def test_deleting_an_author_records_their_books(self):
+        book = BookFactory()
+        author = AuthorFactory()
+        book.authors.add(author)
+        author_id = author.pk
+        cursor = self._cursor()
+
+        author.delete()
+
+        results = self._changes(cursor)['results']
+        assert [(c['model'], c['action'], c['id']) for c in results] == [
+            ('books.book', 'upsert', str(book.pk)),
+            ('authors.author', 'delete', str(author_id)),
+        ]
+        assert str(author_id) not in results[0]['data']['authors']
+
+    def test_copy_writes_record_the_book(self):
+        book = BookFactory()
+        cursor = self._cursor()
+
+        copy = BookCopyFactory(book=book)
+
+        results = self._changes(cursor)['results']
+        assert {(c['model'], c['id']) for c in results} >= {
+            ('books.bookcopy', str(copy.pk)),
+            ('books.book', str(book.pk)),
+        }
+        [book_data] = [
+            c['data'] for c in results if c['model'] == 'books.book'
+        ]
+        assert book_data['copy_count'] == 1
+
+    def test_renaming_a_category_resends_its_books(self):
+        book = BookFactory()
+        cursor = self._cursor()
+
+        book.category.name = 'Renamed'
+        book.category.save()
+
+        results = self._changes(cursor)['results']
+        assert [(c['model'], c['id']) for c in results] == [
+            ('books.category', str(book.category.pk)),
+            ('books.book', str(book.pk)),
+        ]
+        assert results[1]['data']['category'] == 'Renamed'
+
+    def test_batches(self):
+        cursor = self._cursor()
+        CategoryFactory.create_batch(3)
+
+        first = self._changes(cursor, limit=2)
+        second = self.client.get(first['next']).json()
+
+        assert len(first['results']) == 2
+        assert len(second['results']) == 1
+        assert second['next'] is None
+        assert second['cursor'] == Change.objects.latest('pk').sequence
+
+    def test_changes_committed_late_come_after_the_cursor(self):
+        cursor = self._cursor()
+        slow, fast = CategoryFactory.create_batch(2)
+        # The change of a slower transaction: it has the lower id but only
+        # commits after the other one was read.
+        slow_change = Change.objects.get(object_id=slow.pk)
+        slow_id = slow_change.pk
+        slow_change.delete()
+
+        first = self._changes(cursor)
+        assert [c['id'] for c in first['results']] == [str(fast.pk)]
+
+        slow_change.pk = slow_id
+        slow_change.save(force_insert=True)
+
+        second = self._changes(first['cursor'])
+        assert [c['id'] for c in second['results']] == [str(slow.pk)]
+
+    def test_unnumbered_changes_are_not_served(self):
+        cursor = self._cursor()
+        CategoryFactory()
+
+        response = self.client.get(self.url, {'since': cursor})
+
+        assert response.json()['results'] == []
+
+    def test_changes_are_numbered_on_commit(
+        self, django_capture_on_commit_callbacks
+    ):
+        with django_capture_on_commit_callbacks(execute=True):
+            category = CategoryFactory()
+
+        assert Change.objects.get(object_id=category.pk).sequence is not None
+
+    def test_prune_keeps_recent_and_undelivered_changes(self):
+        Change.objects.all().delete()
+        CategoryFactory.create_batch(3)
+        stamp_changes()
+        delivered, pending, recent = Change.objects.order_by('sequence')
+        Change.objects.exclude(pk=recent.pk).update(
+            created_at=timezone.now() - timedelta(days=31)
+        )
+        Subscription.objects.create(
+            url='https://a.test/', cursor=delivered.sequence
+        )
+        Subscription.objects.create(
+            url='https://b.test/', cursor=0, active=False
+        )
+
+        call_command('prune_changes', days=30, stdout=StringIO())
+
+        assert list(Change.objects.order_by('sequence')) == [pending, recent]
+
+    def test_feed_queries_do_not_grow_with_the_batch(
+        self, no_throttling, django_assert_max_num_queries
+    ):
+        BookFactory.create_batch(5)
+        stamp_changes()
+        warm_all()
+
+        # changes, books, book authors, book publishers, categories, authors
+        with django_assert_max_num_queries(6):
+            self.client.get(self.url, {'limit': 1000})
+
+    def test_invalid_cursor(self):
+        response = self.client.get(self.url, {'since': 'abc'})
+        assert response.status_code == HTTP_400_BAD_REQUEST
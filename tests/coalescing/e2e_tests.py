@@ -0,0 +1,166 @@
+import threading
+
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from utils.coalescing import coalescing_key
+from utils.middleware import CoalescingMiddleware
+
+
+class SlowView:
+    """
+    get_response stand-in that blocks until released and counts its calls.
+    """
+
+    def __init__(self, status=200, error=None):
+        self.calls = 0
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.status = status
+        self.error = error
+
+    def __call__(self, request):
+        self.calls += 1
+        self.started.set()
+        self.release.wait(5)
+        if self.error is not None:
+            raise self.error
+        return HttpResponse(
+            f'call {self.calls}',
+            status=self.status,
+            content_type='application/json',
+        )
+
+
+def run_concurrently(view, requests, workers=1):
+    # Separate middleware instances stand in for separate workers.
+    middleware = [CoalescingMiddleware(view) for _ in range(workers)]
+    responses = [None] * len(requests)
+    errors = []
+
+    def run(n):
+        try:
+            responses[n] = middleware[n % workers](requests[n])
+        except Exception as e:
+            errors.append(e)
+
+    threads = [
+        threading.Thread(target=run, args=(n,)) for n in range(len(requests))
+    ]
+    threads[0].start()
+    view.started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    # Let the followers reach the flight before the leader finishes.
+    threading.Event().wait(0.1)
+    view.release.set()
+    for thread in threads:
+        thread.join(5)
+    return responses, errors
+
+
+class TestCoalescing:
+    def setup_method(self):
+        self.factory = RequestFactory()
+
+    def test_concurrent_identical_requests_share_one_response(self):
+        view = SlowView()
+        requests = [self.factory.get('/api/books/') for _ in range(4)]
+
+        responses, _ = run_concurrently(view, requests)
+
+        assert view.calls == 1
+        assert {r.content for r in responses} == {b'call 1'}
+        assert len({id(r) for r in responses}) == 4
+        assert all(r['Content-Type'] == 'application/json' for r in responses)
+
+    def test_different_requests_are_not_coalesced(self):
+        view = SlowView()
+        requests = [
+            self.factory.get('/api/books/', {'category': 'Fiction'}),
+            self.factory.get('/api/books/', {'category': 'Poetry'}),
+            self.factory.get(
+                '/api/books/',
+                {'category': 'Fiction'},
+                HTTP_ACCEPT='application/msgpack',
+            ),
+        ]
+
+        run_concurrently(view, requests)
+
+        assert view.calls == 3
+
+    def test_authenticated_requests_are_not_coalesced(self):
+        view = SlowView()
+        requests = [
+            self.factory.get('/api/books/', HTTP_AUTHORIZATION='Bearer a'),
+            self.factory.get('/api/books/', HTTP_AUTHORIZATION='Bearer b'),
+        ]
+
+        run_concurrently(view, requests)
+
+        assert view.calls == 2
+
+    def test_errors_are_not_shared(self):
+        view = SlowView(status=500)
+        requests = [self.factory.get('/api/books/') for _ in range(2)]
+
+        run_concurrently(view, requests)
+
+        assert view.calls == 2
+
+    def test_exceptions_are_not_shared(self):
+        view = SlowView(error=ValueError('boom'))
+        requests = [self.factory.get('/api/books/') for _ in range(2)]
+
+        _, errors = run_concurrently(view, requests)
+
+        assert view.calls == 2
+        assert len(errors) == 2
+
+    def test_across_workers_through_the_cache(self, settings):
+        settings.CACHES = {
+            'coalesce': {
+                'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'
+            }
+        }
+        settings.COALESCE_CACHE_ALIAS = 'coalesce'
+        view = SlowView()
+        requests = [self.factory.get('/api/books/') for _ in range(3)]
+
+        responses, _ = run_concurrently(view, requests, workers=3)
+
+        assert view.calls == 1
+        assert {r.content for r in responses} == {b'call 1'}
+
+    def test_key_ignores_parameter_order(self):
+        first = self.factory.get('/api/books/?a=1&b=2')
+        second = self.factory.get('/api/books/?b=2&a=1')
+
+        assert coalescing_key(first) == coalescing_key(second)
+
+    def test_key_includes_host_and_scheme(self, settings):
+        settings.ALLOWED_HOSTS = ['a.test', 'b.test']
+        keys = {
+            coalescing_key(self.factory.get('/api/books/', **extra))
+            for extra in [
+                {'HTTP_HOST': 'a.test'},
+                {'HTTP_HOST': 'b.test'},
+                {'HTTP_HOST': 'a.test', 'secure': True},
+            ]
+        }
+
+        assert len(keys) == 3
+
+
+@pytest.mark.django_db
+def test_api_responses_pass_through():
+    client = APIClient()
+
+    response = client.get(reverse('category-list'))
+
+    assert response.status_code == 200
+    assert response.json()['results'] == []
@@ -0,0 +1,184 @@
+import gzip
+
+import brotli
+import pytest
+import zstandard
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse, StreamingHttpResponse
+from django.middleware.csrf import get_token
+from django.test import RequestFactory
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from books.models import Category
+from utils import compression
+from utils.middleware import CompressionMiddleware
+
+from ..book_copies.factories import BookCopyFactory
+
+DECOMPRESS = {
+    'gzip': gzip.decompress,
+    'br': brotli.decompress,
+    'zstd': lambda data: zstandard.ZstdDecompressor()
+    .decompressobj()
+    .decompress(data),
+}
+
+
+@pytest.mark.django_db
+class TestCompression:
+    def setup_method(self):
+        cache.clear()
+        self.client = APIClient()
+        self.url = reverse('bookcopy-list')
+        BookCopyFactory.create_batch(3)
+
+    @pytest.mark.parametrize('coding', ['gzip', 'br', 'zstd'])
+    def test_compresses_list(self, coding):
+        expected = self.client.get(self.url)
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING=coding)
+
+        assert response['Content-Encoding'] == coding
+        assert 'Accept-Encoding' in response['Vary']
+        assert int(response['Content-Length']) == len(response.content)
+        assert DECOMPRESS[coding](response.content) == expected.content
+
+    @pytest.mark.parametrize(
+        'accept_encoding, coding',
+        [
+            ('gzip, deflate, br', 'br'),
+            ('gzip, br, zstd', 'zstd'),
+            ('gzip;q=1.0, br;q=0.5', 'gzip'),
+            ('*', 'zstd'),
+            ('*, zstd;q=0', 'br'),
+            ('identity', None),
+            ('gzip;q=0', None),
+            ('', None),
+        ],
+    )
+    def test_negotiation(self, accept_encoding, coding):
+        assert (
+            compression.negotiate_encoding(
+                accept_encoding, ['zstd', 'br', 'gzip']
+            )
+            == coding
+        )
+
+    def test_small_body_is_not_compressed(self):
+        category = Category.objects.first()
+        response = self.client.get(
+            reverse('category-detail', kwargs={'pk': category.pk}),
+            HTTP_ACCEPT_ENCODING='gzip',
+        )
+
+        assert not response.has_header('Content-Encoding')
+
+    @pytest.mark.parametrize(
+        'content_type, compressed',
+        [
+            ('image/jpeg', False),
+            ('image/svg+xml', True),
+            ('application/zip', False),
+            ('application/json', True),
+            ('text/html; charset=utf-8', False),
+        ],
+    )
+    def test_content_types(self, content_type, compressed):
+        middleware = CompressionMiddleware(
+            lambda request: HttpResponse(
+                b'x' * 1000, content_type=content_type
+            )
+        )
+        request = RequestFactory().get('/', HTTP_ACCEPT_ENCODING='gzip')
+        response = middleware(request)
+
+        assert response.has_header('Content-Encoding') is compressed
+
+    def test_responses_with_a_csrf_token_are_not_compressed(self):
+        def view(request):
+            return HttpResponse(
+                get_token(request).encode() * 10,
+                content_type='application/json',
+            )
+
+        request = RequestFactory().get('/', HTTP_ACCEPT_ENCODING='gzip')
+        response = CompressionMiddleware(view)(request)
+
+        assert not response.has_header('Content-Encoding')
+
+    def test_admin_pages_are_not_compressed(self):
+        response = self.client.get(
+            reverse('admin:login'), HTTP_ACCEPT_ENCODING='gzip'
+        )
+
+        assert response.status_code == 200
+        assert len(response.content) >= settings.COMPRESSION_MIN_SIZE
+        assert not response.has_header('Content-Encoding')
+
+    def test_streaming_response_is_compressed_incrementally(self):
+        chunks = [b'{"a":1}' * 50, b'', b'{"b":2}' * 50]
+        middleware = CompressionMiddleware(
+            lambda request: StreamingHttpResponse(
+                iter(chunks), content_type='application/json'
+            )
+        )
+        request = RequestFactory().get('/', HTTP_ACCEPT_ENCODING='gzip')
+        response = middleware(request)
+        compressed = list(response.streaming_content)
+
+        assert response['Content-Encoding'] == 'gzip'
+        assert len(compressed) == 3
+        assert gzip.decompress(b''.join(compressed)) == b''.join(chunks)
+
+    def test_streamed_list_is_compressed(self, settings):
+        settings.STREAMING_LIST_THRESHOLD = 2
+        expected = self.client.get(self.url, {'limit': 2})
+        response = self.client.get(
+            self.url, {'limit': 2}, HTTP_ACCEPT_ENCODING='br'
+        )
+
+        assert response.streaming
+        assert response['Content-Encoding'] == 'br'
+        assert brotli.decompress(
+            b''.join(response.streaming_content)
+        ) == b''.join(expected.streaming_content)
+
+    def test_responses_are_compressed_once_per_coding(self, mocker):
+        compress = mocker.patch(
+            'utils.middleware.compress', wraps=compression.compress
+        )
+
+        responses = [
+            self.client.get(self.url, HTTP_ACCEPT_ENCODING=accept_encoding)
+            for accept_encoding in ['gzip, br', 'br, gzip', 'br', 'gzip']
+        ]
+
+        assert [response['Content-Encoding'] for response in responses] == [
+            'br',
+            'br',
+            'br',
+            'gzip',
+        ]
+        assert responses[0].content == responses[2].content
+        assert compress.call_count == 2
+
+    def test_compression_cache_can_be_disabled(self, settings, mocker):
+        settings.COMPRESSION_CACHE_ALIAS = None
+        compress = mocker.patch(
+            'utils.middleware.compress', wraps=compression.compress
+        )
+
+        for _ in range(2):
+            self.client.get(self.url, HTTP_ACCEPT_ENCODING='br')
+
+        assert compress.call_count == 2
+
+    def test_accept_encoding_is_left_alone(self):
+        request = RequestFactory().get(
+            '/', HTTP_ACCEPT_ENCODING='gzip, deflate, br'
+        )
+        CompressionMiddleware(lambda request: HttpResponse())(request)
+
+        assert request.META['HTTP_ACCEPT_ENCODING'] == 'gzip, deflate, br'
+        assert request.compression_coding == 'br'
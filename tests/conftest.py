@@ -1,7 +1,24 @@
 import pytest
 from rest_framework.test import APIClient
 
+from books.reference import invalidate_all
+
 
 @pytest.fixture
 def api_client():
     return APIClient
+
+
+@pytest.fixture
+def no_throttling(settings):
+    # Throttles read their rates per request; no rate means no limit.
+    settings.REST_FRAMEWORK = {
+        **settings.REST_FRAMEWORK,
+        'DEFAULT_THROTTLE_RATES': {'anon': None, 'user': None},
+    }
+
+
+@pytest.fixture(autouse=True)
+def reference_caches():
+    # The database is rolled back after each test, the caches are not.
+    invalidate_all()
@@ -0,0 +1,169 @@
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from books.models import Book
+from books.tasks import refresh_copy_summaries_task
+from jobs.models import Job
+from jobs.queue import claim, requeue_stale, run_job
+from jobs.registry import REGISTRY, task
+
+from ..book_copies.factories import BookCopyFactory
+
+calls = []
+
+
+@task(name='tests.record', max_attempts=2)
+def record(value):
+    calls.append(value)
+
+
+@task(name='tests.fail', max_attempts=2)
+def fail():
+    raise RuntimeError('boom')
+
+
+@task(name='tests.tick')
+def tick():
+    calls.append('tick')
+
+
+@pytest.mark.django_db
+class TestJobQueue:
+    @pytest.fixture(autouse=True)
+    def schedule(self, settings):
+        settings.JOB_SCHEDULE = {}
+
+    def setup_method(self):
+        calls.clear()
+
+    def _run_worker(self):
+        stdout = StringIO()
+        call_command('run_worker', '--burst', '--pool=inline', stdout=stdout)
+        return stdout.getvalue()
+
+    def test_tasks_are_registered(self):
+        assert REGISTRY['books.refresh_copy_summaries'] is (
+            refresh_copy_summaries_task
+        )
+
+    def test_jobs_run_by_priority(self):
+        record.enqueue(value='low', priority=-1)
+        record.enqueue(value='high', priority=5)
+        record.enqueue(value='normal')
+
+        self._run_worker()
+
+        assert calls == ['high', 'normal', 'low']
+        assert set(Job.objects.values_list('status', flat=True)) == {
+            Job.SUCCEEDED
+        }
+
+    def test_delayed_jobs_wait(self):
+        record.enqueue(value='later', run_at=timezone.now() + timedelta(1))
+
+        self._run_worker()
+
+        assert calls == []
+        assert Job.objects.get().status == Job.QUEUED
+
+    def test_failed_jobs_are_retried_then_failed(self):
+        job = fail.enqueue()
+
+        self._run_worker()
+        job.refresh_from_db()
+        assert job.status == Job.QUEUED
+        assert job.attempts == 1
+        assert 'RuntimeError: boom' in job.last_error
+        assert job.run_at > timezone.now()
+
+        Job.objects.update(run_at=timezone.now())
+        self._run_worker()
+        job.refresh_from_db()
+        assert job.status == Job.FAILED
+        assert job.attempts == 2
+
+    def test_scheduled_tasks_are_queued_once_per_interval(self, settings):
+        settings.JOB_SCHEDULE = {'tests.tick': 60}
+
+        self._run_worker()
+        self._run_worker()
+        assert calls == ['tick']
+
+        Job.objects.update(created_at=timezone.now() - timedelta(seconds=61))
+        self._run_worker()
+        assert calls == ['tick', 'tick']
+
+    def test_scheduled_tasks_wait_for_the_last_run(self, settings):
+        settings.JOB_SCHEDULE = {'tests.tick': 60}
+        tick.enqueue(run_at=timezone.now() + timedelta(1))
+        Job.objects.update(created_at=timezone.now() - timedelta(1))
+
+        self._run_worker()
+
+        assert calls == []
+        assert Job.objects.count() == 1
+
+    def test_jobs_are_claimed_once(self):
+        record.enqueue(value=1)
+
+        assert len(claim('worker-1', 10)) == 1
+        assert claim('worker-2', 10) == []
+
+    def test_stale_jobs_are_requeued(self):
+        job = record.enqueue(value=1)
+        claim('worker-1', 1)
+        Job.objects.update(locked_until=timezone.now() - timedelta(1))
+
+        assert requeue_stale() == 1
+
+        job.refresh_from_db()
+        assert job.status == Job.QUEUED
+        # The old worker can't record an outcome any more.
+        run_job(job.pk, 'worker-1')
+        job.refresh_from_db()
+        assert job.status == Job.QUEUED
+
+    def test_metrics(self):
+        record.enqueue(value=1)
+        fail.enqueue()
+
+        output = self._run_worker()
+        assert 'succeeded=1' in output
+        assert 'retried=1' in output
+
+        stdout = StringIO()
+        call_command('job_metrics', stdout=stdout)
+        assert 'tests.record: queued=0 running=0 succeeded=1' in (
+            stdout.getvalue()
+        )
+
+    def test_worker_survives_jobs_that_crash(self, mocker):
+        crashing = record.enqueue(value='lost', priority=5)
+        record.enqueue(value='kept')
+        mocker.patch(
+            'jobs.worker.run_job',
+            side_effect=lambda job_id, worker_id: (
+                run_job(job_id, worker_id)
+                if job_id != crashing.pk
+                else Job.objects.get(pk=0)
+            ),
+        )
+
+        output = self._run_worker()
+
+        assert calls == ['kept']
+        assert f'Job {crashing.pk} (tests.record) crashed' in output
+        assert 'crashed=1, succeeded=1' in output
+
+    def test_refresh_copy_summaries_task(self):
+        copy = BookCopyFactory()
+        Book.objects.update(copy_count=0)
+
+        refresh_copy_summaries_task.enqueue()
+        self._run_worker()
+
+        assert Book.objects.get(pk=copy.book_id).copy_count == 1
@@ -0,0 +1,419 @@
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import IntegrityError
+from django.db.models import F
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.status import (
+    HTTP_200_OK,
+    HTTP_201_CREATED,
+    HTTP_401_UNAUTHORIZED,
+    HTTP_403_FORBIDDEN,
+    HTTP_404_NOT_FOUND,
+    HTTP_409_CONFLICT,
+)
+from rest_framework.test import APIClient
+
+from books.models import BookCopy
+from loans.circulation import CopyOnHold, book_availability
+from loans.holds import place_hold
+from loans.models import Hold, Loan
+
+from ..book_copies.factories import BookCopyFactory
+from ..books.factories import BookFactory
+from .factories import LoanFactory, UserFactory
+
+
+@pytest.mark.django_db
+class TestCheckout:
+    def setup_method(self):
+        self.client = APIClient()
+        self.patron = UserFactory()
+        self.copy = BookCopyFactory()
+        self.url = reverse('bookcopy-checkout', kwargs={'pk': self.copy.pk})
+
+    def test_checkout_unauthenticated(self):
+        response = self.client.post(self.url)
+        assert response.status_code in (
+            HTTP_401_UNAUTHORIZED,
+            HTTP_403_FORBIDDEN,
+        )
+
+    def test_checkout(self):
+        self.client.force_authenticate(self.patron)
+
+        response = self.client.post(self.url)
+        data = response.json()
+
+        assert response.status_code == HTTP_201_CREATED
+        assert data['copy'] == str(self.copy.pk)
+        assert data['book'] == str(self.copy.book_id)
+        assert data['patron'] == self.patron.pk
+        assert data['returned_at'] is None
+
+    def test_copy_on_loan_cannot_be_checked_out(self):
+        LoanFactory(copy=self.copy)
+        self.client.force_authenticate(self.patron)
+
+        response = self.client.post(self.url)
+
+        assert response.status_code == HTTP_409_CONFLICT
+        assert Loan.objects.filter(copy=self.copy).count() == 1
+
+    def test_one_active_loan_per_copy_is_enforced_by_the_database(self):
+        LoanFactory(copy=self.copy)
+
+        with pytest.raises(IntegrityError):
+            LoanFactory(copy=self.copy)
+
+    def test_checkout_on_behalf_of_patron_requires_staff(self):
+        self.client.force_authenticate(UserFactory())
+
+        response = self.client.post(self.url, {'patron': self.patron.pk})
+        assert response.status_code == HTTP_403_FORBIDDEN
+
+        self.client.force_authenticate(UserFactory(is_staff=True))
+
+        response = self.client.post(self.url, {'patron': self.patron.pk})
+        assert response.status_code == HTTP_201_CREATED
+        assert response.json()['patron'] == self.patron.pk
+
+    def test_patron_ids_cannot_be_probed(self):
+        self.client.force_authenticate(self.patron)
+
+        for patron in [self.patron.pk, UserFactory().pk, 10**9]:
+            response = self.client.post(self.url, {'patron': patron})
+            assert response.status_code == HTTP_403_FORBIDDEN
+
+    def test_due_date_requires_staff(self):
+        due_at = timezone.now() + timedelta(days=365)
+        self.client.force_authenticate(self.patron)
+
+        response = self.client.post(self.url, {'due_at': due_at.isoformat()})
+        assert response.status_code == HTTP_403_FORBIDDEN
+        assert not Loan.objects.filter(copy=self.copy).exists()
+
+        self.client.force_authenticate(UserFactory(is_staff=True))
+
+        response = self.client.post(
+            self.url, {'patron': self.patron.pk, 'due_at': due_at.isoformat()}
+        )
+        assert response.status_code == HTTP_201_CREATED
+        assert Loan.objects.get(copy=self.copy).due_at == due_at
+
+    def test_checkout_fulfills_hold(self):
+        LoanFactory(copy=self.copy)
+        other_copy = BookCopyFactory(book=self.copy.book)
+        hold = place_hold(self.copy.book_id, self.patron)
+        self.url = reverse('bookcopy-checkout', kwargs={'pk': other_copy.pk})
+        self.client.force_authenticate(self.patron)
+
+        self.client.post(self.url)
+
+        hold.refresh_from_db()
+        assert hold.status == Hold.FULFILLED
+
+
+@pytest.mark.django_db
+class TestReturn:
+    def setup_method(self):
+        self.client = APIClient()
+        self.client.force_authenticate(UserFactory(is_staff=True))
+        self.copy = BookCopyFactory()
+        self.url = reverse('bookcopy-return', kwargs={'pk': self.copy.pk})
+
+    def test_return(self):
+        loan = LoanFactory(copy=self.copy)
+
+        response = self.client.post(self.url)
+
+        assert response.status_code == HTTP_200_OK
+        assert response.json()['id'] == str(loan.pk)
+        loan.refresh_from_db()
+        assert loan.returned_at is not None
+
+    def test_return_copy_not_on_loan(self):
+        response = self.client.post(self.url)
+        assert response.status_code == HTTP_409_CONFLICT
+
+    def test_returned_copy_can_be_checked_out_again(self):
+        LoanFactory(copy=self.copy)
+        self.client.post(self.url)
+
+        response = self.client.post(
+            reverse('bookcopy-checkout', kwargs={'pk': self.copy.pk})
+        )
+
+        assert response.status_code == HTTP_201_CREATED
+
+    def test_return_requires_staff(self):
+        LoanFactory(copy=self.copy)
+        self.client.force_authenticate(UserFactory())
+
+        response = self.client.post(self.url)
+
+        assert response.status_code == HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+class TestHold:
+    def setup_method(self):
+        self.client = APIClient()
+        self.patron = UserFactory()
+        self.client.force_authenticate(self.patron)
+        self.copy = BookCopyFactory()
+        LoanFactory(copy=self.copy)
+        self.url = reverse('bookcopy-hold', kwargs={'pk': self.copy.pk})
+
+    def test_hold(self):
+        response = self.client.post(self.url)
+        data = response.json()
+
+        assert response.status_code == HTTP_201_CREATED
+        assert data['book'] == str(self.copy.book_id)
+        assert data['status'] == Hold.WAITING
+        assert data['position'] == 1
+
+    def test_second_hold_on_the_same_book(self):
+        self.client.post(self.url)
+        other_copy = BookCopyFactory(book=self.copy.book)
+
+        response = self.client.post(
+            reverse('bookcopy-hold', kwargs={'pk': other_copy.pk})
+        )
+
+        assert response.status_code == HTTP_409_CONFLICT
+
+
+@pytest.mark.django_db
+class TestAvailability:
+    def setup_method(self):
+        self.client = APIClient()
+        self.book = BookFactory()
+        self.copies = BookCopyFactory.create_batch(3, book=self.book)
+
+    def test_availability(self):
+        LoanFactory(copy=self.copies[0])
+        LoanFactory(copy=self.copies[1], returned_at=timezone.now())
+        LoanFactory()
+
+        response = self.client.get(
+            reverse('book-availability', kwargs={'pk': self.book.pk})
+        )
+
+        assert response.status_code == HTTP_200_OK
+        assert response.json() == {
+            'copies': 3,
+            'on_loan': 1,
+            'on_hold': 0,
+            'available': 2,
+            'waiting': 0,
+        }
+
+    def test_loans_follow_a_copy_moved_to_another_book(self):
+        loan = LoanFactory(copy=self.copies[0])
+        other_book = BookFactory()
+
+        copy = BookCopy.objects.get(pk=self.copies[0].pk)
+        copy.book = other_book
+        copy.save()
+
+        loan.refresh_from_db()
+        assert loan.book_id == other_book.pk
+        assert book_availability(self.book.pk)['on_loan'] == 0
+        assert book_availability(other_book.pk)['on_loan'] == 1
+
+    def test_availability_is_one_query(self, django_assert_num_queries):
+        LoanFactory(copy=self.copies[0])
+
+        with django_assert_num_queries(1):
+            book_availability(self.book.pk)
+
+    def test_unknown_book(self):
+        response = self.client.get(
+            reverse('book-availability', kwargs={'pk': 'unknown'})
+        )
+        assert response.status_code == HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestLoanEndpoint:
+    def setup_method(self):
+        self.client = APIClient()
+        self.patron = UserFactory()
+        self.loan = LoanFactory(patron=self.patron)
+        self.other_loan = LoanFactory()
+
+    def test_patrons_see_their_own_loans(self):
+        self.client.force_authenticate(self.patron)
+
+        response = self.client.get(reverse('loan-list'))
+
+        assert [loan['id'] for loan in response.json()['results']] == [
+            str(self.loan.pk)
+        ]
+
+    def test_staff_see_all_loans(self):
+        self.client.force_authenticate(UserFactory(is_staff=True))
+
+        response = self.client.get(reverse('loan-list'))
+
+        assert response.json()['count'] == 2
+
+    def test_loans_unauthenticated(self):
+        response = self.client.get(reverse('loan-list'))
+        assert response.status_code in (
+            HTTP_401_UNAUTHORIZED,
+            HTTP_403_FORBIDDEN,
+        )
+
+
+@pytest.mark.django_db
+class TestHoldQueue:
+    def setup_method(self):
+        self.client = APIClient()
+        self.staff = UserFactory(is_staff=True)
+        self.copy = BookCopyFactory()
+        self.book = self.copy.book
+        LoanFactory(copy=self.copy)
+        self.patrons = UserFactory.create_batch(3)
+        self.holds = [place_hold(self.book.pk, p) for p in self.patrons]
+
+    def _positions(self):
+        return [Hold.objects.get(pk=hold.pk).position for hold in self.holds]
+
+    def _return(self):
+        self.client.force_authenticate(self.staff)
+        return self.client.post(
+            reverse('bookcopy-return', kwargs={'pk': self.copy.pk})
+        )
+
+    def test_positions(self):
+        assert self._positions() == [1, 2, 3]
+
+    def test_position_lookup_does_not_count_rows(
+        self, django_assert_num_queries
+    ):
+        self.client.force_authenticate(self.patrons[2])
+        url = reverse('hold-detail', kwargs={'pk': self.holds[2].pk})
+
+        response = self.client.get(url)
+
+        assert response.json()['position'] == 3
+        # The hold with its queue counters is read in a single query.
+        with django_assert_num_queries(1):
+            Hold.objects.annotate(
+                queue_served=F('book__hold_queue__served')
+            ).get(pk=self.holds[2].pk).position
+
+    def test_returned_copy_goes_to_the_front_of_the_queue(self):
+        self._return()
+
+        first = Hold.objects.get(pk=self.holds[0].pk)
+        assert first.status == Hold.READY
+        assert first.copy == self.copy
+        assert first.expires_at is not None
+        assert self._positions() == [0, 1, 2]
+
+    def test_copy_on_hold_shelf_is_kept_for_the_patron(self):
+        self._return()
+        url = reverse('bookcopy-checkout', kwargs={'pk': self.copy.pk})
+
+        self.client.force_authenticate(self.patrons[1])
+        assert self.client.post(url).status_code == HTTP_409_CONFLICT
+
+        self.client.force_authenticate(self.patrons[0])
+        assert self.client.post(url).status_code == HTTP_201_CREATED
+        assert Hold.objects.get(pk=self.holds[0].pk).status == Hold.FULFILLED
+
+    def test_new_copy_goes_to_the_front_of_the_queue(
+        self, django_capture_on_commit_callbacks
+    ):
+        with django_capture_on_commit_callbacks(execute=True):
+            new_copy = BookCopyFactory(book=self.book)
+
+        first = Hold.objects.get(pk=self.holds[0].pk)
+        assert first.status == Hold.READY
+        assert first.copy == new_copy
+        assert self._positions() == [0, 1, 2]
+
+    def test_copy_moved_to_the_book_goes_to_the_queue(
+        self, django_capture_on_commit_callbacks
+    ):
+        moved = BookCopy.objects.get(pk=BookCopyFactory().pk)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            moved.book = self.book
+            moved.save()
+
+        assert Hold.objects.get(pk=self.holds[0].pk).copy == moved
+
+    def test_moved_copy_on_loan_is_not_allocated(
+        self, django_capture_on_commit_callbacks
+    ):
+        moved = BookCopy.objects.get(pk=BookCopyFactory().pk)
+        LoanFactory(copy=moved)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            moved.book = self.book
+            moved.save()
+
+        assert self._positions() == [1, 2, 3]
+
+    def test_free_copy_cannot_jump_the_queue(self):
+        free_copy = BookCopyFactory(book=self.book)
+        url = reverse('bookcopy-checkout', kwargs={'pk': free_copy.pk})
+
+        for patron in [UserFactory(), self.patrons[1]]:
+            self.client.force_authenticate(patron)
+            response = self.client.post(url)
+            assert response.status_code == HTTP_409_CONFLICT
+            assert response.json()['detail'] == CopyOnHold.default_detail
+
+        self.client.force_authenticate(self.patrons[0])
+        assert self.client.post(url).status_code == HTTP_201_CREATED
+        assert Hold.objects.get(pk=self.holds[0].pk).status == Hold.FULFILLED
+        assert self._positions() == [None, 1, 2]
+
+    def test_cancelling_renumbers_the_queue(self):
+        self.client.force_authenticate(self.patrons[1])
+
+        response = self.client.post(
+            reverse('hold-cancel', kwargs={'pk': self.holds[1].pk})
+        )
+
+        assert response.json()['status'] == Hold.CANCELLED
+        assert self._positions() == [1, None, 2]
+        assert book_availability(self.book.pk)['waiting'] == 2
+
+    def test_inactive_patrons_are_skipped(self):
+        self.patrons[0].is_active = False
+        self.patrons[0].save()
+
+        self._return()
+
+        assert self._positions() == [None, 0, 1]
+
+    def test_sweeper_expires_holds_and_reallocates(self):
+        self._return()
+        Hold.objects.filter(pk=self.holds[0].pk).update(
+            expires_at=timezone.now() - timedelta(minutes=1)
+        )
+
+        call_command('expire_holds', batch_size=1, stdout=StringIO())
+
+        assert Hold.objects.get(pk=self.holds[0].pk).status == Hold.EXPIRED
+        assert Hold.objects.get(pk=self.holds[1].pk).copy == self.copy
+        assert self._positions() == [None, 0, 1]
+
+    def test_hold_is_ready_when_a_copy_is_free(self):
+        free_copy = BookCopyFactory()
+
+        hold = place_hold(free_copy.book_id, UserFactory())
+
+        assert hold.status == Hold.READY
+        assert hold.copy == free_copy
+        assert book_availability(free_copy.book_id)['available'] == 0
@@ -0,0 +1,29 @@
+from datetime import timedelta
+
+import factory
+from django.contrib.auth.models import User
+from django.utils import timezone
+
+from loans.models import Loan
+
+from ..book_copies.factories import BookCopyFactory
+
+
+class UserFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = User
+
+    username = factory.Sequence(lambda n: f'patron{n}')
+
+
+class LoanFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Loan
+
+    copy = factory.SubFactory(BookCopyFactory)
+    book = factory.LazyAttribute(lambda loan: loan.copy.book)
+    patron = factory.SubFactory(UserFactory)
+    checked_out_at = factory.LazyFunction(timezone.now)
+    due_at = factory.LazyAttribute(
+        lambda loan: loan.checked_out_at + timedelta(days=21)
+    )
@@ -0,0 +1,151 @@
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.status import (
+    HTTP_200_OK,
+    HTTP_201_CREATED,
+    HTTP_400_BAD_REQUEST,
+)
+from rest_framework.test import APIClient
+
+from books.models import Book, Category
+from books.reference import bump_version, category_names, warm_all
+
+from ..authors.factories import AuthorFactory
+from ..book_copies.factories import BookCopyFactory
+from ..books.factories import BookFactory
+from ..categories.factories import CategoryFactory
+
+
+def all_sql(queries):
+    return ' '.join(query['sql'] for query in queries)
+
+
+@pytest.mark.django_db
+class TestReferenceDataCache:
+    def setup_method(self):
+        self.client = APIClient()
+        self.client.force_authenticate(
+            User.objects.create_user(username='staff', is_staff=True)
+        )
+
+    def test_writes_validate_names_from_the_cache(self, no_throttling):
+        CategoryFactory(name='Poetry')
+        author = AuthorFactory()
+        warm_all()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                reverse('book-list'),
+                {
+                    'title': 'Odes',
+                    'category': 'Poetry',
+                    'authors': [author.pk],
+                },
+            )
+
+        assert response.status_code == HTTP_201_CREATED
+        assert response.json()['category'] == 'Poetry'
+        assert 'FROM "books_category"' not in all_sql(queries)
+
+    def test_reads_name_relations_from_the_cache(self, no_throttling):
+        BookCopyFactory.create_batch(3)
+        warm_all()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                reverse('bookcopy-list'), {'expand': 'book'}
+            )
+
+        assert response.status_code == HTTP_200_OK
+        assert {item['publisher'] for item in response.json()['results']}
+        sql = all_sql(queries)
+        assert '"books_category"' not in sql
+        assert '"books_publisher"' not in sql
+
+    def test_renames_apply_at_once_in_this_process(self):
+        book = BookFactory(category__name='Poetry')
+        url = reverse('book-detail', kwargs={'pk': book.pk})
+        assert self.client.get(url).json()['category'] == 'Poetry'
+
+        book.category.name = 'Verse'
+        book.category.save()
+
+        assert self.client.get(url).json()['category'] == 'Verse'
+
+    def test_other_processes_are_noticed_by_version(self, settings):
+        settings.REFERENCE_CACHE_CHECK_SECONDS = 3600
+        category = CategoryFactory(name='Poetry')
+        assert category_names.name(category.pk) == 'Poetry'
+
+        # A write from another process: no signal here, only the version.
+        Category.objects.filter(pk=category.pk).update(name='Verse')
+        bump_version('books.category')
+        assert category_names.name(category.pk) == 'Poetry'
+
+        settings.REFERENCE_CACHE_CHECK_SECONDS = 0
+        assert category_names.name(category.pk) == 'Verse'
+
+    def test_names_created_elsewhere_are_looked_up(self):
+        warm_all()
+        Category.objects.bulk_create([Category(name='Drama')])
+
+        response = self.client.post(
+            reverse('book-list'),
+            {
+                'title': 'Hamlet',
+                'category': 'Drama',
+                'authors': [AuthorFactory().pk],
+            },
+        )
+
+        assert response.status_code == HTTP_201_CREATED
+        assert response.json()['category'] == 'Drama'
+
+    def test_unknown_name(self):
+        response = self.client.post(
+            reverse('book-list'),
+            {'title': 'Odes', 'category': 'Nope', 'authors': []},
+        )
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
+        assert response.json()['category'] == [
+            'Object with name=Nope does not exist.'
+        ]
+
+    @pytest.mark.django_db(transaction=True)
+    def test_names_deleted_elsewhere_are_unknown_on_write(self, settings):
+        settings.REFERENCE_CACHE_CHECK_SECONDS = 3600
+        category = CategoryFactory(name='Poetry')
+        warm_all()
+        # A delete from another process, which this one hasn't noticed.
+        Category.objects.filter(pk=category.pk)._raw_delete('default')
+
+        response = self.client.post(
+            reverse('book-list'),
+            {
+                'title': 'Odes',
+                'category': 'Poetry',
+                'authors': [AuthorFactory().pk],
+            },
+        )
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
+        assert response.json()['category'] == [
+            'Object with name=Poetry does not exist.'
+        ]
+        assert not Book.objects.filter(title='Odes').exists()
+        assert category_names.pk('Poetry') is None
+
+    def test_ambiguous_name(self):
+        CategoryFactory.create_batch(2, name='Poetry')
+
+        response = self.client.post(
+            reverse('book-list'),
+            {'title': 'Odes', 'category': 'Poetry', 'authors': []},
+        )
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
+        assert response.json()['category'] == ['Invalid value.']
@@ -0,0 +1,115 @@
+import json
+
+import brotli
+import pytest
+import yaml
+from django.core.management import call_command
+from django.urls import reverse
+from drf_spectacular.views import SpectacularAPIView
+from rest_framework.status import HTTP_200_OK, HTTP_304_NOT_MODIFIED
+from rest_framework.test import APIClient, APIRequestFactory
+
+from utils import schema
+
+
+@pytest.fixture(autouse=True)
+def schema_cache_dir(settings, tmp_path):
+    settings.SCHEMA_CACHE_DIR = tmp_path
+    schema.clear_cache()
+    yield tmp_path
+    schema.clear_cache()
+
+
+@pytest.mark.django_db
+class TestSchemaEndpoint:
+    def setup_method(self):
+        self.client = APIClient()
+        self.url = reverse('schema')
+
+    def _spectacular_response(self, **extra):
+        request = APIRequestFactory().get(self.url, **extra)
+        response = SpectacularAPIView.as_view()(request)
+        response.render()
+        return response
+
+    def test_yaml_matches_spectacular(self):
+        expected = self._spectacular_response()
+        response = self.client.get(self.url)
+
+        assert response.status_code == HTTP_200_OK
+        assert response['Content-Type'] == expected['Content-Type']
+        assert yaml.safe_load(response.content) == yaml.safe_load(
+            expected.content
+        )
+
+    def test_json_matches_spectacular(self):
+        expected = self._spectacular_response(
+            HTTP_ACCEPT='application/vnd.oai.openapi+json'
+        )
+        response = self.client.get(
+            self.url, HTTP_ACCEPT='application/vnd.oai.openapi+json'
+        )
+
+        assert response['Content-Type'] == expected['Content-Type']
+        assert json.loads(response.content) == json.loads(expected.content)
+
+    def test_schema_is_generated_once(self, mocker, schema_cache_dir):
+        generate_schema = mocker.spy(schema, 'generate_schema')
+
+        for _ in range(3):
+            self.client.get(self.url)
+        schema.clear_cache()
+        self.client.get(self.url, {'format': 'json'})
+
+        assert generate_schema.call_count == 1
+        assert schema.schema_path().exists()
+
+    def test_schema_is_regenerated_for_new_code_version(self, mocker):
+        generate_schema = mocker.spy(schema, 'generate_schema')
+        self.client.get(self.url)
+        mocker.patch.object(schema, 'code_version', return_value='new')
+        self.client.get(self.url)
+
+        assert generate_schema.call_count == 2
+        assert [
+            path.name for path in schema.schema_path().parent.iterdir()
+        ] == ['new.json']
+
+    def test_etag(self):
+        response = self.client.get(self.url)
+        not_modified = self.client.get(
+            self.url, HTTP_IF_NONE_MATCH=response['ETag']
+        )
+
+        assert not_modified.status_code == HTTP_304_NOT_MODIFIED
+        assert not not_modified.content
+
+    def test_compressed(self):
+        expected = self.client.get(self.url)
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING='br')
+
+        assert response['Content-Encoding'] == 'br'
+        assert response['ETag'] != expected['ETag']
+        assert brotli.decompress(response.content) == expected.content
+
+    def test_build_schema_command(self, mocker):
+        call_command('build_schema', stdout=mocker.MagicMock())
+        generate_schema = mocker.spy(schema, 'generate_schema')
+        response = self.client.get(self.url)
+
+        assert schema.schema_path().exists()
+        assert response.status_code == HTTP_200_OK
+        assert generate_schema.call_count == 0
+
+    def test_includes_lazily_loaded_views_and_extensions(self):
+        response = self.client.get(self.url, {'format': 'json'})
+        data = json.loads(response.content)
+
+        assert '/api/schema/' in data['paths']
+        assert 'signedTokenAuth' in data['components']['securitySchemes']
+
+    def test_swagger_ui(self):
+        response = self.client.get(reverse('swagger-ui'))
+
+        assert response.status_code == HTTP_200_OK
+        assert reverse('schema') in response.content.decode()
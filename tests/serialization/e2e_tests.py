@@ -0,0 +1,374 @@
+import base64
+from collections import OrderedDict
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from io import BytesIO
+from uuid import UUID, uuid4
+
+import cbor2
+import msgpack
+import pytest
+from django.contrib.auth.models import User
+from django.urls import reverse
+from django.utils.translation import gettext_lazy
+from PIL import Image
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.reverse import reverse as drf_reverse
+from rest_framework.status import HTTP_201_CREATED, HTTP_400_BAD_REQUEST
+from rest_framework.test import APIClient, APIRequestFactory
+
+from books.reference import warm_all
+from utils.hyperlinks import get_url_builder
+from utils.parsers import msgpack_ext_hook
+from utils.renderers import MessagePackRenderer, ORJSONRenderer
+
+from ..authors.factories import AuthorFactory
+from ..book_copies.factories import BookCopyFactory
+from ..books.factories import BookFactory
+from ..categories.factories import CategoryFactory
+from ..publishers.factories import PublisherFactory
+
+
+@pytest.mark.django_db
+class TestCompiledSerializers:
+    def setup_method(self):
+        self.client = APIClient()
+        self.book_copies = BookCopyFactory.create_batch(3)
+        self.book_without_category = BookFactory(category=None)
+        self.book_copy_without_cover = BookCopyFactory(
+            book=self.book_without_category, cover=None
+        )
+        self.author = AuthorFactory()
+
+    def _assert_same_content(self, settings, url, data=None):
+        settings.COMPILED_SERIALIZERS = False
+        expected = self.client.get(url, data)
+        settings.COMPILED_SERIALIZERS = True
+        response = self.client.get(url, data)
+
+        assert response.status_code == expected.status_code
+        assert response.content == expected.content
+
+    @pytest.mark.parametrize(
+        'url_name',
+        [
+            'author-list',
+            'book-list',
+            'bookcopy-list',
+            'category-list',
+            'publisher-list',
+        ],
+    )
+    def test_list_matches_serializer(self, settings, url_name):
+        self._assert_same_content(settings, reverse(url_name))
+
+    @pytest.mark.parametrize(
+        'data',
+        [
+            {'expand': 'book'},
+            {'expand': 'book.authors'},
+            {'expand': '~all'},
+            {'fields': 'id,book', 'expand': 'book'},
+            {'omit': 'url,cover'},
+            {'limit': 2, 'offset': 1},
+            {'search': 'a'},
+        ],
+    )
+    def test_book_copies_list_options_match_serializer(self, settings, data):
+        self._assert_same_content(settings, reverse('bookcopy-list'), data)
+
+    @pytest.mark.parametrize(
+        'data',
+        [
+            {'expand': 'authors'},
+            {'fields': 'title,category'},
+            {'category': 'unknown'},
+        ],
+    )
+    def test_books_list_options_match_serializer(self, settings, data):
+        self._assert_same_content(settings, reverse('book-list'), data)
+
+    def test_retrieve_matches_serializer(self, settings):
+        book_copy = self.book_copies[0]
+        self._assert_same_content(
+            settings,
+            reverse('bookcopy-detail', kwargs={'pk': book_copy.pk}),
+            {'expand': 'book.authors'},
+        )
+        self._assert_same_content(
+            settings,
+            reverse('book-detail', kwargs={'pk': book_copy.book.pk}),
+        )
+        self._assert_same_content(
+            settings,
+            reverse('author-detail', kwargs={'pk': self.author.pk}),
+        )
+
+    def test_retrieve_with_format_suffix_matches_serializer(self, settings):
+        book_copy = self.book_copies[0]
+        url = reverse('bookcopy-detail', kwargs={'pk': book_copy.pk})
+        self._assert_same_content(settings, url.rstrip('/') + '.json')
+
+    def test_retrieve_not_found_matches_serializer(self, settings):
+        self._assert_same_content(
+            settings, reverse('book-detail', kwargs={'pk': 'not-a-uuid'})
+        )
+        self._assert_same_content(
+            settings,
+            reverse('book-detail', kwargs={'pk': self.author.pk}),
+        )
+
+    def test_list_does_not_query_per_row(
+        self, settings, no_throttling, django_assert_max_num_queries
+    ):
+        settings.COMPILED_SERIALIZERS = True
+        BookCopyFactory.create_batch(5)
+        warm_all()
+
+        # count, page rows, books, book authors, authors, book publishers
+        with django_assert_max_num_queries(6):
+            self.client.get(
+                reverse('bookcopy-list'), {'expand': 'book.authors'}
+            )
+
+
+@pytest.mark.django_db
+class TestURLBuilder:
+    def setup_method(self):
+        self.request = Request(APIRequestFactory().get('/api/books/'))
+
+    @pytest.mark.parametrize(
+        'view_name, pk, format',
+        [
+            ('book-detail', uuid4(), None),
+            ('book-detail', uuid4(), 'json'),
+            ('category-detail', 42, None),
+            ('category-detail', 'some value', None),
+        ],
+    )
+    def test_url_matches_reverse(self, view_name, pk, format):
+        builder = get_url_builder(self.request)
+        expected = drf_reverse(
+            view_name, kwargs={'pk': pk}, request=self.request, format=format
+        )
+
+        assert builder.url(view_name, 'pk', pk, format) == expected
+        assert builder.url(view_name, 'pk', pk, format) == expected
+
+    def test_builder_is_shared_per_request(self):
+        assert get_url_builder(self.request) is get_url_builder(self.request)
+
+
+class TestORJSONRenderer:
+    def test_render_matches_json_renderer(self):
+        data = OrderedDict(
+            [
+                ('id', uuid4()),
+                ('date_published', date(2023, 1, 31)),
+                (
+                    'created',
+                    datetime(2023, 1, 31, 12, 30, tzinfo=timezone.utc),
+                ),
+                ('price', Decimal('10.50')),
+                ('label', gettext_lazy('Book')),
+                ('title', 'Line\u2028separated \u00e9'),
+                ('results', [{'id': 1}, {'id': None}]),
+            ]
+        )
+
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_indented_render_matches_json_renderer(self):
+        data = {'id': uuid4(), 'names': ['a', 'b']}
+        media_type = 'application/json; indent=4'
+
+        assert ORJSONRenderer().render(
+            data, media_type
+        ) == JSONRenderer().render(data, media_type)
+
+    def test_render_stream_matches_render(self):
+        renderer = ORJSONRenderer()
+        items = [{'id': uuid4()} for _ in range(5)]
+        data = OrderedDict([('count', 5), ('next', None), ('results', items)])
+
+        streamed = b''.join(
+            renderer.render_stream(data, [items[:2], [], items[2:]])
+        )
+
+        assert streamed == renderer.render(data)
+
+
+@pytest.mark.django_db
+class TestStreamingList:
+    def setup_method(self):
+        self.client = APIClient()
+        BookCopyFactory.create_batch(3)
+
+    @pytest.mark.parametrize(
+        'data',
+        [
+            {'limit': 2},
+            {'limit': 2, 'offset': 2, 'expand': 'book.authors'},
+            {'limit': 5, 'offset': 10},
+        ],
+    )
+    def test_streamed_page_matches_rendered_page(self, settings, data):
+        settings.STREAMING_LIST_THRESHOLD = None
+        expected = self.client.get(reverse('bookcopy-list'), data)
+        settings.STREAMING_LIST_THRESHOLD = 2
+        response = self.client.get(reverse('bookcopy-list'), data)
+
+        assert response.streaming
+        assert response['Content-Type'] == expected['Content-Type']
+        assert b''.join(response.streaming_content) == expected.content
+
+    def test_small_pages_are_not_streamed(self, settings):
+        settings.STREAMING_LIST_THRESHOLD = 2
+        response = self.client.get(reverse('bookcopy-list'), {'limit': 1})
+
+        assert not response.streaming
+
+    def test_browsable_api_is_not_streamed(self, settings):
+        settings.STREAMING_LIST_THRESHOLD = 2
+        response = self.client.get(
+            reverse('bookcopy-list'), {'limit': 2}, HTTP_ACCEPT='text/html'
+        )
+
+        assert not response.streaming
+
+
+def _image_in_base64():
+    image_file = BytesIO()
+    Image.new('RGB', size=(64, 48)).save(image_file, format='jpeg')
+
+    return base64.b64encode(image_file.getvalue()).decode('utf-8')
+
+
+def _msgpack_loads(content):
+    return msgpack.unpackb(content, ext_hook=msgpack_ext_hook)
+
+
+def _msgpack_dumps(data):
+    return MessagePackRenderer().render(data)
+
+
+def _as_json_types(data):
+    if isinstance(data, dict):
+        return {key: _as_json_types(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [_as_json_types(value) for value in data]
+    if isinstance(data, UUID):
+        return str(data)
+    if isinstance(data, date):
+        return data.isoformat()
+    return data
+
+
+BINARY_FORMATS = [
+    ('application/msgpack', _msgpack_loads, _msgpack_dumps),
+    ('application/cbor', cbor2.loads, cbor2.dumps),
+]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('media_type, loads, dumps', BINARY_FORMATS)
+class TestBinaryFormats:
+    def setup_method(self):
+        self.client = APIClient()
+        self.admin_user = User.objects.create_user(
+            username='admin',
+            email='admin@example.com',
+            password='password',
+            is_staff=True,
+        )
+        self.book_copies = BookCopyFactory.create_batch(3)
+
+    @pytest.mark.parametrize('compiled', [True, False])
+    @pytest.mark.parametrize(
+        'url_name, data',
+        [
+            ('book-list', {'expand': 'authors'}),
+            ('bookcopy-list', {'expand': 'book.authors'}),
+            ('author-list', {}),
+        ],
+    )
+    def test_list_matches_json(
+        self, settings, media_type, loads, dumps, compiled, url_name, data
+    ):
+        settings.COMPILED_SERIALIZERS = compiled
+        url = reverse(url_name)
+        expected = self.client.get(url, data).json()
+        response = self.client.get(url, data, HTTP_ACCEPT=media_type)
+
+        assert response['Content-Type'] == media_type
+        assert _as_json_types(loads(response.content)) == expected
+
+    @pytest.mark.parametrize('compiled', [True, False])
+    def test_uuids_and_dates_are_native(
+        self, settings, media_type, loads, dumps, compiled
+    ):
+        settings.COMPILED_SERIALIZERS = compiled
+        book_copy = self.book_copies[0]
+        book_copy.refresh_from_db()
+        url = reverse('bookcopy-detail', kwargs={'pk': book_copy.pk})
+        response = self.client.get(url, HTTP_ACCEPT=media_type)
+        data = loads(response.content)
+
+        assert data['id'] == book_copy.pk
+        assert data['book'] == book_copy.book.pk
+        assert data['date_published'] == book_copy.date_published
+
+    def test_post_book(self, media_type, loads, dumps):
+        self.client.force_authenticate(self.admin_user)
+        category = CategoryFactory()
+        authors = [copy.book.authors.first() for copy in self.book_copies]
+        response = self.client.post(
+            reverse('book-list'),
+            dumps(
+                {
+                    'title': 'Title',
+                    'authors': [author.pk for author in authors],
+                    'category': category.name,
+                }
+            ),
+            content_type=media_type,
+            HTTP_ACCEPT=media_type,
+        )
+        data = loads(response.content)
+
+        assert response.status_code == HTTP_201_CREATED
+        assert isinstance(data['id'], UUID)
+        assert sorted(data['authors']) == sorted(a.pk for a in authors)
+        assert data['category'] == category.name
+
+    def test_post_book_copy(self, media_type, loads, dumps):
+        self.client.force_authenticate(self.admin_user)
+        book = BookFactory()
+        publisher = PublisherFactory()
+        response = self.client.post(
+            reverse('bookcopy-list'),
+            dumps(
+                {
+                    'book': book.pk,
+                    'date_published': date(2020, 2, 29),
+                    'publisher': publisher.name,
+                    'cover': _image_in_base64(),
+                }
+            ),
+            content_type=media_type,
+            HTTP_ACCEPT=media_type,
+        )
+        data = loads(response.content)
+
+        assert response.status_code == HTTP_201_CREATED
+        assert data['book'] == book.pk
+        assert data['date_published'] == date(2020, 2, 29)
+
+    def test_malformed_body(self, media_type, loads, dumps):
+        self.client.force_authenticate(self.admin_user)
+        response = self.client.post(
+            reverse('book-list'), b'\xc1', content_type=media_type
+        )
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
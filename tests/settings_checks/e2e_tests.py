@@ -0,0 +1,139 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import SystemCheckError
+
+from utils import checks
+
+LOCMEM_CACHE = 'django.core.cache.backends.locmem.LocMemCache'
+POSTGRES = 'django.db.backends.postgresql'
+
+# The checks only read DATABASES; the open connections are left alone.
+pytestmark = pytest.mark.filterwarnings('ignore:Overriding setting DATABASES')
+
+
+@pytest.fixture
+def tuned(settings):
+    settings.DEBUG = False
+    settings.CACHES = {'default': {'BACKEND': LOCMEM_CACHE}}
+    settings.COALESCE_CACHE_ALIAS = None
+    settings.DATABASES = {'default': {'ENGINE': POSTGRES, 'CONN_MAX_AGE': 60}}
+    settings.STATICFILES_STORAGE = (
+        'django.contrib.staticfiles.storage.ManifestStaticFilesStorage'
+    )
+    return settings
+
+
+def issue_ids(*check_functions):
+    return [error.id for check in check_functions for error in check(None)]
+
+
+ALL_CHECKS = (
+    checks.check_debug,
+    checks.check_caches,
+    checks.check_databases,
+    checks.check_templates,
+    checks.check_static_files,
+)
+
+
+def test_tuned_settings_pass(tuned):
+    assert issue_ids(*ALL_CHECKS) == []
+
+
+def test_debug(tuned):
+    tuned.DEBUG = True
+
+    assert issue_ids(checks.check_debug) == ['utils.W001']
+
+
+def test_dummy_cache(tuned):
+    tuned.CACHES = {
+        'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}
+    }
+
+    assert issue_ids(checks.check_caches) == ['utils.W002']
+
+
+def test_coalescing_through_a_per_process_cache(tuned):
+    tuned.COALESCE_CACHE_ALIAS = 'default'
+
+    assert issue_ids(checks.check_caches) == ['utils.W003']
+
+
+def test_coalescing_through_a_missing_cache(tuned):
+    tuned.COALESCE_CACHE_ALIAS = 'shared'
+
+    assert issue_ids(checks.check_caches) == ['utils.E001']
+
+
+def test_sqlite(tuned):
+    tuned.DATABASES = {
+        'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': 'x'}
+    }
+
+    assert issue_ids(checks.check_databases) == ['utils.W004']
+
+
+def test_non_persistent_connections(tuned):
+    tuned.DATABASES = {'default': {'ENGINE': POSTGRES, 'CONN_MAX_AGE': 0}}
+
+    assert issue_ids(checks.check_databases) == ['utils.W005']
+
+
+def test_uncached_template_loaders(tuned):
+    tuned.TEMPLATES = [
+        {
+            'BACKEND': 'django.template.backends.django.DjangoTemplates',
+            'OPTIONS': {
+                'loaders': ['django.template.loaders.app_directories.Loader']
+            },
+        }
+    ]
+
+    assert issue_ids(checks.check_templates) == ['utils.W006']
+
+
+def test_cached_template_loaders(tuned):
+    tuned.TEMPLATES = [
+        {
+            'BACKEND': 'django.template.backends.django.DjangoTemplates',
+            'OPTIONS': {
+                'loaders': [
+                    (
+                        checks.CACHED_LOADER,
+                        ['django.template.loaders.app_directories.Loader'],
+                    )
+                ]
+            },
+        }
+    ]
+
+    assert issue_ids(checks.check_templates) == []
+
+
+def test_unhashed_static_files(tuned):
+    tuned.STATICFILES_STORAGE = (
+        'django.contrib.staticfiles.storage.StaticFilesStorage'
+    )
+
+    assert issue_ids(checks.check_static_files) == ['utils.W007']
+
+
+def test_command_reports_issues(tuned):
+    tuned.DEBUG = True
+    stderr = StringIO()
+
+    call_command('check_performance', stderr=stderr, stdout=StringIO())
+
+    assert 'utils.W001' in stderr.getvalue()
+
+
+def test_command_fail_level(tuned):
+    tuned.DEBUG = True
+
+    with pytest.raises(SystemCheckError):
+        call_command(
+            'check_performance', fail_level='WARNING', stdout=StringIO()
+        )
@@ -0,0 +1,130 @@
+import gzip
+
+import brotli
+import pytest
+import zstandard
+from django.core.management import call_command
+from django.templatetags.static import static
+from rest_framework.status import (
+    HTTP_200_OK,
+    HTTP_304_NOT_MODIFIED,
+    HTTP_404_NOT_FOUND,
+)
+from rest_framework.test import APIClient
+
+from utils.staticfiles import IMMUTABLE_CACHE_CONTROL
+
+CSS = b'.book { color: #333; }\n' * 100
+
+
+@pytest.fixture
+def collected(settings, tmp_path):
+    source = tmp_path / 'source'
+    (source / 'css').mkdir(parents=True)
+    (source / 'css' / 'app.css').write_bytes(CSS)
+    (source / 'logo.png').write_bytes(b'\x89PNG\r\n\x1a\n' + b'\0' * 500)
+
+    settings.STATIC_ROOT = tmp_path / 'static'
+    settings.STATICFILES_DIRS = [source]
+    settings.STATICFILES_FINDERS = [
+        'django.contrib.staticfiles.finders.FileSystemFinder'
+    ]
+    settings.STATICFILES_STORAGE = (
+        'utils.storage.CompressedManifestStaticFilesStorage'
+    )
+    call_command('collectstatic', interactive=False, verbosity=0)
+
+    settings.SERVE_STATIC = True
+    return settings.STATIC_ROOT
+
+
+def test_collectstatic_precompresses(collected):
+    hashed = static('css/app.css').split('/static/')[-1]
+
+    assert gzip.decompress((collected / f'{hashed}.gz').read_bytes()) == CSS
+    assert brotli.decompress((collected / f'{hashed}.br').read_bytes()) == CSS
+    assert (
+        zstandard.decompress((collected / f'{hashed}.zst').read_bytes()) == CSS
+    )
+    assert (collected / 'css' / 'app.css.br').exists()
+    assert not (collected / 'logo.png.br').exists()
+
+
+@pytest.mark.django_db
+class TestStaticFilesMiddleware:
+    @pytest.fixture(autouse=True)
+    def setup(self, collected):
+        self.client = APIClient()
+        self.url = static('css/app.css')
+
+    def test_hashed_name_is_immutable(self):
+        response = self.client.get(self.url)
+
+        assert response.status_code == HTTP_200_OK
+        assert response['Content-Type'] == 'text/css'
+        assert response['Cache-Control'] == IMMUTABLE_CACHE_CONTROL
+        assert response['Content-Length'] == str(len(CSS))
+        assert response.streaming
+        assert response.getvalue() == CSS
+
+    def test_unhashed_name(self, settings):
+        response = self.client.get('/static/css/app.css')
+
+        assert response.status_code == HTTP_200_OK
+        assert response['Cache-Control'] == (
+            f'public, max-age={settings.STATIC_MAX_AGE}'
+        )
+
+    @pytest.mark.parametrize(
+        'coding, decompress',
+        [
+            ('br', brotli.decompress),
+            ('gzip', gzip.decompress),
+            ('zstd', zstandard.decompress),
+        ],
+    )
+    def test_precompressed(self, coding, decompress):
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING=coding)
+
+        assert response['Content-Encoding'] == coding
+        assert response['Vary'] == 'Accept-Encoding'
+        content = response.getvalue()
+        assert response['Content-Length'] == str(len(content))
+        assert decompress(content) == CSS
+
+    def test_prefers_the_configured_coding(self):
+        response = self.client.get(
+            self.url, HTTP_ACCEPT_ENCODING='gzip, br, zstd'
+        )
+
+        assert response['Content-Encoding'] == 'zstd'
+
+    def test_not_modified(self):
+        etag = self.client.get(self.url, HTTP_ACCEPT_ENCODING='br')['ETag']
+        response = self.client.get(
+            self.url, HTTP_ACCEPT_ENCODING='br', HTTP_IF_NONE_MATCH=etag
+        )
+        identity = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == HTTP_304_NOT_MODIFIED
+        assert identity.status_code == HTTP_200_OK
+
+    def test_incompressible_file(self):
+        response = self.client.get(
+            static('logo.png'), HTTP_ACCEPT_ENCODING='br'
+        )
+
+        assert response['Content-Type'] == 'image/png'
+        assert not response.has_header('Content-Encoding')
+        assert not response.has_header('Vary')
+
+    def test_missing_file(self):
+        response = self.client.get('/static/css/missing.css')
+
+        assert response.status_code == HTTP_404_NOT_FOUND
+
+    def test_disabled(self, settings):
+        settings.SERVE_STATIC = False
+        response = APIClient().get(self.url)
+
+        assert response.status_code == HTTP_404_NOT_FOUND
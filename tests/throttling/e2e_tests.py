@@ -0,0 +1,181 @@
+import fcntl
+import os
+from io import StringIO
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.status import (
+    HTTP_200_OK,
+    HTTP_429_TOO_MANY_REQUESTS,
+    HTTP_503_SERVICE_UNAVAILABLE,
+)
+from rest_framework.test import APIClient
+
+from throttling.buckets import consume
+from throttling.concurrency import SlotSemaphore
+from throttling.models import Bucket
+from throttling.tasks import purge_full_buckets
+
+from ..book_copies.factories import BookCopyFactory
+
+
+@pytest.mark.django_db
+class TestTokenBuckets:
+    def test_bucket_allows_a_burst_then_refills(self):
+        for _ in range(3):
+            assert consume('a', 1, capacity=3, refill_rate=1, now=100) == 0
+
+        assert consume('a', 1, capacity=3, refill_rate=1, now=100) == 1
+        assert consume('a', 1, capacity=3, refill_rate=1, now=101) == 0
+
+    def test_costly_requests_take_more_tokens(self):
+        assert consume('a', 2, capacity=3, refill_rate=1, now=100) == 0
+        assert consume('a', 2, capacity=3, refill_rate=1, now=100) == 1
+        assert consume('a', 1, capacity=3, refill_rate=1, now=100) == 0
+
+    def test_buckets_are_per_key(self):
+        assert consume('a', 3, capacity=3, refill_rate=1, now=100) == 0
+        assert consume('b', 3, capacity=3, refill_rate=1, now=100) == 0
+
+    def test_purge_full_buckets(self):
+        consume('a', 1, capacity=3, refill_rate=1, now=100)
+        consume('b', 1, capacity=3, refill_rate=1)
+
+        purge_full_buckets()
+
+        assert list(Bucket.objects.values_list('key', flat=True)) == ['b']
+
+    def test_workers_purge_full_buckets_on_schedule(self):
+        consume('a', 1, capacity=3, refill_rate=1, now=100)
+        consume('b', 1, capacity=3, refill_rate=1)
+
+        call_command(
+            'run_worker', '--burst', '--pool=inline', stdout=StringIO()
+        )
+
+        assert list(Bucket.objects.values_list('key', flat=True)) == ['b']
+
+
+@pytest.mark.django_db
+class TestThrottling:
+    @pytest.fixture(autouse=True)
+    def rates(self, settings):
+        settings.REST_FRAMEWORK = {
+            **settings.REST_FRAMEWORK,
+            'DEFAULT_THROTTLE_RATES': {'anon': '5/min', 'user': '10/min'},
+        }
+
+    def setup_method(self):
+        self.client = APIClient()
+
+    def test_anonymous_clients_are_limited(self):
+        url = reverse('bookcopy-list')
+        for _ in range(5):
+            assert self.client.get(url).status_code == HTTP_200_OK
+
+        response = self.client.get(url)
+
+        assert response.status_code == HTTP_429_TOO_MANY_REQUESTS
+        assert int(response['Retry-After']) == 12
+
+    def test_searches_cost_more(self):
+        BookCopyFactory()
+        url = reverse('bookcopy-list')
+
+        response = self.client.get(url, {'search': 'a'})
+        assert response.status_code == HTTP_200_OK
+
+        # One search took the tokens of five plain lists.
+        response = self.client.get(url)
+        assert response.status_code == HTTP_429_TOO_MANY_REQUESTS
+
+    def test_spoofed_forwarded_for_does_not_get_a_new_bucket(self):
+        url = reverse('bookcopy-list')
+        for i in range(5):
+            response = self.client.get(
+                url, HTTP_X_FORWARDED_FOR=f'203.0.113.{i}'
+            )
+            assert response.status_code == HTTP_200_OK
+
+        response = self.client.get(url, HTTP_X_FORWARDED_FOR='203.0.113.99')
+
+        assert response.status_code == HTTP_429_TOO_MANY_REQUESTS
+        assert Bucket.objects.count() == 1
+
+    def test_cheap_views_are_not_throttled(self):
+        url = reverse('category-list')
+        for _ in range(10):
+            assert self.client.get(url).status_code == HTTP_200_OK
+
+        assert not Bucket.objects.exists()
+
+    def test_users_are_limited_by_account(self):
+        url = reverse('bookcopy-list')
+        for _ in range(5):
+            self.client.get(url)
+
+        self.client.force_authenticate(User.objects.create_user('patron'))
+
+        assert self.client.get(url).status_code == HTTP_200_OK
+
+    def test_staff_is_not_limited(self):
+        self.client.force_authenticate(
+            User.objects.create_user('staff', is_staff=True)
+        )
+        url = reverse('bookcopy-list')
+
+        for _ in range(20):
+            assert self.client.get(url).status_code == HTTP_200_OK
+
+
+class TestSlotSemaphore:
+    def test_slots_are_shared_through_lock_files(self, tmp_path):
+        semaphore = SlotSemaphore(tmp_path, 2)
+
+        slots = {semaphore.acquire(), semaphore.acquire()}
+        assert slots == {0, 1}
+        assert semaphore.acquire() is None
+
+        semaphore.release(0)
+        assert semaphore.acquire() == 0
+
+    def test_slots_held_by_other_processes_are_skipped(self, tmp_path):
+        semaphore = SlotSemaphore(tmp_path, 2)
+        semaphore.acquire()
+        other = os.open(tmp_path / 'slot-0', os.O_RDWR)
+        try:
+            fcntl.flock(other, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(other)
+            other = os.open(tmp_path / 'slot-1', os.O_RDWR)
+            fcntl.flock(other, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+        try:
+            assert semaphore.acquire() is None
+        finally:
+            os.close(other)
+
+        assert semaphore.acquire() is not None
+
+
+@pytest.mark.django_db
+class TestConcurrencyLimit:
+    def test_requests_over_the_limit_are_shed(self, settings, tmp_path):
+        settings.MAX_CONCURRENT_REQUESTS = 1
+        settings.CONCURRENCY_LOCK_DIR = tmp_path
+        client = APIClient()
+        url = reverse('category-list')
+        assert client.get(url).status_code == HTTP_200_OK
+
+        other = os.open(tmp_path / 'slot-0', os.O_RDWR)
+        fcntl.flock(other, fcntl.LOCK_EX)
+        try:
+            response = client.get(url)
+        finally:
+            os.close(other)
+
+        assert response.status_code == HTTP_503_SERVICE_UNAVAILABLE
+        assert response['Retry-After'] == '1'
+        assert client.get(url).status_code == HTTP_200_OK
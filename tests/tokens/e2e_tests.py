@@ -0,0 +1,174 @@
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.status import (
+    HTTP_200_OK,
+    HTTP_201_CREATED,
+    HTTP_204_NO_CONTENT,
+    HTTP_400_BAD_REQUEST,
+    HTTP_403_FORBIDDEN,
+)
+from rest_framework.test import APIClient
+
+from tokens.models import RevokedToken
+from tokens.revocation import revoked_tokens
+from tokens.signing import issue_token, read_token, token_user
+from tokens.tasks import purge_revoked_tokens
+
+from ..loans.factories import LoanFactory
+
+
+@pytest.mark.django_db
+class TestSignedTokens:
+    def setup_method(self):
+        self.client = APIClient()
+        self.url = reverse('category-list')
+        self.staff = User.objects.create_user(
+            username='staff', password='password', is_staff=True
+        )
+        revoked_tokens.invalidate()
+
+    def _authenticate(self, token):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def test_obtain_token(self):
+        response = self.client.post(
+            reverse('api-signed-token'),
+            {'username': 'staff', 'password': 'password'},
+        )
+
+        assert response.status_code == HTTP_200_OK
+        claims = read_token(response.json()['token'])
+        assert claims['sub'] == self.staff.pk
+        assert claims['staff'] is True
+        assert claims['su'] is False
+
+    def test_obtain_token_with_wrong_password(self):
+        response = self.client.post(
+            reverse('api-signed-token'),
+            {'username': 'staff', 'password': 'wrong'},
+        )
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
+
+    def test_staff_writes_without_loading_the_user(self):
+        token, _ = issue_token(self.staff)
+        self._authenticate(token)
+        revoked_tokens.refresh()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.url, {'name': 'Poetry'})
+
+        assert response.status_code == HTTP_201_CREATED
+        assert not any('auth_user' in q['sql'] for q in queries)
+        assert not hasattr(response.wsgi_request, 'session')
+
+    def test_non_staff_token_cannot_write(self):
+        patron = User.objects.create_user(username='patron')
+        token, _ = issue_token(patron)
+        self._authenticate(token)
+
+        response = self.client.post(self.url, {'name': 'Poetry'})
+
+        assert response.status_code == HTTP_403_FORBIDDEN
+
+    def test_patrons_see_their_own_loans(self):
+        loan = LoanFactory()
+        LoanFactory()
+        token, _ = issue_token(loan.patron)
+        self._authenticate(token)
+
+        response = self.client.get(reverse('loan-list'))
+
+        assert [item['id'] for item in response.json()['results']] == [
+            str(loan.pk)
+        ]
+
+    def test_tampered_token(self):
+        token, _ = issue_token(self.staff)
+        self._authenticate(token[:-1] + ('A' if token[-1] != 'A' else 'B'))
+
+        response = self.client.post(self.url, {'name': 'Poetry'})
+
+        assert response.status_code == HTTP_403_FORBIDDEN
+
+    def test_expired_token(self):
+        token, _ = issue_token(self.staff, lifetime=-1)
+        self._authenticate(token)
+
+        response = self.client.post(self.url, {'name': 'Poetry'})
+
+        assert response.status_code == HTTP_403_FORBIDDEN
+        assert response.json()['detail'] == 'Token has expired.'
+
+    def test_revoke_token(self):
+        token, _ = issue_token(self.staff)
+        self._authenticate(token)
+
+        response = self.client.post(reverse('api-signed-token-revoke'))
+        assert response.status_code == HTTP_204_NO_CONTENT
+
+        response = self.client.post(self.url, {'name': 'Poetry'})
+        assert response.status_code == HTTP_403_FORBIDDEN
+        assert response.json()['detail'] == 'Token has been revoked.'
+
+    def test_revocations_from_other_processes_apply_on_refresh(self, settings):
+        settings.TOKEN_REVOCATION_REFRESH_SECONDS = 3600
+        token, expires_at = issue_token(self.staff)
+        self._authenticate(token)
+        self.client.get(self.url)
+        RevokedToken.objects.create(
+            jti=read_token(token)['jti'], expires_at=expires_at
+        )
+
+        response = self.client.post(self.url, {'name': 'Poetry'})
+        assert response.status_code == HTTP_201_CREATED
+
+        settings.TOKEN_REVOCATION_REFRESH_SECONDS = 0
+        response = self.client.post(self.url, {'name': 'Fiction'})
+        assert response.status_code == HTTP_403_FORBIDDEN
+
+    def test_purge_expired_revocations(self):
+        now = timezone.now()
+        RevokedToken.objects.create(jti='a', expires_at=now - timedelta(1))
+        RevokedToken.objects.create(jti='b', expires_at=now + timedelta(1))
+
+        purge_revoked_tokens()
+
+        assert list(RevokedToken.objects.values_list('jti', flat=True)) == [
+            'b'
+        ]
+
+    def test_workers_purge_expired_revocations_on_schedule(self):
+        now = timezone.now()
+        RevokedToken.objects.create(jti='a', expires_at=now - timedelta(1))
+        RevokedToken.objects.create(jti='b', expires_at=now + timedelta(1))
+
+        call_command(
+            'run_worker', '--burst', '--pool=inline', stdout=StringIO()
+        )
+
+        assert list(RevokedToken.objects.values_list('jti', flat=True)) == [
+            'b'
+        ]
+
+
+@pytest.mark.django_db
+def test_token_user_loads_other_fields_on_access():
+    user = User.objects.create_user(username='patron', email='p@example.com')
+    claims = read_token(issue_token(user)[0])
+
+    principal = token_user(claims)
+
+    assert principal == user
+    assert principal.username == 'patron'
+    assert (principal.is_staff, principal.is_superuser) == (False, False)
+    assert principal.get_deferred_fields()
+    assert principal.email == 'p@example.com'
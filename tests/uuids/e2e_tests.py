@@ -0,0 +1,68 @@
+import time
+from uuid import RFC_4122, UUID
+
+import pytest
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.status import HTTP_201_CREATED
+from rest_framework.test import APIClient
+
+from utils.uuids import generate_uuid, uuid7
+
+from ..book_copies.factories import BookCopyFactory
+
+
+class TestUUID7:
+    def test_version_and_variant(self):
+        value = uuid7()
+
+        assert value.version == 7
+        assert value.variant == RFC_4122
+
+    def test_embeds_current_time(self):
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+
+        assert before <= value.int >> 80 <= after
+
+    def test_ids_are_ordered(self):
+        values = [uuid7() for _ in range(10_000)]
+
+        assert values == sorted(values)
+        assert len(set(values)) == len(values)
+
+    def test_generate_uuid_follows_setting(self, settings):
+        settings.TIME_ORDERED_UUIDS = True
+        assert generate_uuid().version == 7
+
+        settings.TIME_ORDERED_UUIDS = False
+        assert generate_uuid().version == 4
+
+
+@pytest.mark.django_db
+class TestTimeOrderedPrimaryKeys:
+    def setup_method(self):
+        self.client = APIClient()
+        self.admin_user = User.objects.create_user(
+            username='admin',
+            email='admin@example.com',
+            password='password',
+            is_staff=True,
+        )
+
+    def test_new_rows_get_uuid7(self, settings):
+        settings.TIME_ORDERED_UUIDS = True
+        book_copy = BookCopyFactory()
+
+        assert book_copy.pk.version == 7
+        assert book_copy.book.pk.version == 7
+        assert book_copy.book.authors.first().pk.version == 7
+
+    def test_post_author_gets_uuid7(self, settings):
+        settings.TIME_ORDERED_UUIDS = True
+        self.client.force_authenticate(self.admin_user)
+        response = self.client.post(reverse('author-list'), {'name': 'Name'})
+
+        assert response.status_code == HTTP_201_CREATED
+        assert UUID(response.data['id']).version == 7
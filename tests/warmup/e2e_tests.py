@@ -0,0 +1,110 @@
+from io import StringIO
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from rest_framework.test import APIClient
+
+from books.reference import category_names
+from utils import middleware, schema
+from utils.warmup import hot_urls, urls_from_access_log, warm_caches
+
+from ..book_copies.factories import BookCopyFactory
+
+ACCESS_LOG = """\
+10.0.0.1 - - [19/Oct/2026:10:00:00 +0000] "GET /api/books/ HTTP/1.1" 200 512
+10.0.0.2 - - [19/Oct/2026:10:00:01 +0000] "GET /api/books/ HTTP/1.1" 200 512
+10.0.0.3 - - [19/Oct/2026:10:00:02 +0000] "GET /api/authors/ HTTP/1.1" 200 90
+10.0.0.3 - - [19/Oct/2026:10:00:03 +0000] "GET /api/nope/ HTTP/1.1" 404 23
+10.0.0.3 - - [19/Oct/2026:10:00:03 +0000] "GET /api/nope/ HTTP/1.1" 404 23
+10.0.0.3 - - [19/Oct/2026:10:00:03 +0000] "GET /api/nope/ HTTP/1.1" 404 23
+10.0.0.4 - - [19/Oct/2026:10:00:04 +0000] "POST /api/loans/ HTTP/1.1" 200 80
+"""
+
+
+@pytest.fixture
+def access_log(tmp_path):
+    path = tmp_path / 'access.log'
+    path.write_text(ACCESS_LOG)
+    return path
+
+
+@pytest.fixture(autouse=True)
+def site(settings):
+    settings.SITE_URL = 'http://testserver'
+
+
+@pytest.mark.django_db
+class TestWarmCaches:
+    def test_requests_the_hot_urls(self, settings):
+        BookCopyFactory()
+        settings.WARMUP_URLS = [
+            '/api/book_copies/?expand=book',
+            '/api/schema/',
+        ]
+        settings.COMPRESSION_ENCODINGS = []
+        schema.clear_cache()
+
+        results = warm_caches(concurrency=1)
+
+        assert [(url, status) for url, _, status, _ in results] == [
+            ('/api/book_copies/?expand=book', 200),
+            ('/api/schema/', 200),
+        ]
+        assert category_names._version is not None
+        assert schema._rendered
+
+    def test_fills_the_compression_cache_for_each_coding(
+        self, settings, mocker
+    ):
+        BookCopyFactory.create_batch(5)
+        settings.WARMUP_URLS = ['/api/book_copies/']
+        settings.COMPRESSION_ENCODINGS = ['gzip', 'br', 'unknown']
+        cache.clear()
+        compress = mocker.spy(middleware, 'compress')
+
+        results = warm_caches(concurrency=1)
+
+        assert [(coding, status) for _, coding, status, _ in results] == [
+            (None, 200),
+            ('gzip', 200),
+            ('br', 200),
+        ]
+        assert compress.call_count == 2
+
+        APIClient().get('/api/book_copies/', HTTP_ACCEPT_ENCODING='gzip')
+        assert compress.call_count == 2
+
+    def test_command_reports_each_url(self, settings):
+        settings.COMPRESSION_ENCODINGS = ['gzip']
+        out = StringIO()
+
+        call_command(
+            'warm_caches',
+            '--url=/api/books/',
+            '--url=/api/missing/',
+            '--concurrency=1',
+            stdout=out,
+        )
+
+        lines = out.getvalue().splitlines()
+        assert lines[0].startswith('200 ')
+        assert lines[0].endswith('identity /api/books/')
+        assert lines[1].endswith('gzip     /api/books/')
+        assert lines[2].startswith('404 ')
+        assert lines[4] == '2 requests failed'
+
+
+def test_urls_from_access_log(access_log):
+    assert urls_from_access_log(access_log, top=5) == [
+        '/api/books/',
+        '/api/authors/',
+    ]
+    assert urls_from_access_log(access_log, top=1) == ['/api/books/']
+
+
+def test_hot_urls_include_the_access_log(settings, access_log):
+    settings.WARMUP_URLS = ['/api/', '/api/books/']
+    settings.WARMUP_ACCESS_LOG = str(access_log)
+
+    assert hot_urls() == ['/api/', '/api/books/', '/api/authors/']
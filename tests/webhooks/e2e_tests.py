@@ -0,0 +1,156 @@
+import hashlib
+import hmac
+import json
+from io import StringIO
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import DatabaseError
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from books.models import Category
+from changes.feed import stamp_changes
+from changes.models import Change
+from webhooks import delivery
+from webhooks.models import Subscription
+
+from ..books.factories import BookFactory
+from ..categories.factories import CategoryFactory
+
+
+@pytest.mark.django_db
+class TestWebhookDelivery:
+    @pytest.fixture(autouse=True)
+    def requests(self, settings, mocker):
+        settings.SITE_URL = 'https://library.example.com'
+        self.requests = []
+        self.failing = False
+
+        def post(url, body, headers, timeout):
+            if self.failing:
+                raise delivery.DeliveryError('HTTP 503')
+            self.requests.append((url, json.loads(body), headers, body))
+
+        mocker.patch.object(delivery, 'post', post)
+
+    def _run(self, *args):
+        call_command(
+            'deliver_webhooks',
+            '--once',
+            '--concurrency=1',
+            *args,
+            stdout=StringIO(),
+        )
+
+    def test_new_subscriptions_start_from_the_next_change(self):
+        CategoryFactory()
+        stamp_changes()
+        subscription = Subscription.objects.create(url='https://a.test/')
+
+        self._run()
+
+        assert self.requests == []
+        assert subscription.cursor == Change.objects.latest('pk').sequence
+
+    def test_changes_are_delivered_in_batches(self):
+        subscription = Subscription.objects.create(url='https://a.test/')
+        categories = CategoryFactory.create_batch(3)
+
+        self._run('--batch-size=2')
+        self._run('--batch-size=2')
+        self._run('--batch-size=2')
+
+        assert len(self.requests) == 2
+        events = [
+            event
+            for _, payload, _, _ in self.requests
+            for event in payload['events']
+        ]
+        assert [event['id'] for event in events] == [
+            str(category.pk) for category in categories
+        ]
+        assert events[0]['data']['url'].startswith(
+            'https://library.example.com/api/categories/'
+        )
+        subscription.refresh_from_db()
+        assert subscription.cursor == self.requests[-1][1]['cursor']
+
+    def test_payloads_are_signed(self):
+        subscription = Subscription.objects.create(url='https://a.test/')
+        CategoryFactory()
+
+        self._run()
+
+        [(_, _, headers, body)] = self.requests
+        expected = hmac.new(
+            subscription.secret.encode(), body, hashlib.sha256
+        ).hexdigest()
+        assert headers['X-Library-Signature'] == f'sha256={expected}'
+
+    def test_subscriptions_filter_models(self):
+        Subscription.objects.create(
+            url='https://a.test/', model_labels=['books.book']
+        )
+        CategoryFactory()
+        book = BookFactory()
+
+        self._run()
+
+        [(_, payload, _, _)] = self.requests
+        assert {event['model'] for event in payload['events']} == {
+            'books.book'
+        }
+        assert payload['events'][-1]['id'] == str(book.pk)
+
+    def test_failed_deliveries_back_off_and_retry(self):
+        subscription = Subscription.objects.create(url='https://a.test/')
+        CategoryFactory()
+        cursor = subscription.cursor
+
+        self.failing = True
+        self._run()
+
+        subscription.refresh_from_db()
+        assert subscription.cursor == cursor
+        assert subscription.failures == 1
+        assert subscription.last_error == 'HTTP 503'
+        assert subscription.next_attempt_at > timezone.now()
+
+        # Not due yet.
+        self.failing = False
+        self._run()
+        assert self.requests == []
+
+        Subscription.objects.update(next_attempt_at=timezone.now())
+        self._run()
+
+        subscription.refresh_from_db()
+        assert len(self.requests) == 1
+        assert subscription.failures == 0
+        assert subscription.cursor > cursor
+
+    def test_writes_are_rolled_back_when_the_outbox_fails(self, mocker):
+        Subscription.objects.create(url='https://a.test/')
+        client = APIClient()
+        client.force_authenticate(
+            User.objects.create_superuser(username='superuser')
+        )
+        mocker.patch(
+            'changes.signals.record',
+            side_effect=DatabaseError('outbox unavailable'),
+        )
+
+        with pytest.raises(DatabaseError):
+            client.post(reverse('category-list'), {'name': 'Lost'})
+
+        assert not Category.objects.filter(name='Lost').exists()
+        self._run()
+        assert self.requests == []
+
+    def test_backoff_grows_up_to_the_maximum(self):
+        assert delivery.backoff(1) <= delivery.BACKOFF_BASE
+        assert delivery.backoff(3) > delivery.BACKOFF_BASE
+        assert delivery.backoff(100) <= delivery.BACKOFF_MAX
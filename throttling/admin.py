@@ -0,0 +1,9 @@
+from django.contrib import admin
+
+from throttling.models import Bucket
+
+
+@admin.register(Bucket)
+class BucketAdmin(admin.ModelAdmin):
+    list_display = ['key', 'full_at']
+    search_fields = ['key']
@@ -0,0 +1,54 @@
+import time
+
+from django.db import IntegrityError, transaction
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
+
+from throttling.models import Bucket
+
+
+def consume(key, cost, capacity, refill_rate, now=None):
+    """
+    Take `cost` tokens from the bucket `key`, which holds up to `capacity`
+    tokens and regains `refill_rate` per second.
+
+    Returns 0 when the tokens were taken, otherwise the seconds until
+    enough of them are available. Each call is one conditional UPDATE, so
+    every process sharing the database sees the same buckets.
+    """
+    if now is None:
+        now = time.time()
+    interval = 1 / refill_rate
+    # A request costing more than the bucket holds takes all of it.
+    increment = min(cost, capacity) * interval
+    # The bucket has room for `cost` tokens when it will be full within
+    # (capacity - cost) intervals.
+    latest = now + capacity * interval - increment
+
+    for _ in range(2):
+        updated = Bucket.objects.filter(key=key, full_at__lte=latest).update(
+            full_at=Greatest(F('full_at'), Value(now)) + increment
+        )
+        if updated:
+            return 0
+
+        full_at = (
+            Bucket.objects.filter(key=key)
+            .values_list('full_at', flat=True)
+            .first()
+        )
+        if full_at is not None:
+            if full_at > latest:
+                return full_at - latest
+            # Refilled since the update, try again.
+            continue
+
+        try:
+            with transaction.atomic():
+                Bucket.objects.create(key=key, full_at=now + increment)
+            return 0
+        except IntegrityError:
+            # Created by a concurrent request, take the tokens from it.
+            continue
+
+    return interval
@@ -0,0 +1,60 @@
+import fcntl
+import os
+import random
+import threading
+from pathlib import Path
+
+
+class SlotSemaphore:
+    """
+    Semaphore shared by every process on the host, made of `slots` lock
+    files in `directory`.
+
+    Acquiring takes an exclusive lock on a free file; the kernel releases
+    the locks of a process that dies, so a crashed worker never leaks
+    slots. Files are reopened after a fork, as forked processes would
+    otherwise share their locks.
+    """
+
+    def __init__(self, directory, slots):
+        self.directory = Path(directory)
+        self.slots = slots
+        self._lock = threading.Lock()
+        self._held = set()
+        self._files = None
+        self._pid = None
+
+    def _open(self):
+        if self._pid != os.getpid():
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._files = [
+                os.open(self.directory / f'slot-{n}', os.O_RDWR | os.O_CREAT)
+                for n in range(self.slots)
+            ]
+            self._held = set()
+            self._pid = os.getpid()
+        return self._files
+
+    def acquire(self):
+        """
+        Return the number of the slot taken, or `None` when all are taken.
+        """
+        with self._lock:
+            files = self._open()
+            start = random.randrange(self.slots)
+            for n in range(self.slots):
+                slot = (start + n) % self.slots
+                if slot in self._held:
+                    continue
+                try:
+                    fcntl.flock(files[slot], fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    continue
+                self._held.add(slot)
+                return slot
+            return None
+
+    def release(self, slot):
+        with self._lock:
+            fcntl.flock(self._files[slot], fcntl.LOCK_UN)
+            self._held.discard(slot)
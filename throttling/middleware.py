@@ -0,0 +1,57 @@
+from django.conf import settings
+from django.http import JsonResponse
+
+from throttling.concurrency import SlotSemaphore
+
+_semaphores = {}
+
+
+def get_semaphore():
+    slots = settings.MAX_CONCURRENT_REQUESTS
+    if not slots:
+        return None
+    key = (str(settings.CONCURRENCY_LOCK_DIR), slots)
+    try:
+        return _semaphores[key]
+    except KeyError:
+        return _semaphores.setdefault(key, SlotSemaphore(*key))
+
+
+class ConcurrencyLimitMiddleware:
+    """
+    Caps the requests in flight across all workers of the host at
+    `settings.MAX_CONCURRENT_REQUESTS`, answering the others with 503 and a
+    Retry-After header instead of queueing them.
+
+    Streaming responses hold their slot until they are closed.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        semaphore = get_semaphore()
+        if semaphore is None:
+            return self.get_response(request)
+
+        slot = semaphore.acquire()
+        if slot is None:
+            response = JsonResponse(
+                {'detail': 'Server is busy, try again later.'}, status=503
+            )
+            response.headers['Retry-After'] = str(
+                settings.CONCURRENCY_RETRY_AFTER
+            )
+            return response
+
+        try:
+            response = self.get_response(request)
+        except BaseException:
+            semaphore.release(slot)
+            raise
+
+        if response.streaming:
+            response._resource_closers.append(lambda: semaphore.release(slot))
+        else:
+            semaphore.release(slot)
+        return response
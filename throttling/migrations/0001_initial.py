@@ -0,0 +1,25 @@
+# Generated by Django 4.1.13 on 2026-10-19 17:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name='Bucket',
+            fields=[
+                (
+                    'key',
+                    models.CharField(
+                        max_length=200, primary_key=True, serialize=False
+                    ),
+                ),
+                ('full_at', models.FloatField(db_index=True)),
+            ],
+        ),
+    ]
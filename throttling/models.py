@@ -0,0 +1,18 @@
+from django.db import models
+
+
+class Bucket(models.Model):
+    """
+    Token bucket of a client, stored as the time it will be full again.
+
+    `full_at` is the theoretical arrival time of the generic cell rate
+    algorithm: spending tokens pushes it forward and it is never earlier
+    than now, so a bucket with `full_at` in the past is full and its row
+    can be dropped.
+    """
+
+    key = models.CharField(max_length=200, primary_key=True)
+    full_at = models.FloatField(db_index=True)
+
+    def __str__(self):
+        return self.key
@@ -0,0 +1,12 @@
+import time
+
+from jobs.registry import task
+from throttling.models import Bucket
+
+
+@task(name='throttling.purge_full_buckets', priority=-10)
+def purge_full_buckets():
+    """
+    Delete the buckets that have refilled, which behave like missing ones.
+    """
+    Bucket.objects.filter(full_at__lte=time.time()).delete()
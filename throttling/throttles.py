@@ -0,0 +1,71 @@
+from django.conf import settings
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+from throttling.buckets import consume
+
+DURATIONS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+def parse_rate(rate):
+    """
+    Return the (capacity, refill rate per second) of a rate such as
+    '120/min', or `None` for no limit.
+    """
+    if rate is None:
+        return None
+    num, period = rate.split('/')
+    return int(num), int(num) / DURATIONS[period[0]]
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    Limits each client with a token bucket of the `anon` or `user` rate of
+    `DEFAULT_THROTTLE_RATES`, keyed by user id or client IP.
+
+    Requests cost one token plus the weight of each query parameter they
+    use in the view's `throttle_costs` (`settings.THROTTLE_COSTS` by
+    default), so searches and expansions drain the bucket faster than plain
+    lists. Staff users are not limited.
+
+    Every throttled request updates its bucket row, so only the views with
+    costly queries set it in `throttle_classes`.
+    """
+
+    def get_scope(self, request):
+        if request.user and request.user.is_authenticated:
+            return 'user'
+        return 'anon'
+
+    def get_cache_key(self, request, view):
+        if request.user and request.user.is_authenticated:
+            return f'user:{request.user.pk}'
+        return f'anon:{self.get_ident(request)}'
+
+    def get_cost(self, request, view):
+        costs = getattr(view, 'throttle_costs', settings.THROTTLE_COSTS)
+        return 1 + sum(
+            weight
+            for param, weight in costs.items()
+            if request.query_params.get(param)
+        )
+
+    def allow_request(self, request, view):
+        if request.user and request.user.is_staff:
+            return True
+
+        rate = parse_rate(
+            api_settings.DEFAULT_THROTTLE_RATES.get(self.get_scope(request))
+        )
+        if rate is None:
+            return True
+
+        self.wait_seconds = consume(
+            self.get_cache_key(request, view),
+            self.get_cost(request, view),
+            *rate,
+        )
+        return self.wait_seconds == 0
+
+    def wait(self):
+        return self.wait_seconds
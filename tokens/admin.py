@@ -0,0 +1,9 @@
+from django.contrib import admin
+
+from tokens.models import RevokedToken
+
+
+@admin.register(RevokedToken)
+class RevokedTokenAdmin(admin.ModelAdmin):
+    list_display = ['jti', 'revoked_at', 'expires_at']
+    date_hierarchy = 'revoked_at'
@@ -0,0 +1,30 @@
+# Generated by Django 4.1.13 on 2026-10-19 17:30
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name='RevokedToken',
+            fields=[
+                (
+                    'jti',
+                    models.CharField(
+                        max_length=32, primary_key=True, serialize=False
+                    ),
+                ),
+                (
+                    'revoked_at',
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                ('expires_at', models.DateTimeField(db_index=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import models
+from django.utils import timezone
+
+
+class RevokedToken(models.Model):
+    """
+    A signed token rejected before it expires. Rows are only needed until
+    `expires_at`, after which the signature check rejects the token anyway.
+    """
+
+    jti = models.CharField(max_length=32, primary_key=True)
+    revoked_at = models.DateTimeField(default=timezone.now)
+    expires_at = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return self.jti
@@ -0,0 +1,59 @@
+import threading
+import time
+
+from django.conf import settings
+from django.utils import timezone
+
+from tokens.models import RevokedToken
+
+
+class RevocationList:
+    """
+    In-memory set of the ids of revoked, unexpired tokens.
+
+    It is reloaded from the database at most every
+    `settings.TOKEN_REVOCATION_REFRESH_SECONDS`, so checking a token costs a
+    set lookup. Tokens revoked by this process are rejected at once, those
+    revoked by other processes once their next refresh has run.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._revoked = frozenset()
+        self._loaded_at = None
+
+    def _is_stale(self):
+        return (
+            self._loaded_at is None
+            or time.monotonic() - self._loaded_at
+            >= settings.TOKEN_REVOCATION_REFRESH_SECONDS
+        )
+
+    def refresh(self):
+        loaded_at = time.monotonic()
+        self._revoked = frozenset(
+            RevokedToken.objects.filter(
+                expires_at__gt=timezone.now()
+            ).values_list('jti', flat=True)
+        )
+        self._loaded_at = loaded_at
+
+    def __contains__(self, jti):
+        if self._is_stale():
+            with self._lock:
+                if self._is_stale():
+                    self.refresh()
+        return jti in self._revoked
+
+    def add(self, jti, expires_at):
+        RevokedToken.objects.get_or_create(
+            jti=jti, defaults={'expires_at': expires_at}
+        )
+        with self._lock:
+            self._revoked = self._revoked | {jti}
+
+    def invalidate(self):
+        self._loaded_at = None
+
+
+revoked_tokens = RevocationList()
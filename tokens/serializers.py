@@ -0,0 +1,6 @@
+from rest_framework import serializers
+
+
+class SignedTokenSerializer(serializers.Serializer):
+    token = serializers.CharField()
+    expires_at = serializers.DateTimeField()
@@ -0,0 +1,84 @@
+import secrets
+import time
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core import signing
+from django.db import router
+
+SALT = 'tokens.signed-token'
+
+
+class InvalidToken(Exception):
+    pass
+
+
+def issue_token(user, lifetime=None):
+    """
+    Return a signed token for `user` and when it expires.
+
+    The token carries the user's id, username and staff/superuser flags, so
+    requests authenticated with it need no database lookups; changes to
+    those flags apply to tokens issued afterwards.
+    """
+    if lifetime is None:
+        lifetime = settings.SIGNED_TOKEN_LIFETIME
+    expires = int(time.time()) + lifetime
+    claims = {
+        'sub': user.pk,
+        'name': user.get_username(),
+        'staff': user.is_staff,
+        'su': user.is_superuser,
+        'jti': secrets.token_hex(16),
+        'exp': expires,
+    }
+    token = signing.dumps(claims, salt=SALT, compress=True)
+    return token, datetime.fromtimestamp(expires, timezone.utc)
+
+
+def read_token(token):
+    """
+    Return the claims of a signed token, raising `InvalidToken` when it was
+    tampered with or has expired.
+    """
+    try:
+        claims = signing.loads(token, salt=SALT)
+    except signing.BadSignature:
+        raise InvalidToken('Invalid token.')
+    if claims['exp'] <= time.time():
+        raise InvalidToken('Token has expired.')
+    return claims
+
+
+def expires_at(claims):
+    return datetime.fromtimestamp(claims['exp'], timezone.utc)
+
+
+def token_user(claims):
+    """
+    Build the user a token was issued to from its claims.
+
+    The instance is loaded like a `.only()` query: the other fields are
+    fetched from the database the first time one of them is read, and
+    saving it only writes the claimed fields.
+    """
+    User = get_user_model()
+    loaded = {
+        User._meta.pk.attname: claims['sub'],
+        User.USERNAME_FIELD: claims['name'],
+        'is_active': True,
+        'is_staff': claims['staff'],
+        'is_superuser': claims['su'],
+    }
+    # from_db() expects the values in the order of the model's fields.
+    field_names = [
+        field.attname
+        for field in User._meta.concrete_fields
+        if field.attname in loaded
+    ]
+    return User.from_db(
+        router.db_for_read(User),
+        field_names,
+        [loaded[name] for name in field_names],
+    )
@@ -0,0 +1,12 @@
+from django.utils import timezone
+
+from jobs.registry import task
+from tokens.models import RevokedToken
+
+
+@task(name='tokens.purge_revoked_tokens', priority=-10)
+def purge_revoked_tokens():
+    """
+    Delete revocations of tokens that have expired since.
+    """
+    RevokedToken.objects.filter(expires_at__lte=timezone.now()).delete()
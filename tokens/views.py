@@ -0,0 +1,43 @@
+from drf_spectacular.utils import extend_schema
+from rest_framework import generics, permissions, status
+from rest_framework.authtoken.serializers import AuthTokenSerializer
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from tokens.authentication import SignedTokenAuthentication
+from tokens.revocation import revoked_tokens
+from tokens.serializers import SignedTokenSerializer
+from tokens.signing import expires_at, issue_token
+
+
+class SignedTokenView(generics.GenericAPIView):
+    """
+    Exchange a username and password for a signed token.
+    """
+
+    authentication_classes = []
+    permission_classes = [permissions.AllowAny]
+    serializer_class = AuthTokenSerializer
+
+    @extend_schema(responses=SignedTokenSerializer)
+    def post(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        token, expires = issue_token(serializer.validated_data['user'])
+        return Response(
+            SignedTokenSerializer({'token': token, 'expires_at': expires}).data
+        )
+
+
+class RevokeSignedTokenView(APIView):
+    """
+    Revoke the signed token the request is authenticated with.
+    """
+
+    authentication_classes = [SignedTokenAuthentication]
+    permission_classes = [permissions.IsAuthenticated]
+
+    @extend_schema(request=None, responses={204: None})
+    def post(self, request):
+        revoked_tokens.add(request.auth['jti'], expires_at(request.auth))
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,147 @@
+"""
+Deployment checks for settings that hurt performance, run by
+`manage.py check --deploy` and `manage.py check_performance`.
+"""
+from django.conf import settings
+from django.core.checks import Error, Warning, register
+from django.utils.module_loading import import_string
+
+TAG = 'performance'
+
+DUMMY_CACHE = 'django.core.cache.backends.dummy.DummyCache'
+
+PER_PROCESS_CACHES = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    DUMMY_CACHE,
+)
+
+CACHED_LOADER = 'django.template.loaders.cached.Loader'
+
+
+@register(TAG, deploy=True)
+def check_debug(app_configs, **kwargs):
+    if not settings.DEBUG:
+        return []
+    return [
+        Warning(
+            'DEBUG is on.',
+            hint=(
+                'Every SQL query is kept in memory for the lifetime of the '
+                'process and errors render slow debug pages.'
+            ),
+            id='utils.W001',
+        )
+    ]
+
+
+@register(TAG, deploy=True)
+def check_caches(app_configs, **kwargs):
+    errors = []
+    for alias, config in settings.CACHES.items():
+        if config['BACKEND'] == DUMMY_CACHE:
+            errors.append(
+                Warning(
+                    f'The {alias!r} cache is a DummyCache.',
+                    hint='Nothing stored in it is ever read back.',
+                    id='utils.W002',
+                )
+            )
+
+    alias = settings.COALESCE_CACHE_ALIAS
+    if alias and alias not in settings.CACHES:
+        errors.append(
+            Error(
+                f'COALESCE_CACHE_ALIAS is {alias!r}, which is not in CACHES.',
+                hint='Every coalesced request would fail looking it up.',
+                id='utils.E001',
+            )
+        )
+    elif alias and settings.CACHES[alias]['BACKEND'] in PER_PROCESS_CACHES:
+        errors.append(
+            Warning(
+                f'COALESCE_CACHE_ALIAS is the per-process {alias!r} cache.',
+                hint=(
+                    'Requests are only coalesced across workers through a '
+                    'cache they share, such as Redis or Memcached.'
+                ),
+                id='utils.W003',
+            )
+        )
+    return errors
+
+
+@register(TAG, deploy=True)
+def check_databases(app_configs, **kwargs):
+    errors = []
+    for alias, config in settings.DATABASES.items():
+        if config['ENGINE'] == 'django.db.backends.sqlite3':
+            errors.append(
+                Warning(
+                    f'The {alias!r} database is SQLite.',
+                    hint='Its writes are serialised across all workers.',
+                    id='utils.W004',
+                )
+            )
+        elif not config.get('CONN_MAX_AGE'):
+            errors.append(
+                Warning(
+                    f'The {alias!r} database connections are not '
+                    'persistent.',
+                    hint=(
+                        'Set CONN_MAX_AGE so requests reuse connections '
+                        'instead of opening one each.'
+                    ),
+                    id='utils.W005',
+                )
+            )
+    return errors
+
+
+@register(TAG, deploy=True)
+def check_templates(app_configs, **kwargs):
+    errors = []
+    for config in settings.TEMPLATES:
+        if (
+            config['BACKEND']
+            != 'django.template.backends.django.DjangoTemplates'
+        ):
+            continue
+        # Without explicit loaders Django caches the default ones.
+        loaders = config.get('OPTIONS', {}).get('loaders')
+        if loaders is None:
+            continue
+        if not any(
+            (loader[0] if isinstance(loader, (list, tuple)) else loader)
+            == CACHED_LOADER
+            for loader in loaders
+        ):
+            errors.append(
+                Warning(
+                    'Templates are loaded without the cached loader.',
+                    hint=(
+                        'Templates are read and compiled again on every '
+                        f'render; wrap the loaders in {CACHED_LOADER}.'
+                    ),
+                    id='utils.W006',
+                )
+            )
+    return errors
+
+
+@register(TAG, deploy=True)
+def check_static_files(app_configs, **kwargs):
+    from django.contrib.staticfiles.storage import ManifestFilesMixin
+
+    storage = import_string(settings.STATICFILES_STORAGE)
+    if issubclass(storage, ManifestFilesMixin):
+        return []
+    return [
+        Warning(
+            'Static files are stored without hashed file names.',
+            hint=(
+                'Clients cannot cache them for long; use '
+                'ManifestStaticFilesStorage.'
+            ),
+            id='utils.W007',
+        )
+    ]
@@ -0,0 +1,127 @@
+import hashlib
+import threading
+import time
+from urllib.parse import urlencode
+
+from django.core.cache import caches
+from django.http import HttpResponse
+
+# How often requests waiting on another worker look for its response.
+POLL_INTERVAL = 0.01
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+
+
+class SingleFlight:
+    """
+    Runs one call per key at a time: callers arriving while a call for the
+    same key is running wait for it and get its result.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights = {}
+
+    def do(self, key, func, timeout):
+        """
+        Return `(result, shared)`, where `shared` tells whether the result
+        came from a call started by another caller.
+
+        Waiting callers make the call themselves when the running one
+        raises, returns `None` or doesn't finish within `timeout` seconds.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            if flight.done.wait(timeout) and flight.result is not None:
+                return flight.result, True
+            return func(), False
+
+        try:
+            flight.result = func()
+            return flight.result, False
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+
+def coalescing_key(request):
+    """
+    Key of a GET request: its scheme, host, path, sorted query parameters
+    and Accept header. Hyperlinks in the response are built from the first
+    four.
+    """
+    query = urlencode(sorted(request.GET.lists()), doseq=True)
+    accept = request.META.get('HTTP_ACCEPT', '')
+    return (
+        f'{request.scheme}://{request.get_host()}{request.path}?{query}\n'
+        f'{accept}'
+    )
+
+
+def freeze(response):
+    """
+    Return what's needed to rebuild `response` for other requests, or
+    `None` when it must not be shared.
+    """
+    if (
+        response.status_code != 200
+        or response.streaming
+        or response.cookies
+        or response.has_header('Set-Cookie')
+    ):
+        return None
+    return response.status_code, list(response.items()), response.content
+
+
+def thaw(frozen):
+    status, headers, content = frozen
+    response = HttpResponse(content, status=status)
+    for header, value in headers:
+        response.headers[header] = value
+    return response
+
+
+class CacheFlight:
+    """
+    Coalesces calls across processes through a shared cache: the first
+    process to take the key's lock makes the call and stores its result for
+    `ttl` seconds, the others poll the cache for it.
+    """
+
+    def __init__(self, alias, ttl):
+        self.cache = caches[alias]
+        self.ttl = ttl
+
+    def do(self, key, func, timeout):
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        lock_key = f'coalesce:lock:{digest}'
+        result_key = f'coalesce:result:{digest}'
+
+        if not self.cache.add(lock_key, 1, timeout):
+            deadline = time.monotonic() + timeout
+            while time.monotonic() < deadline:
+                result = self.cache.get(result_key)
+                if result is not None:
+                    return result, True
+                if self.cache.get(lock_key) is None:
+                    break
+                time.sleep(POLL_INTERVAL)
+            return func(), False
+
+        try:
+            result = func()
+            if result is not None:
+                self.cache.set(result_key, result, self.ttl)
+            return result, False
+        finally:
+            self.cache.delete(lock_key)
@@ -0,0 +1,428 @@
+import copy
+from itertools import islice
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.http import Http404, StreamingHttpResponse
+from rest_flex_fields.serializers import FlexFieldsSerializerMixin
+from rest_framework import relations, serializers
+from rest_framework.permissions import BasePermission
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from utils.fields import (
+    CachedSlugRelatedField,
+    NativeRepresentationMixin,
+    renders_natively,
+)
+from utils.hyperlinks import get_url_builder
+
+_compiled = {}
+
+STREAMING_CHUNK_SIZE = 500
+
+
+class UnsupportedField(Exception):
+    pass
+
+
+def _readable_fields(serializer):
+    # rest_flex_fields only applies the query param options (?expand=,
+    # ?fields=, ?omit=) when it is first asked to represent an instance.
+    if (
+        isinstance(serializer, FlexFieldsSerializerMixin)
+        and not serializer._flex_fields_rep_applied
+    ):
+        serializer.apply_flex_fields(
+            serializer.fields, serializer._flex_options_rep_only
+        )
+        serializer._flex_fields_rep_applied = True
+
+    return [
+        field for field in serializer.fields.values() if not field.write_only
+    ]
+
+
+def _nested(field):
+    if isinstance(field, serializers.ListSerializer):
+        return field.child
+    if isinstance(field, serializers.BaseSerializer):
+        return field
+    return None
+
+
+def _signature(serializer):
+    parts = []
+    for field in _readable_fields(serializer):
+        nested = _nested(field)
+        parts.append(
+            (
+                field.field_name,
+                type(field),
+                _signature(nested) if nested is not None else None,
+            )
+        )
+
+    return type(serializer), tuple(parts)
+
+
+class SerializationContext:
+    def __init__(self, request, format=None):
+        self.request = request
+        self.format = format
+        self.url_builder = get_url_builder(request)
+        self.native_types = renders_natively({'request': request})
+
+    def url(self, view_name, lookup_url_kwarg, pk):
+        return self.url_builder.url(
+            view_name, lookup_url_kwarg, pk, self.format
+        )
+
+    def file_url(self, storage, name):
+        if not name:
+            return None
+        url = storage.url(name)
+        if self.request is not None:
+            return self.request.build_absolute_uri(url)
+        return url
+
+
+class CompiledSerializer:
+    """
+    Read-only equivalent of a (possibly expanded) serializer instance that
+    works on `.values()` rows instead of model instances.
+
+    Every readable field is resolved once into a column of the values query
+    and a getter, and relations are loaded with one extra query per page.
+    The resulting dicts match what the DRF serializer would have produced.
+    """
+
+    def __init__(self, serializer):
+        self.model = serializer.Meta.model
+        self.columns = ['pk']
+        self.getters = []
+        self.loaders = []
+
+        for field in _readable_fields(serializer):
+            getter = self._compile_field(field)
+            self.getters.append((field.field_name, getter))
+
+    def _add_column(self, column):
+        if column not in self.columns:
+            self.columns.append(column)
+        return column
+
+    def _model_field(self, field):
+        if field.source == '*' or '.' in field.source:
+            raise UnsupportedField(field.field_name)
+        try:
+            return self.model._meta.get_field(field.source)
+        except Exception:
+            raise UnsupportedField(field.field_name)
+
+    def _compile_field(self, field):
+        name = field.field_name
+
+        if isinstance(field, relations.HyperlinkedIdentityField):
+            if field.lookup_field != 'pk':
+                raise UnsupportedField(name)
+            view_name = field.view_name
+            lookup_url_kwarg = field.lookup_url_kwarg
+            return lambda row, ctx, related: ctx.url(
+                view_name, lookup_url_kwarg, row['pk']
+            )
+
+        nested = _nested(field)
+        if nested is not None:
+            model_field = self._model_field(field)
+            plan = CompiledSerializer(nested)
+            if model_field.many_to_many and not model_field.auto_created:
+                self.loaders.append(
+                    (name, self._m2m_loader(model_field, plan))
+                )
+                return lambda row, ctx, related: related[name].get(
+                    row['pk'], []
+                )
+            if model_field.many_to_one:
+                column = self._add_column(model_field.attname)
+                self.loaders.append((name, self._fk_loader(column, plan)))
+                return lambda row, ctx, related: related[name].get(row[column])
+            raise UnsupportedField(name)
+
+        if isinstance(field, relations.ManyRelatedField):
+            child = field.child_relation
+            if isinstance(child, CachedSlugRelatedField):
+                # Ids are loaded and named from the cache.
+                slug_field = None
+            elif isinstance(child, relations.SlugRelatedField):
+                slug_field = child.slug_field
+            elif type(child) is relations.PrimaryKeyRelatedField:
+                if child.pk_field is not None:
+                    raise UnsupportedField(name)
+                slug_field = None
+            else:
+                raise UnsupportedField(name)
+            model_field = self._model_field(field)
+            if not model_field.many_to_many or model_field.auto_created:
+                raise UnsupportedField(name)
+            self.loaders.append(
+                (name, self._m2m_loader(model_field, slug_field=slug_field))
+            )
+            if isinstance(child, CachedSlugRelatedField):
+                cache = child.cache
+                return lambda row, ctx, related: [
+                    cache.name(pk) for pk in related[name].get(row['pk'], [])
+                ]
+            return lambda row, ctx, related: related[name].get(row['pk'], [])
+
+        if isinstance(field, CachedSlugRelatedField):
+            model_field = self._model_field(field)
+            if not model_field.many_to_one:
+                raise UnsupportedField(name)
+            column = self._add_column(model_field.attname)
+            cache = field.cache
+            return lambda row, ctx, related: (
+                None if row[column] is None else cache.name(row[column])
+            )
+
+        if isinstance(field, relations.SlugRelatedField):
+            model_field = self._model_field(field)
+            if not model_field.many_to_one:
+                raise UnsupportedField(name)
+            column = self._add_column(f'{field.source}__{field.slug_field}')
+            return lambda row, ctx, related: row[column]
+
+        if type(field) is relations.PrimaryKeyRelatedField:
+            model_field = self._model_field(field)
+            if not model_field.many_to_one or field.pk_field is not None:
+                raise UnsupportedField(name)
+            column = self._add_column(model_field.attname)
+            return lambda row, ctx, related: row[column]
+
+        if isinstance(field, relations.RelatedField):
+            raise UnsupportedField(name)
+
+        if isinstance(field, serializers.FileField):
+            if getattr(field, 'represent_in_base64', False):
+                raise UnsupportedField(name)
+            model_field = self._model_field(field)
+            storage = model_field.storage
+            column = self._add_column(model_field.attname)
+            if getattr(field, 'use_url', api_settings.UPLOADED_FILES_USE_URL):
+                return lambda row, ctx, related: ctx.file_url(
+                    storage, row[column]
+                )
+            return lambda row, ctx, related: row[column] or None
+
+        if isinstance(
+            field, (serializers.SerializerMethodField, serializers.HiddenField)
+        ):
+            raise UnsupportedField(name)
+
+        model_field = self._model_field(field)
+        if model_field.is_relation:
+            raise UnsupportedField(name)
+        column = self._add_column(model_field.attname)
+        # A fresh unbound copy, so the plan does not keep the request alive.
+        to_representation = copy.deepcopy(field).to_representation
+        native = isinstance(field, NativeRepresentationMixin)
+
+        def getter(row, ctx, related):
+            value = row[column]
+            if value is None or (native and ctx.native_types):
+                return value
+            return to_representation(value)
+
+        return getter
+
+    def _fk_loader(self, column, plan):
+        def load(rows, ctx):
+            ids = {row[column] for row in rows} - {None}
+            if not ids:
+                return {}
+            return plan.fetch_by_pk(
+                plan.model._default_manager.filter(pk__in=ids), ctx
+            )
+
+        return load
+
+    def _m2m_loader(self, model_field, plan=None, slug_field=None):
+        through = model_field.remote_field.through
+        source = through._meta.get_field(model_field.m2m_field_name()).attname
+        target = through._meta.get_field(
+            model_field.m2m_reverse_field_name()
+        ).attname
+        if slug_field is not None:
+            target = f'{model_field.m2m_reverse_field_name()}__{slug_field}'
+
+        def load(rows, ctx):
+            pks = [row['pk'] for row in rows]
+            if not pks:
+                return {}
+            pairs = through._default_manager.filter(
+                **{f'{source}__in': pks}
+            ).values_list(source, target)
+
+            related = {}
+            if plan is None:
+                for pk, target_pk in pairs:
+                    related.setdefault(pk, []).append(target_pk)
+                return related
+
+            pairs = list(pairs)
+            targets = plan.fetch_by_pk(
+                plan.model._default_manager.filter(
+                    pk__in={target_pk for _, target_pk in pairs}
+                ),
+                ctx,
+            )
+            for pk, target_pk in pairs:
+                if target_pk in targets:
+                    related.setdefault(pk, []).append(targets[target_pk])
+            return related
+
+        return load
+
+    def values(self, queryset):
+        return queryset.values(*self.columns)
+
+    def serialize(self, rows, ctx):
+        related = {name: load(rows, ctx) for name, load in self.loaders}
+        getters = self.getters
+        return [
+            {name: getter(row, ctx, related) for name, getter in getters}
+            for row in rows
+        ]
+
+    def serialize_chunks(self, rows, ctx, chunk_size=STREAMING_CHUNK_SIZE):
+        rows = iter(rows)
+        while chunk := list(islice(rows, chunk_size)):
+            yield self.serialize(chunk, ctx)
+
+    def fetch_by_pk(self, queryset, ctx):
+        rows = list(self.values(queryset))
+        return {
+            row['pk']: item
+            for row, item in zip(rows, self.serialize(rows, ctx))
+        }
+
+
+def compile_serializer(serializer):
+    """
+    Return the `CompiledSerializer` for the fields of `serializer`, or `None`
+    when one of them can't be represented from a values query.
+    """
+    key = _signature(serializer)
+    try:
+        return _compiled[key]
+    except KeyError:
+        pass
+
+    try:
+        compiled = CompiledSerializer(serializer)
+    except UnsupportedField:
+        compiled = None
+
+    _compiled[key] = compiled
+    return compiled
+
+
+class CompiledReadMixin:
+    """
+    Serves `list` and `retrieve` through a `CompiledSerializer` when
+    `settings.COMPILED_SERIALIZERS` is enabled, falling back to the regular
+    serializer for anything it can't handle.
+
+    Pages of at least `settings.STREAMING_LIST_THRESHOLD` items are streamed
+    when the renderer supports it.
+    """
+
+    def get_compiled_serializer(self):
+        if not getattr(settings, 'COMPILED_SERIALIZERS', False):
+            return None
+        return compile_serializer(self.get_serializer())
+
+    def get_serialization_context(self):
+        return SerializationContext(self.request, self.format_kwarg)
+
+    def _has_object_permissions(self):
+        return any(
+            type(permission).has_object_permission
+            is not BasePermission.has_object_permission
+            for permission in self.get_permissions()
+        )
+
+    def list(self, request, *args, **kwargs):
+        compiled = self.get_compiled_serializer()
+        if compiled is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = compiled.values(self.filter_queryset(self.get_queryset()))
+        ctx = self.get_serialization_context()
+
+        if self._should_stream():
+            return self._stream_list(compiled, queryset, ctx)
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(compiled.serialize(page, ctx))
+
+        return Response(compiled.serialize(list(queryset), ctx))
+
+    def _should_stream(self):
+        threshold = getattr(settings, 'STREAMING_LIST_THRESHOLD', None)
+        renderer = self.request.accepted_renderer
+        if (
+            threshold is None
+            or not hasattr(self.paginator, 'paginate_queryset_lazily')
+            or not hasattr(renderer, 'render_stream')
+            or not renderer.can_stream(
+                self.request.accepted_media_type, self.get_renderer_context()
+            )
+        ):
+            return False
+
+        limit = self.paginator.get_limit(self.request)
+        return limit is not None and limit >= threshold
+
+    def _stream_list(self, compiled, queryset, ctx):
+        page = self.paginator.paginate_queryset_lazily(
+            queryset, self.request, view=self
+        )
+        results = compiled.serialize_chunks(
+            page.iterator(chunk_size=STREAMING_CHUNK_SIZE), ctx
+        )
+        renderer = self.request.accepted_renderer
+        return StreamingHttpResponse(
+            renderer.render_stream(
+                self.paginator.get_paginated_data(None),
+                results,
+                self.request.accepted_media_type,
+                self.get_renderer_context(),
+            ),
+            content_type=self.request.accepted_media_type,
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        compiled = self.get_compiled_serializer()
+        if compiled is None or self._has_object_permissions():
+            return super().retrieve(request, *args, **kwargs)
+
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_queryset())
+        try:
+            rows = list(
+                compiled.values(
+                    queryset.filter(
+                        **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+                    )[:1]
+                )
+            )
+        except (TypeError, ValueError, ValidationError):
+            raise Http404
+
+        if not rows:
+            raise Http404
+
+        ctx = self.get_serialization_context()
+        return Response(compiled.serialize(rows, ctx)[0])
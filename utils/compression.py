@@ -0,0 +1,141 @@
+import zlib
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+
+class GzipEncoder:
+    name = 'gzip'
+
+    def __init__(self, level=6):
+        # wbits=31 writes a gzip header and trailer around the deflate data.
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data):
+        return self._compressor.compress(data)
+
+    def flush(self):
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliEncoder:
+    name = 'br'
+
+    def __init__(self, level=5):
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data):
+        return self._compressor.process(data)
+
+    def flush(self):
+        return self._compressor.flush()
+
+    def finish(self):
+        return self._compressor.finish()
+
+
+class ZstdEncoder:
+    name = 'zstd'
+
+    def __init__(self, level=3):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data):
+        return self._compressor.compress(data)
+
+    def flush(self):
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self):
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+ENCODERS = {GzipEncoder.name: GzipEncoder}
+if brotli is not None:
+    ENCODERS[BrotliEncoder.name] = BrotliEncoder
+if zstandard is not None:
+    ENCODERS[ZstdEncoder.name] = ZstdEncoder
+
+
+def parse_accept_encoding(header):
+    """
+    Return a {coding: qvalue} dict for an Accept-Encoding header.
+    """
+    accepted = {}
+    for item in header.split(','):
+        coding, _, params = item.partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+
+        quality = 1.0
+        for param in params.split(';'):
+            key, _, value = param.partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding] = quality
+
+    return accepted
+
+
+def negotiate_encoding(header, preference):
+    """
+    Pick the coding from `preference` the client accepts with the highest
+    qvalue, or `None` when it accepts none of them.
+
+    Ties are broken by the order of `preference`.
+    """
+    if not header:
+        return None
+
+    accepted = parse_accept_encoding(header)
+    wildcard = accepted.get('*', 0.0)
+
+    best, best_quality = None, 0.0
+    for coding in preference:
+        if coding not in ENCODERS:
+            continue
+        quality = accepted.get(coding, wildcard)
+        if quality > best_quality:
+            best, best_quality = coding, quality
+
+    return best
+
+
+def compress(data, coding, level=None):
+    kwargs = {} if level is None else {'level': level}
+    if coding == ZstdEncoder.name:
+        # Much faster than a compression object at high levels, and records
+        # the content size in the frame.
+        return zstandard.ZstdCompressor(**kwargs).compress(data)
+
+    encoder = ENCODERS[coding](**kwargs)
+    return encoder.compress(data) + encoder.finish()
+
+
+def compress_stream(chunks, coding):
+    """
+    Compress an iterable of chunks, flushing after each non-empty one so the
+    client receives data as soon as it is produced.
+    """
+    encoder = ENCODERS[coding]()
+    for chunk in chunks:
+        if not chunk:
+            continue
+        data = encoder.compress(chunk) + encoder.flush()
+        if data:
+            yield data
+    yield encoder.finish()
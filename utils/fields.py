@@ -0,0 +1,103 @@
+from django.utils.functional import cached_property
+from rest_framework import serializers
+
+
+def renders_natively(context):
+    """
+    Whether the negotiated renderer encodes UUIDs and dates itself, so fields
+    should hand it Python values instead of strings.
+    """
+    request = context.get('request')
+    renderer = getattr(request, 'accepted_renderer', None)
+    return getattr(renderer, 'native_types', False)
+
+
+class NativeRepresentationMixin:
+    def to_representation(self, value):
+        if renders_natively(self.context):
+            return value
+        return super().to_representation(value)
+
+
+class UUIDField(NativeRepresentationMixin, serializers.UUIDField):
+    pass
+
+
+class DateField(NativeRepresentationMixin, serializers.DateField):
+    pass
+
+
+class CachedSlugRelatedField(serializers.SlugRelatedField):
+    """
+    SlugRelatedField resolving names and ids through a `ReferenceCache`
+    (see books.reference) instead of querying the related table.
+    """
+
+    def __init__(self, cache, **kwargs):
+        self.cache = cache
+        super().__init__(slug_field=cache.field, **kwargs)
+
+    def use_pk_only_optimization(self):
+        return True
+
+    def to_internal_value(self, data):
+        if not isinstance(data, (str, int)):
+            self.fail('invalid')
+
+        pk = self.cache.pk(str(data))
+        if pk is None:
+            self.fail(
+                'does_not_exist', slug_name=self.slug_field, value=str(data)
+            )
+        if pk is self.cache.AMBIGUOUS:
+            self.fail('invalid')
+        return self.cache.instance(pk)
+
+    def to_representation(self, value):
+        return self.cache.name(value.pk)
+
+
+def raise_for_deleted_references(serializer):
+    """
+    Raise a ValidationError for each `CachedSlugRelatedField` of
+    `serializer` whose row was deleted by another process after its cache
+    resolved it, as if the name had been unknown.
+    """
+    errors = {}
+    for name, field in serializer.fields.items():
+        if not isinstance(field, CachedSlugRelatedField) or field.read_only:
+            continue
+        instance = serializer.validated_data.get(field.source)
+        if instance is None:
+            continue
+        manager = field.cache.model._default_manager
+        if manager.filter(pk=instance.pk).exists():
+            continue
+        field.cache.invalidate()
+        errors[name] = [
+            field.error_messages['does_not_exist'].format(
+                slug_name=field.slug_field,
+                value=getattr(instance, field.slug_field),
+            )
+        ]
+    if errors:
+        raise serializers.ValidationError(errors)
+
+
+class HybridImageField(serializers.ImageField):
+    """
+    Accepts base64 encoded images as well as multipart uploads, like
+    drf_extra_fields' HybridImageField, which (with the image libraries it
+    needs) is only imported once an image is written.
+    """
+
+    @cached_property
+    def _field(self):
+        from drf_extra_fields.fields import HybridImageField
+
+        field = HybridImageField(*self._args, **self._kwargs)
+        field.bind(self.field_name, self.parent)
+        return field
+
+    def to_internal_value(self, data):
+        return self._field.to_internal_value(data)
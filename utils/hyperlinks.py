@@ -0,0 +1,104 @@
+from urllib.parse import urlsplit
+from uuid import UUID
+
+from django.http import HttpRequest
+from rest_framework import relations
+from rest_framework.request import Request
+from rest_framework.reverse import reverse
+
+# Stand-in lookup value used to reverse a route once; it matches the
+# router's default `[^/.]+` lookup regex and is left alone by iri_to_uri.
+PLACEHOLDER = '__pk__'
+
+
+class URLBuilder:
+    """
+    Builds absolute detail URLs for a single request.
+
+    The route for each (view name, lookup kwarg, format) is reversed once,
+    with the request host, into a prefix and suffix around the lookup value,
+    so every following URL is a string concatenation.
+    """
+
+    def __init__(self, request):
+        self.request = request
+        self.templates = {}
+
+    def _template(self, view_name, lookup_url_kwarg, format):
+        key = (view_name, lookup_url_kwarg, format)
+        try:
+            return self.templates[key]
+        except KeyError:
+            pass
+
+        url = reverse(
+            view_name,
+            kwargs={lookup_url_kwarg: PLACEHOLDER},
+            request=self.request,
+            format=format,
+        )
+        parts = url.split(PLACEHOLDER)
+        template = tuple(parts) if len(parts) == 2 else None
+        self.templates[key] = template
+        return template
+
+    def url(self, view_name, lookup_url_kwarg, pk, format=None):
+        template = self._template(view_name, lookup_url_kwarg, format)
+        # Other lookup values may need quoting, so let reverse() deal with
+        # them.
+        if template is None or type(pk) not in (UUID, int):
+            return reverse(
+                view_name,
+                kwargs={lookup_url_kwarg: pk},
+                request=self.request,
+                format=format,
+            )
+
+        prefix, suffix = template
+        return f'{prefix}{pk}{suffix}'
+
+
+def get_url_builder(request):
+    http_request = getattr(request, '_request', request)
+    try:
+        return http_request.url_builder
+    except AttributeError:
+        http_request.url_builder = URLBuilder(request)
+        return http_request.url_builder
+
+
+class HyperlinkedIdentityField(relations.HyperlinkedIdentityField):
+    def get_url(self, obj, view_name, request, format):
+        if request is None or self.lookup_field != 'pk':
+            return super().get_url(obj, view_name, request, format)
+
+        if obj.pk in (None, ''):
+            return None
+
+        return get_url_builder(request).url(
+            view_name, self.lookup_url_kwarg, obj.pk, format
+        )
+
+
+class DetachedRequest(HttpRequest):
+    """
+    Stands in for a request when representations are built outside of one,
+    so hyperlinks point at `base_url`.
+    """
+
+    def __init__(self, base_url):
+        super().__init__()
+        parts = urlsplit(base_url)
+        self._scheme = parts.scheme
+        self._host = parts.netloc
+        self.path = self.path_info = '/'
+
+    def _get_scheme(self):
+        return self._scheme
+
+    def get_host(self):
+        return self._host
+
+
+def detached_request(base_url):
+    return Request(DetachedRequest(base_url))
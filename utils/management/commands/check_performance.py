@@ -0,0 +1,30 @@
+from django.core import checks
+from django.core.management.base import BaseCommand
+
+from utils.checks import TAG
+
+
+class Command(BaseCommand):
+    help = (
+        'Flag settings that hurt performance in production, such as DEBUG, '
+        'SQLite, non-persistent database connections or unhashed static '
+        'files.'
+    )
+
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--fail-level',
+            default='ERROR',
+            choices=['CRITICAL', 'ERROR', 'WARNING', 'INFO', 'DEBUG'],
+            help='Message level that makes the command exit with status 1.',
+        )
+
+    def handle(self, *args, **options):
+        self.check(
+            tags=[TAG],
+            display_num_errors=True,
+            include_deployment_checks=True,
+            fail_level=getattr(checks, options['fail_level']),
+        )
@@ -0,0 +1,54 @@
+from django.core.management.base import BaseCommand
+
+from utils.warmup import hot_urls, urls_from_access_log, warm_caches
+
+
+class Command(BaseCommand):
+    help = (
+        'Replay the hot URLs through the full request stack to fill the '
+        'caches, e.g. right after a deploy.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--url',
+            action='append',
+            dest='urls',
+            help='URL to request instead of the hot URLs (repeatable).',
+        )
+        parser.add_argument(
+            '--access-log',
+            help='Also request the most common URLs of this access log.',
+        )
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=20,
+            help='URLs to take from the access log.',
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=4,
+            help='Requests in flight at a time.',
+        )
+
+    def handle(self, *args, **options):
+        urls = options['urls'] or hot_urls()
+        if options['access_log']:
+            urls += urls_from_access_log(options['access_log'], options['top'])
+
+        failed = 0
+        for url, coding, status, seconds in warm_caches(
+            list(dict.fromkeys(urls)), options['concurrency']
+        ):
+            self.stdout.write(
+                f'{status} {seconds * 1000:7.1f} ms  {coding or "identity":8} '
+                f'{url}'
+            )
+            failed += status >= 400
+
+        if failed:
+            self.stdout.write(self.style.WARNING(f'{failed} requests failed'))
+        else:
+            self.stdout.write(self.style.SUCCESS('Caches warmed'))
@@ -0,0 +1,275 @@
+import hashlib
+
+from django.conf import settings
+from django.contrib.auth import middleware as auth_middleware
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.messages import middleware as messages_middleware
+from django.contrib.sessions import middleware as sessions_middleware
+from django.core.cache import caches
+from django.core.exceptions import MiddlewareNotUsed
+from django.middleware import csrf
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+
+from utils.coalescing import (
+    CacheFlight,
+    SingleFlight,
+    coalescing_key,
+    freeze,
+    thaw,
+)
+from utils.compression import compress, compress_stream, negotiate_encoding
+from utils.staticfiles import collect_static_files
+
+# Media that is already compressed or doesn't shrink, such as book covers.
+INCOMPRESSIBLE_CONTENT_TYPES = (
+    'image/',
+    'video/',
+    'audio/',
+    'font/woff',
+    'application/gzip',
+    'application/x-gzip',
+    'application/zip',
+    'application/zstd',
+    'application/x-brotli',
+    'application/pdf',
+    'application/octet-stream',
+)
+COMPRESSIBLE_IMAGES = ('image/svg+xml',)
+
+# Pages that may carry a CSRF token next to reflected input, which
+# compression would leak to an attacker measuring response sizes (BREACH).
+UNSAFE_TO_COMPRESS = ('text/html', 'application/xhtml+xml')
+
+
+def is_compressible(content_type):
+    content_type = content_type.split(';', 1)[0].strip().lower()
+    if content_type in COMPRESSIBLE_IMAGES:
+        return True
+    return not content_type.startswith(INCOMPRESSIBLE_CONTENT_TYPES)
+
+
+def is_unsafe_to_compress(request, content_type):
+    content_type = content_type.split(';', 1)[0].strip().lower()
+    return content_type in UNSAFE_TO_COMPRESS or bool(
+        request.META.get('CSRF_COOKIE_NEEDS_UPDATE')
+    )
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Compresses responses with the best coding from
+    `settings.COMPRESSION_ENCODINGS` the client accepts (zstd, br, gzip).
+
+    Bodies shorter than `settings.COMPRESSION_MIN_SIZE` and already
+    compressed media are left alone, and streaming responses are compressed
+    chunk by chunk. HTML pages and responses a CSRF token was rendered into
+    are never compressed (see UNSAFE_TO_COMPRESS).
+
+    With `settings.COMPRESSION_CACHE_ALIAS` set, compressed bodies are kept
+    in that cache for `settings.COMPRESSION_CACHE_TTL` seconds, keyed by the
+    coding and a digest of the uncompressed body, so hot pages are
+    compressed once instead of on every request.
+    """
+
+    def process_request(self, request):
+        request.compression_coding = negotiate_encoding(
+            request.META.get('HTTP_ACCEPT_ENCODING', ''),
+            settings.COMPRESSION_ENCODINGS,
+        )
+
+    def process_response(self, request, response):
+        if not response.streaming and (
+            len(response.content) < settings.COMPRESSION_MIN_SIZE
+        ):
+            return response
+
+        if response.has_header('Content-Encoding'):
+            return response
+
+        content_type = response.get('Content-Type', '')
+        if not is_compressible(content_type):
+            return response
+
+        if is_unsafe_to_compress(request, content_type):
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        coding = getattr(request, 'compression_coding', None)
+        if coding is None:
+            return response
+
+        if response.streaming:
+            response.streaming_content = compress_stream(
+                response.streaming_content, coding
+            )
+            del response.headers['Content-Length']
+        else:
+            compressed_content = self.compress(response.content, coding)
+            if len(compressed_content) >= len(response.content):
+                return response
+            response.content = compressed_content
+            response.headers['Content-Length'] = str(len(response.content))
+
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        response.headers['Content-Encoding'] = coding
+
+        return response
+
+    def compress(self, content, coding):
+        alias = settings.COMPRESSION_CACHE_ALIAS
+        if not alias or len(content) > settings.COMPRESSION_CACHE_MAX_SIZE:
+            return compress(content, coding)
+
+        digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+        key = f'compression:{coding}:{digest}'
+        cache = caches[alias]
+        compressed_content = cache.get(key)
+        if compressed_content is None:
+            compressed_content = compress(content, coding)
+            cache.set(key, compressed_content, settings.COMPRESSION_CACHE_TTL)
+        return compressed_content
+
+
+def is_sessionless(request):
+    """
+    Whether `request` is for a path in `settings.SESSIONLESS_PATHS` and
+    carries no session cookie.
+
+    That covers anonymous reads and token-authenticated writes of the API:
+    there is no session to load, DRF views are exempt from Django's CSRF
+    check, and DRF authenticates the request itself.
+    """
+    return (
+        request.path_info.startswith(settings.SESSIONLESS_PATHS)
+        and settings.SESSION_COOKIE_NAME not in request.COOKIES
+    )
+
+
+class SessionlessFastPathMixin:
+    """
+    Skips the middleware for sessionless requests.
+    """
+
+    def __call__(self, request):
+        if not self._is_coroutine and is_sessionless(request):
+            return self.fast_path(request)
+        return super().__call__(request)
+
+    def fast_path(self, request):
+        return self.get_response(request)
+
+
+class SessionMiddleware(
+    SessionlessFastPathMixin, sessions_middleware.SessionMiddleware
+):
+    pass
+
+
+class CsrfViewMiddleware(SessionlessFastPathMixin, csrf.CsrfViewMiddleware):
+    def process_view(self, request, callback, callback_args, callback_kwargs):
+        if is_sessionless(request):
+            return None
+        return super().process_view(
+            request, callback, callback_args, callback_kwargs
+        )
+
+
+class AuthenticationMiddleware(
+    SessionlessFastPathMixin, auth_middleware.AuthenticationMiddleware
+):
+    def fast_path(self, request):
+        request.user = AnonymousUser()
+        return self.get_response(request)
+
+
+class MessageMiddleware(
+    SessionlessFastPathMixin, messages_middleware.MessageMiddleware
+):
+    pass
+
+
+class CoalescingMiddleware:
+    """
+    Serves identical concurrent anonymous GET requests with one response:
+    while a request is being handled, requests for the same path, query
+    parameters and Accept header wait for it and get a copy of its response.
+
+    With `settings.COALESCE_CACHE_ALIAS` set to a cache shared by the
+    workers, requests are also coalesced across workers, whose responses
+    are then kept for `settings.COALESCE_CACHE_TTL` seconds.
+
+    Responses other than non-streaming 200s are never shared; the waiting
+    requests are handled on their own instead.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.flights = SingleFlight()
+
+    def coalesces(self, request):
+        return (
+            settings.COALESCE_REQUESTS
+            and request.method == 'GET'
+            and is_sessionless(request)
+            and 'HTTP_AUTHORIZATION' not in request.META
+        )
+
+    def __call__(self, request):
+        if not self.coalesces(request):
+            return self.get_response(request)
+
+        key = coalescing_key(request)
+        timeout = settings.COALESCE_TIMEOUT
+        responses = []
+
+        def handle():
+            response = self.get_response(request)
+            responses.append(response)
+            return freeze(response)
+
+        if settings.COALESCE_CACHE_ALIAS:
+            cache_flight = CacheFlight(
+                settings.COALESCE_CACHE_ALIAS, settings.COALESCE_CACHE_TTL
+            )
+
+            def call():
+                return cache_flight.do(key, handle, timeout)[0]
+
+        else:
+            call = handle
+
+        frozen, _ = self.flights.do(key, call, timeout)
+        if responses:
+            return responses[0]
+        return thaw(frozen)
+
+
+class StaticFilesMiddleware:
+    """
+    Serves the files collected into `settings.STATIC_ROOT` when
+    `settings.SERVE_STATIC` is on, without a separate web server.
+
+    The files are indexed once, when the middleware is loaded. Each request
+    gets the best precompressed copy the client accepts, streamed from its
+    file. Files requested by their hashed names are cached by clients for
+    good, others for `settings.STATIC_MAX_AGE` seconds.
+    """
+
+    def __init__(self, get_response):
+        if not settings.SERVE_STATIC:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.files = collect_static_files(
+            settings.STATIC_ROOT, settings.STATIC_URL
+        )
+
+    def __call__(self, request):
+        if request.method in ('GET', 'HEAD'):
+            static_file = self.files.get(request.path_info)
+            if static_file is not None:
+                return static_file.response(request)
+        return self.get_response(request)
@@ -0,0 +1,72 @@
+from collections import OrderedDict
+
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+from rest_framework import pagination
+from rest_framework.response import Response
+
+
+class LimitOffsetPagination(pagination.LimitOffsetPagination):
+    def paginate_queryset_lazily(self, queryset, request, view=None):
+        """
+        Same as `paginate_queryset`, but returns the page as an unevaluated
+        queryset slice so it can be iterated in chunks.
+        """
+        self.request = request
+        self.limit = self.get_limit(request)
+        if self.limit is None:
+            return None
+
+        self.count = self.get_count(queryset)
+        self.offset = self.get_offset(request)
+        if self.count > self.limit and self.template is not None:
+            self.display_page_controls = True
+
+        if self.count == 0 or self.offset > self.count:
+            return queryset.none()
+        return queryset[self.offset : self.offset + self.limit]
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page = self.paginate_queryset_lazily(queryset, request, view)
+        if page is None:
+            return None
+        return list(page)
+
+    def get_paginated_data(self, data):
+        return OrderedDict(
+            [
+                ('count', self.count),
+                ('next', self.get_next_link()),
+                ('previous', self.get_previous_link()),
+                ('results', data),
+            ]
+        )
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Django paginator that reports the planner's row estimate for unfiltered
+    querysets of large PostgreSQL tables instead of running `COUNT(*)`.
+    """
+
+    estimate_threshold = 100_000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        connection = connections[queryset.db]
+        if connection.vendor == 'postgresql' and not queryset.query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'SELECT reltuples FROM pg_class WHERE oid = %s::regclass',
+                    [queryset.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+            if row is not None and row[0] >= self.estimate_threshold:
+                return int(row[0])
+
+        return super().count
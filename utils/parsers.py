@@ -0,0 +1,39 @@
+from uuid import UUID
+
+import cbor2
+import msgpack
+from django.utils.dateparse import parse_date
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+from utils.renderers import MSGPACK_EXT_DATE, MSGPACK_EXT_UUID
+
+
+def msgpack_ext_hook(code, data):
+    if code == MSGPACK_EXT_UUID:
+        return UUID(bytes=data)
+    if code == MSGPACK_EXT_DATE:
+        return parse_date(data.decode())
+    return msgpack.ExtType(code, data)
+
+
+class MessagePackParser(BaseParser):
+    media_type = 'application/msgpack'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return msgpack.unpackb(
+                stream.read(), ext_hook=msgpack_ext_hook, timestamp=3
+            )
+        except (ValueError, TypeError, msgpack.UnpackException) as exc:
+            raise ParseError(f'MessagePack parse error - {exc}')
+
+
+class CBORParser(BaseParser):
+    media_type = 'application/cbor'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return cbor2.loads(stream.read())
+        except (ValueError, cbor2.CBORDecodeError) as exc:
+            raise ParseError(f'CBOR parse error - {exc}')
@@ -0,0 +1,134 @@
+from datetime import date, datetime
+from uuid import UUID
+
+import cbor2
+import msgpack
+import orjson
+from rest_framework import renderers
+from rest_framework.utils.encoders import JSONEncoder
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+# MessagePack extension types for values it has no native type for.
+MSGPACK_EXT_UUID = 1
+MSGPACK_EXT_DATE = 2
+
+# Compact `]}` closing the results array of a paginated envelope.
+_RESULTS_TAIL = b']}'
+
+
+class ORJSONRenderer(renderers.JSONRenderer):
+    """
+    JSONRenderer producing the same compact output through orjson, which
+    encodes UUIDs, dates and datetimes natively.
+
+    Indented, non-compact or ASCII-only output is left to JSONRenderer.
+    """
+
+    default = JSONEncoder().default
+
+    def _can_render(self, accepted_media_type, renderer_context):
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        return indent is None and self.compact and not self.ensure_ascii
+
+    def dumps(self, data):
+        ret = orjson.dumps(data, default=self.default, option=ORJSON_OPTIONS)
+        # Escape U+2028 and U+2029 like JSONRenderer does.
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(
+                b'\xe2\x80\xa9', b'\\u2029'
+            )
+        return ret
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        if not self._can_render(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        return self.dumps(data)
+
+    def render_stream(
+        self,
+        data,
+        results,
+        accepted_media_type=None,
+        renderer_context=None,
+    ):
+        """
+        Render a paginated envelope whose last key is `results`, encoding
+        the `results` iterable chunk by chunk as it is consumed.
+
+        Yields the same bytes `render` would return for the whole page.
+        """
+        head = self.dumps({**data, 'results': []})
+        assert head.endswith(b'[]}'), 'results must be the last key'
+        yield head[: -len(_RESULTS_TAIL)]
+
+        separator = b''
+        for chunk in results:
+            if not chunk:
+                continue
+            body = b','.join(self.dumps(item) for item in chunk)
+            yield separator + body
+            separator = b','
+
+        yield _RESULTS_TAIL
+
+    def can_stream(self, accepted_media_type, renderer_context=None):
+        return self._can_render(accepted_media_type, renderer_context)
+
+
+def _encode_msgpack(obj):
+    if isinstance(obj, UUID):
+        return msgpack.ExtType(MSGPACK_EXT_UUID, obj.bytes)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, date):
+        return msgpack.ExtType(MSGPACK_EXT_DATE, obj.isoformat().encode())
+    return JSONEncoder().default(obj)
+
+
+def _encode_cbor(encoder, obj):
+    encoder.encode(JSONEncoder().default(obj))
+
+
+class MessagePackRenderer(renderers.BaseRenderer):
+    """
+    Renders MessagePack. Timezone-aware datetimes use the timestamp
+    extension type, UUIDs and dates the `MSGPACK_EXT_*` extension types.
+    """
+
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+    native_types = True
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        return msgpack.packb(
+            data, default=_encode_msgpack, use_bin_type=True, datetime=True
+        )
+
+
+class CBORRenderer(renderers.BaseRenderer):
+    """
+    Renders CBOR, with UUIDs (tag 37), dates (tag 1004) and datetimes
+    encoded as their standard tags.
+    """
+
+    media_type = 'application/cbor'
+    format = 'cbor'
+    charset = None
+    render_style = 'binary'
+    native_types = True
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        return cbor2.dumps(data, default=_encode_cbor)
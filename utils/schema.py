@@ -0,0 +1,149 @@
+import hashlib
+import json
+import os
+import threading
+from functools import lru_cache
+from importlib import import_module
+from pathlib import Path
+
+import drf_spectacular
+import rest_framework
+from django.apps import apps
+from django.conf import settings
+from django.utils.module_loading import autodiscover_modules
+from drf_spectacular.settings import spectacular_settings
+from rest_framework.utils.encoders import JSONEncoder
+
+from utils.compression import compress
+
+_lock = threading.Lock()
+_schemas = {}
+_rendered = {}
+
+
+@lru_cache(maxsize=None)
+def code_version():
+    """
+    Identifies the code the schema is generated from: `settings.CODE_VERSION`
+    when set (e.g. the deployed commit), otherwise a hash of the project's
+    sources and the versions of the libraries that shape the schema.
+    """
+    if settings.CODE_VERSION:
+        return settings.CODE_VERSION
+
+    base_dir = Path(settings.BASE_DIR).resolve()
+    urlconf = import_module(settings.ROOT_URLCONF)
+    roots = {Path(urlconf.__file__).resolve().parent}
+    for app_config in apps.get_app_configs():
+        path = Path(app_config.path).resolve()
+        if base_dir in path.parents:
+            roots.add(path)
+
+    digest = hashlib.sha256()
+    digest.update(drf_spectacular.__version__.encode())
+    digest.update(rest_framework.VERSION.encode())
+    for root in sorted(roots):
+        for path in sorted(root.rglob('*.py')):
+            digest.update(str(path.relative_to(base_dir)).encode())
+            digest.update(path.read_bytes())
+
+    return digest.hexdigest()[:16]
+
+
+def load_schema_extensions(endpoints):
+    """
+    drf-spectacular preprocessing hook importing the apps' `schema` modules,
+    so their extensions are only loaded when a schema is generated.
+    """
+    autodiscover_modules('schema')
+    return endpoints
+
+
+def schema_path(version=None):
+    return (
+        Path(settings.SCHEMA_CACHE_DIR) / f'{version or code_version()}.json'
+    )
+
+
+def generate_schema():
+    generator = spectacular_settings.DEFAULT_GENERATOR_CLASS()
+    schema = generator.get_schema(
+        request=None, public=spectacular_settings.SERVE_PUBLIC
+    )
+    # Normalise to plain JSON types, so a schema read back from disk renders
+    # exactly like a freshly generated one.
+    return json.loads(json.dumps(schema, cls=JSONEncoder))
+
+
+def store_schema(schema, version=None):
+    path = schema_path(version)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+    tmp_path.write_text(json.dumps(schema))
+    os.replace(tmp_path, path)
+
+    for stale_path in path.parent.glob('*.json'):
+        if stale_path != path:
+            stale_path.unlink(missing_ok=True)
+
+    return path
+
+
+def build_schema():
+    """
+    Generate and store the schema for the current code version.
+    """
+    schema = generate_schema()
+    path = store_schema(schema)
+    clear_cache()
+    return path
+
+
+def get_schema():
+    version = code_version()
+    try:
+        return _schemas[version]
+    except KeyError:
+        pass
+
+    with _lock:
+        if version not in _schemas:
+            try:
+                schema = json.loads(schema_path(version).read_text())
+            except (FileNotFoundError, ValueError):
+                schema = generate_schema()
+                store_schema(schema, version)
+            _schemas.clear()
+            _schemas[version] = schema
+
+    return _schemas[version]
+
+
+def get_rendered_schema(renderer, media_type, coding=None):
+    """
+    Return `(content, etag)` for the schema rendered by `renderer`, and
+    compressed with `coding` if given.
+
+    Renders for each renderer's own media type are kept in memory; other
+    media types (e.g. with an `indent` parameter) are rendered every time.
+    """
+    key = (code_version(), type(renderer), coding)
+    cacheable = media_type == renderer.media_type
+    if cacheable and key in _rendered:
+        return _rendered[key]
+
+    content = renderer.render(get_schema(), media_type, {})
+    etag = hashlib.sha256(content).hexdigest()[:32]
+    if coding:
+        content = compress(content, coding)
+        etag = f'{etag}-{coding}'
+    rendered = (content, f'"{etag}"')
+
+    if cacheable:
+        _rendered[key] = rendered
+    return rendered
+
+
+def clear_cache():
+    _schemas.clear()
+    _rendered.clear()
@@ -0,0 +1,55 @@
+from django.http import HttpResponse
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from drf_spectacular.utils import extend_schema
+from drf_spectacular.views import SCHEMA_KWARGS, SpectacularAPIView
+
+from utils.schema import get_rendered_schema
+
+
+class SchemaView(SpectacularAPIView):
+    """
+    SpectacularAPIView serving the schema stored by `manage.py build_schema`
+    (or generated once on first use) for the running code version, with an
+    ETag and precompressed bodies.
+    """
+
+    def _is_default_schema(self, request):
+        return not (
+            request.GET.get('lang')
+            or request.GET.get('version')
+            or request.version
+            or self.api_version
+            or self.custom_settings
+            or self.urlconf
+            or self.patterns
+        )
+
+    @extend_schema(**SCHEMA_KWARGS)
+    def get(self, request, *args, **kwargs):
+        if not self._is_default_schema(request):
+            return super().get(request, *args, **kwargs)
+
+        renderer = request.accepted_renderer
+        coding = getattr(request, 'compression_coding', None)
+        content, etag = get_rendered_schema(
+            renderer, request.accepted_media_type, coding
+        )
+
+        content_type = request.accepted_media_type
+        if renderer.charset:
+            content_type = f'{content_type}; charset={renderer.charset}'
+        response = HttpResponse(content, content_type=content_type)
+        response['ETag'] = etag
+        response[
+            'Content-Disposition'
+        ] = f'inline; filename="{self._get_filename(request, None)}"'
+        if coding:
+            response['Content-Encoding'] = coding
+        patch_vary_headers(response, ('Accept-Encoding',))
+        patch_cache_control(response, no_cache=True)
+
+        return get_conditional_response(request, etag=etag, response=response)
@@ -0,0 +1,14 @@
+from django.db import models
+from rest_framework import serializers
+
+from utils.fields import DateField, UUIDField
+from utils.hyperlinks import HyperlinkedIdentityField
+
+
+class ModelSerializerMixin:
+    serializer_url_field = HyperlinkedIdentityField
+    serializer_field_mapping = {
+        **serializers.ModelSerializer.serializer_field_mapping,
+        models.UUIDField: UUIDField,
+        models.DateField: DateField,
+    }
@@ -0,0 +1,123 @@
+import json
+import mimetypes
+import os
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from django.utils.http import http_date, parse_etags
+
+from utils.compression import negotiate_encoding
+
+# Suffix of the precompressed copy of a static file for each coding, as
+# written by utils.storage.CompressedManifestStaticFilesStorage.
+SUFFIXES = {'zstd': '.zst', 'br': '.br', 'gzip': '.gz'}
+
+MANIFEST_NAME = 'staticfiles.json'
+
+# Content under a hashed name never changes.
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+
+class Variant:
+    """
+    One stored copy of a static file, identity or compressed with `coding`.
+    """
+
+    def __init__(self, path, coding=None):
+        self.path = path
+        self.coding = coding
+        stat = os.stat(path)
+        self.size = stat.st_size
+        suffix = f'-{coding}' if coding else ''
+        self.etag = f'"{int(stat.st_mtime):x}-{stat.st_size:x}{suffix}"'
+        self.last_modified = http_date(stat.st_mtime)
+
+
+class StaticFile:
+    def __init__(self, path, name, immutable, codings):
+        self.content_type = (
+            mimetypes.guess_type(name)[0] or 'application/octet-stream'
+        )
+        self.cache_control = (
+            IMMUTABLE_CACHE_CONTROL
+            if immutable
+            else f'public, max-age={settings.STATIC_MAX_AGE}'
+        )
+        self.variants = {None: Variant(path)}
+        for coding in codings:
+            self.variants[coding] = Variant(path + SUFFIXES[coding], coding)
+        self.codings = [
+            coding
+            for coding in settings.COMPRESSION_ENCODINGS
+            if coding in self.variants
+        ]
+
+    def _patch_headers(self, response, variant):
+        response['ETag'] = variant.etag
+        response['Last-Modified'] = variant.last_modified
+        response['Cache-Control'] = self.cache_control
+        if self.codings:
+            patch_vary_headers(response, ('Accept-Encoding',))
+        return response
+
+    def response(self, request):
+        coding = negotiate_encoding(
+            request.META.get('HTTP_ACCEPT_ENCODING', ''), self.codings
+        )
+        variant = self.variants[coding]
+
+        if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+        if if_none_match:
+            etags = parse_etags(if_none_match)
+            if '*' in etags or variant.etag in etags:
+                return self._patch_headers(HttpResponseNotModified(), variant)
+
+        # Sent by the server's wsgi.file_wrapper (sendfile) when it has one,
+        # without reading the file into memory.
+        response = FileResponse(
+            open(variant.path, 'rb'), content_type=self.content_type
+        )
+        del response['Content-Disposition']
+        if coding:
+            response['Content-Encoding'] = coding
+        response['Content-Length'] = str(variant.size)
+        return self._patch_headers(response, variant)
+
+
+def hashed_names(root):
+    try:
+        with open(os.path.join(root, MANIFEST_NAME)) as f:
+            return set(json.load(f)['paths'].values())
+    except (OSError, ValueError, KeyError):
+        return set()
+
+
+def collect_static_files(root, url):
+    """
+    Return a {URL path: StaticFile} dict of the files under `root`, with
+    their precompressed copies as variants.
+    """
+    immutable = hashed_names(root)
+    files = {}
+    for dirpath, _, filenames in os.walk(root):
+        present = set(filenames)
+        for filename in filenames:
+            if any(
+                filename.endswith(suffix)
+                and filename[: -len(suffix)] in present
+                for suffix in SUFFIXES.values()
+            ):
+                continue
+
+            path = os.path.join(dirpath, filename)
+            name = os.path.relpath(path, root).replace(os.sep, '/')
+            codings = [
+                coding
+                for coding, suffix in SUFFIXES.items()
+                if filename + suffix in present
+            ]
+            files[url + name] = StaticFile(
+                path, name, name in immutable, codings
+            )
+    return files
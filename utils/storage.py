@@ -0,0 +1,62 @@
+import mimetypes
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+
+from utils.compression import ENCODERS, compress
+from utils.middleware import is_compressible
+from utils.staticfiles import SUFFIXES
+
+# Static files are compressed once, so spend the time on the best ratio.
+LEVELS = {'zstd': 19, 'br': 11, 'gzip': 9}
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """
+    ManifestStaticFilesStorage that also stores a precompressed copy of
+    each compressible file, original and hashed, for every available coding
+    in `settings.COMPRESSION_ENCODINGS` (e.g. `app.css.br` next to
+    `app.css`), for utils.middleware.StaticFilesMiddleware to serve.
+    """
+
+    def post_process(self, paths, dry_run=False, **options):
+        names = []
+        for name, hashed_name, processed in super().post_process(
+            paths, dry_run, **options
+        ):
+            yield name, hashed_name, processed
+            if not isinstance(processed, Exception):
+                names += [name, hashed_name or name]
+
+        if dry_run:
+            return
+
+        # Original and hashed names often share their content.
+        compressed = {}
+        for name in dict.fromkeys(names):
+            for compressed_name in self.compress(name, compressed):
+                yield name, compressed_name, True
+
+    def compress(self, name, compressed):
+        content_type = mimetypes.guess_type(name)[0]
+        if not is_compressible(content_type or 'application/octet-stream'):
+            return
+
+        with self.open(name) as f:
+            data = f.read()
+        if len(data) < settings.COMPRESSION_MIN_SIZE:
+            return
+
+        for coding in settings.COMPRESSION_ENCODINGS:
+            if coding not in ENCODERS:
+                continue
+            key = (coding, data)
+            if key not in compressed:
+                compressed[key] = compress(data, coding, LEVELS[coding])
+            if len(compressed[key]) >= len(data):
+                continue
+
+            compressed_name = name + SUFFIXES[coding]
+            with open(self.path(compressed_name), 'wb') as f:
+                f.write(compressed[key])
+            yield compressed_name
@@ -0,0 +1,116 @@
+import re
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.db import connections
+from django.test import Client
+
+from books.reference import warm_all
+from utils.compression import ENCODERS
+
+# Client address of the replayed requests, from a range reserved for
+# documentation, so they don't drain the throttle bucket of a real client.
+WARMUP_ADDR = '192.0.2.1'
+
+# The request and status of a common or combined log format line.
+ACCESS_LOG_REQUEST = re.compile(
+    r'"GET (?P<url>\S+) HTTP/[\d.]+" (?P<status>\d{3}) '
+)
+
+
+def urls_from_access_log(path, top):
+    """
+    Return the `top` URLs most often served successfully in an access log.
+    """
+    counts = Counter()
+    with open(path, errors='replace') as log:
+        for line in log:
+            match = ACCESS_LOG_REQUEST.search(line)
+            if match and match['status'] == '200':
+                counts[match['url']] += 1
+    return [url for url, _ in counts.most_common(top)]
+
+
+def hot_urls():
+    """
+    `settings.WARMUP_URLS`, followed by the most requested URLs of
+    `settings.WARMUP_ACCESS_LOG` when set.
+    """
+    urls = list(settings.WARMUP_URLS)
+    if settings.WARMUP_ACCESS_LOG:
+        urls += urls_from_access_log(
+            settings.WARMUP_ACCESS_LOG, settings.WARMUP_ACCESS_LOG_TOP
+        )
+    return list(dict.fromkeys(urls))
+
+
+def warm_url(url, coding=None):
+    """
+    Request `url` through the whole stack, as a client of `settings.SITE_URL`
+    accepting only the `coding` content coding would. Returns the response
+    status and the seconds it took.
+    """
+    site = urlsplit(settings.SITE_URL)
+    client = Client(
+        raise_request_exception=False,
+        HTTP_HOST=site.netloc,
+        HTTP_ACCEPT_ENCODING=coding or 'identity',
+        REMOTE_ADDR=WARMUP_ADDR,
+    )
+    started = time.perf_counter()
+    response = client.get(url, secure=site.scheme == 'https')
+    if response.streaming:
+        for _ in response.streaming_content:
+            pass
+    response.close()
+    return response.status_code, time.perf_counter() - started
+
+
+def _warm_in_thread(url, coding):
+    try:
+        return warm_url(url, coding)
+    finally:
+        connections.close_all()
+
+
+def warm_caches(urls=None, concurrency=4):
+    """
+    Fill the caches of this process: the category and publisher names, then
+    whatever serving `urls` (the hot URLs by default) fills, such as
+    compiled serializers, the rendered schema and the compressed bodies,
+    `concurrency` requests at a time. Each URL is requested uncompressed and
+    with each coding of `settings.COMPRESSION_ENCODINGS` available.
+
+    Returns `(url, coding, status, seconds)` for each request, with a `None`
+    coding for the uncompressed ones.
+    """
+    warm_all()
+    if urls is None:
+        urls = hot_urls()
+
+    codings = [None] + [
+        coding
+        for coding in settings.COMPRESSION_ENCODINGS
+        if coding in ENCODERS
+    ]
+    requests = [(url, coding) for url in urls for coding in codings]
+
+    if concurrency == 1:
+        results = [warm_url(url, coding) for url, coding in requests]
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(
+                executor.map(
+                    _warm_in_thread,
+                    [url for url, _ in requests],
+                    [coding for _, coding in requests],
+                )
+            )
+
+    return [
+        (url, coding, *result)
+        for (url, coding), result in zip(requests, results)
+    ]
@@ -0,0 +1,10 @@
+from django.contrib import admin
+
+from webhooks.models import Subscription
+
+
+@admin.register(Subscription)
+class SubscriptionAdmin(admin.ModelAdmin):
+    list_display = ['url', 'active', 'cursor', 'failures', 'next_attempt_at']
+    list_filter = ['active']
+    readonly_fields = ['cursor', 'failures', 'next_attempt_at', 'last_error']
@@ -0,0 +1,156 @@
+import hashlib
+import hmac
+import json
+import random
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+from rest_framework.utils.encoders import JSONEncoder
+
+from changes.feed import changes_after, serialize_changes, stamp_changes
+from utils.hyperlinks import detached_request
+from webhooks.models import Subscription
+
+BACKOFF_BASE = 10
+BACKOFF_MAX = 60 * 60
+# How long a claimed subscription is left alone by other workers.
+LEASE_SECONDS = 5 * 60
+
+
+class DeliveryError(Exception):
+    pass
+
+
+def backoff(failures):
+    """
+    Seconds to wait after `failures` consecutive failed attempts: doubling
+    from BACKOFF_BASE up to BACKOFF_MAX, with jitter so endpoints coming
+    back up aren't hit by every retry at once.
+    """
+    delay = min(BACKOFF_BASE * 2 ** (failures - 1), BACKOFF_MAX)
+    return delay * random.uniform(0.5, 1)
+
+
+def sign(secret, body):
+    return hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+def post(url, body, headers, timeout):
+    request = urllib.request.Request(
+        url, data=body, headers=headers, method='POST'
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            status = response.status
+    except urllib.error.HTTPError as error:
+        status = error.code
+    except (urllib.error.URLError, OSError) as error:
+        raise DeliveryError(str(error))
+
+    if not 200 <= status < 300:
+        raise DeliveryError(f'HTTP {status}')
+
+
+def claim_due_subscriptions(limit):
+    """
+    Lease up to `limit` subscriptions that are due, skipping the ones
+    another worker holds.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        subscriptions = list(
+            Subscription.objects.select_for_update(skip_locked=True)
+            .filter(active=True, next_attempt_at__lte=now)
+            .order_by('next_attempt_at')[:limit]
+        )
+        Subscription.objects.filter(
+            pk__in=[subscription.pk for subscription in subscriptions]
+        ).update(next_attempt_at=now + timedelta(seconds=LEASE_SECONDS))
+
+    return subscriptions
+
+
+def deliver(subscription, batch_size, timeout):
+    """
+    Send the subscription's next batch of changes in one request. Returns
+    the number of changes delivered.
+    """
+    changes = changes_after(
+        subscription.cursor, batch_size, subscription.model_labels
+    )
+    now = timezone.now()
+    if not changes:
+        Subscription.objects.filter(pk=subscription.pk).update(
+            next_attempt_at=now
+        )
+        return 0
+
+    cursor = changes[-1].sequence
+    request = detached_request(settings.SITE_URL)
+    body = json.dumps(
+        {
+            'subscription': str(subscription.pk),
+            'cursor': cursor,
+            'events': serialize_changes(changes, request),
+        },
+        cls=JSONEncoder,
+    ).encode()
+    headers = {
+        'Content-Type': 'application/json',
+        'X-Library-Signature': f'sha256={sign(subscription.secret, body)}',
+    }
+
+    try:
+        post(subscription.url, body, headers, timeout)
+    except DeliveryError as error:
+        failures = subscription.failures + 1
+        Subscription.objects.filter(pk=subscription.pk).update(
+            failures=failures,
+            last_error=str(error),
+            next_attempt_at=now + timedelta(seconds=backoff(failures)),
+        )
+        return 0
+
+    Subscription.objects.filter(pk=subscription.pk).update(
+        cursor=cursor, failures=0, last_error='', next_attempt_at=now
+    )
+    return len(changes)
+
+
+def _deliver_in_thread(subscription, batch_size, timeout):
+    try:
+        return deliver(subscription, batch_size, timeout)
+    finally:
+        close_old_connections()
+
+
+def deliver_due(batch_size=100, concurrency=8, timeout=10):
+    """
+    Deliver one batch to every due subscription, at most `concurrency`
+    requests at a time. Returns the number of changes delivered.
+
+    Changes left unnumbered by a process that died after committing them
+    are numbered first.
+    """
+    stamp_changes()
+    subscriptions = claim_due_subscriptions(limit=concurrency * 4)
+    if concurrency == 1:
+        return sum(
+            deliver(subscription, batch_size, timeout)
+            for subscription in subscriptions
+        )
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return sum(
+            executor.map(
+                lambda subscription: _deliver_in_thread(
+                    subscription, batch_size, timeout
+                ),
+                subscriptions,
+            )
+        )
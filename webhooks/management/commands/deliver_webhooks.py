@@ -0,0 +1,57 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from webhooks.delivery import deliver_due
+
+
+class Command(BaseCommand):
+    help = (
+        'Push catalog changes to webhook subscribers, one batch per '
+        'subscriber and request, retrying failed endpoints with backoff.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=100,
+            help='Changes sent per request.',
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=8,
+            help='Requests in flight at a time.',
+        )
+        parser.add_argument(
+            '--timeout',
+            type=float,
+            default=10,
+            help='Seconds to wait for a subscriber to respond.',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=1,
+            help='Seconds to sleep when there is nothing to deliver.',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Run a single pass and exit.',
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            delivered = deliver_due(
+                options['batch_size'],
+                options['concurrency'],
+                options['timeout'],
+            )
+            if options['once']:
+                break
+            if not delivered:
+                time.sleep(options['interval'])
+
+        self.stdout.write(self.style.SUCCESS(f'{delivered} changes delivered'))
@@ -0,0 +1,60 @@
+# Generated by Django 4.1.13 on 2026-10-19 17:15
+
+import django.utils.timezone
+from django.db import migrations, models
+
+import utils.uuids
+import webhooks.models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name='Subscription',
+            fields=[
+                (
+                    'id',
+                    models.UUIDField(
+                        default=utils.uuids.generate_uuid,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ('url', models.URLField()),
+                (
+                    'secret',
+                    models.CharField(
+                        default=webhooks.models.generate_secret, max_length=64
+                    ),
+                ),
+                ('model_labels', models.JSONField(blank=True, default=list)),
+                ('active', models.BooleanField(default=True)),
+                (
+                    'cursor',
+                    models.PositiveBigIntegerField(
+                        default=webhooks.models.current_cursor
+                    ),
+                ),
+                ('failures', models.PositiveIntegerField(default=0)),
+                (
+                    'next_attempt_at',
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                ('last_error', models.TextField(blank=True)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='subscription',
+            index=models.Index(
+                condition=models.Q(('active', True)),
+                fields=['next_attempt_at'],
+                name='webhooks_due_subscriptions',
+            ),
+        ),
+    ]
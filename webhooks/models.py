@@ -0,0 +1,52 @@
+import secrets
+
+from django.db import models
+from django.db.models import Max
+from django.utils import timezone
+
+from changes.models import Change
+from utils.uuids import generate_uuid
+
+
+def generate_secret():
+    return secrets.token_hex(32)
+
+
+def current_cursor():
+    # New subscribers start from the next change.
+    return Change.objects.aggregate(cursor=Max('sequence'))['cursor'] or 0
+
+
+class Subscription(models.Model):
+    """
+    A partner endpoint receiving catalog changes.
+
+    The change log is the outbox: `cursor` is the id of the last change
+    delivered, so events are sent in order and none are stored twice.
+    """
+
+    id = models.UUIDField(
+        primary_key=True, default=generate_uuid, editable=False
+    )
+    url = models.URLField()
+    secret = models.CharField(max_length=64, default=generate_secret)
+    # Model labels (e.g. 'books.book') to send; empty for all of them.
+    model_labels = models.JSONField(default=list, blank=True)
+    active = models.BooleanField(default=True)
+
+    cursor = models.PositiveBigIntegerField(default=current_cursor)
+    failures = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['next_attempt_at'],
+                condition=models.Q(active=True),
+                name='webhooks_due_subscriptions',
+            ),
+        ]
+
+    def __str__(self):
+        return self.url